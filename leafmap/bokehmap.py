@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import xyzservices.providers as xyz
 from bokeh.io import output_notebook
-from bokeh.models import GeoJSONDataSource, HoverTool, WheelZoomTool, WMTSTileSource
+from bokeh.models import HoverTool, WheelZoomTool, WMTSTileSource
 from bokeh.plotting import figure, save, show
 from box import Box
 
@@ -341,16 +341,16 @@ class Map:
         if tooltips is None:
             tooltips = [(col, f"@{col}") for col in columns]
 
-        source = GeoJSONDataSource(geojson=gdf_new.to_json())
+        source = common.gdf_to_bokeh(gdf_new, mercator=False)
 
         if geom_type in ["Point", "MultiPoint"]:
             self.figure.circle(x="x", y="y", source=source, **kwargs)
         elif geom_type in ["LineString", "MultiLineString"]:
-            self.figure.multi_line(xs="xs", ys="ys", source=source, **kwargs)
+            self.figure.multi_line(xs="x", ys="y", source=source, **kwargs)
         elif geom_type in ["Polygon", "MultiPolygon"]:
             if "fill_alpha" not in kwargs:
                 kwargs["fill_alpha"] = 0.5
-            self.figure.patches(xs="xs", ys="ys", source=source, **kwargs)
+            self.figure.patches(xs="x", ys="y", source=source, **kwargs)
 
         if len(tooltips) > 0:
             hover = HoverTool(tooltips=tooltips)
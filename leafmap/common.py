@@ -1,17 +1,30 @@
 """This module contains some common functions for both folium and ipyleaflet."""
 
 import csv
+import functools
 import json
 import os
 import shutil
 import subprocess
 import sys
 import tarfile
+import threading
 import urllib.request
 import warnings
+import weakref
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Iterator,
+)
 
 import folium
 import ipyleaflet
@@ -22,6 +35,8 @@ import requests
 import whitebox
 import xyzservices
 
+from . import httpcache
+from .httpcache import clear_http_cache, disable_http_cache, enable_http_cache
 from .stac import *
 
 try:
@@ -1588,7 +1603,7 @@ def csv_to_df(in_csv, **kwargs: Any) -> pd.DataFrame:
     import pandas as pd
 
     try:
-        return pd.read_csv(in_csv, **kwargs)
+        return pd.read_csv(httpcache.cached_path(in_csv), **kwargs)
     except Exception as e:
         raise Exception(e)
 
@@ -1702,11 +1717,13 @@ def vector_to_geojson(
     check_package(name="geopandas", URL="https://geopandas.org")
     import geopandas as gpd
 
+    ext = os.path.splitext(filename)[1].lower()
+    if filename.startswith("http"):
+        filename = httpcache.cached_path(filename)
     if not filename.startswith("http"):
         filename = os.path.abspath(filename)
         if filename.endswith(".zip"):
             filename = "zip://" + filename
-    ext = os.path.splitext(filename)[1].lower()
     if ext == ".kml":
         try:
             import fiona
@@ -1774,17 +1791,143 @@ def screen_capture(outfile: str, monitor: int = 1) -> Optional[str]:
         raise Exception(e)
 
 
+def _iter_geojson_chunks(gdf, precision=None, columns=None, chunk_size=10000):
+    """Yields a GeoDataFrame as GeoJSON FeatureCollection text in chunks.
+
+    Geometries are encoded by GEOS through shapely.to_geojson and attributes
+    by the pandas JSON encoder, so no per-feature Python dicts are built.
+
+    Args:
+        gdf (GeoDataFrame): A GeoPandas GeoDataFrame.
+        precision (int, optional): Number of decimal places to round the
+            coordinates to. Defaults to None (full precision).
+        columns (list, optional): Attribute columns to keep. Defaults to None
+            (all columns).
+        chunk_size (int, optional): Number of features encoded per chunk.
+            Defaults to 10000.
+
+    Yields:
+        str: Consecutive pieces of the GeoJSON text.
+    """
+    import shapely
+
+    geom_name = gdf.geometry.name
+    if columns is None:
+        columns = [col for col in gdf.columns if col != geom_name]
+    else:
+        missing = [col for col in columns if col not in gdf.columns]
+        if missing:
+            raise ValueError(f"Columns not found in the GeoDataFrame: {missing}")
+        columns = [col for col in columns if col != geom_name]
+
+    def round_coords(coords):
+        return np.round(coords, precision)
+
+    yield '{"type":"FeatureCollection","features":['
+    for start in range(0, len(gdf), chunk_size):
+        chunk = gdf.iloc[start : start + chunk_size]
+        geoms = np.asarray(chunk.geometry.values, dtype=object)
+        if precision is not None:
+            has_z = shapely.has_z(geoms)
+            geoms = geoms.copy()
+            if has_z.any():
+                geoms[has_z] = shapely.transform(
+                    geoms[has_z], round_coords, include_z=True
+                )
+            geoms[~has_z] = shapely.transform(geoms[~has_z], round_coords)
+        geometries = [
+            "null" if text is None else text for text in shapely.to_geojson(geoms)
+        ]
+
+        if columns:
+            properties = (
+                pd.DataFrame(chunk[columns])
+                .to_json(
+                    orient="records",
+                    lines=True,
+                    date_format="iso",
+                    double_precision=15,
+                    default_handler=str,
+                )
+                .splitlines()
+            )
+        else:
+            properties = ["{}"] * len(chunk)
+        ids = [json.dumps(str(index)) for index in chunk.index]
+
+        features = ",".join(
+            f'{{"id":{fid},"type":"Feature","properties":{props},"geometry":{geom}}}'
+            for fid, props, geom in zip(ids, properties, geometries)
+        )
+        yield features if start == 0 else "," + features
+    yield "]}"
+
+
+def _gdf_to_epsg(gdf, epsg=None):
+    """Reprojects a GeoDataFrame to an EPSG code unless it is already in it."""
+    if epsg is None or gdf.crs is None:
+        return gdf
+    epsg = int(str(epsg).upper().replace("EPSG:", ""))
+    if gdf.crs.to_epsg() != epsg:
+        gdf = gdf.to_crs(epsg=epsg)
+    return gdf
+
+
+def _geojson_loads(text):
+    """Parses JSON text, using orjson when it is installed."""
+    try:
+        import orjson
+
+        return orjson.loads(text)
+    except ImportError:
+        return json.loads(text)
+
+
+def gdf_to_geojson_str(gdf, epsg=None, precision=None, columns=None) -> str:
+    """Serializes a GeoDataFrame to a GeoJSON FeatureCollection string.
+
+    This is the serializer shared by the map backends. It is considerably
+    faster than building ``gdf.__geo_interface__`` for large layers.
+
+    Args:
+        gdf (GeoDataFrame): A GeoPandas GeoDataFrame.
+        epsg (str | int, optional): An EPSG code to reproject to, e.g., "4326".
+            Defaults to None.
+        precision (int, optional): Number of decimal places to round the
+            coordinates to. Defaults to None (full precision).
+        columns (list, optional): Attribute columns to keep. Defaults to None
+            (all columns).
+
+    Returns:
+        str: The GeoJSON text.
+    """
+    gdf = _gdf_to_epsg(gdf, epsg)
+    return "".join(_iter_geojson_chunks(gdf, precision=precision, columns=columns))
+
+
 def gdf_to_geojson(
-    gdf, out_geojson=None, epsg=None, tuple_to_list=False, encoding="utf-8"
+    gdf,
+    out_geojson=None,
+    epsg=None,
+    tuple_to_list=False,
+    encoding="utf-8",
+    precision=None,
+    columns=None,
 ) -> Optional[dict]:
     """Converts a GeoDataFame to GeoJSON.
 
     Args:
         gdf (GeoDataFrame): A GeoPandas GeoDataFrame.
-        out_geojson (str, optional): File path to he output GeoJSON. Defaults to None.
+        out_geojson (str | file-like, optional): File path to the output GeoJSON,
+            or a writable text buffer the GeoJSON is streamed into. Defaults to None.
         epsg (str, optional): An EPSG string, e.g., "4326". Defaults to None.
-        tuple_to_list (bool, optional): Whether to convert tuples to lists. Defaults to False.
+        tuple_to_list (bool, optional): Kept for backward compatibility.
+            Coordinates are always returned as lists. Defaults to False.
         encoding (str, optional): The encoding to use for the GeoJSON. Defaults to "utf-8".
+        precision (int, optional): Number of decimal places to round the
+            coordinates to. Defaults to None (full precision).
+        columns (list, optional): Attribute columns to keep. Defaults to None
+            (all columns).
 
     Raises:
         TypeError: When the output file extension is incorrect.
@@ -1795,34 +1938,28 @@ def gdf_to_geojson(
     """
     check_package(name="geopandas", URL="https://geopandas.org")
 
-    def listit(t):
-        return list(map(listit, t)) if isinstance(t, (list, tuple)) else t
-
     try:
-        if epsg is not None:
-            if gdf.crs is not None and gdf.crs.to_epsg() != epsg:
-                gdf = gdf.to_crs(epsg=epsg)
-        geojson = gdf.__geo_interface__
-
-        if tuple_to_list:
-            for feature in geojson["features"]:
-                feature["geometry"]["coordinates"] = listit(
-                    feature["geometry"]["coordinates"]
-                )
+        gdf = _gdf_to_epsg(gdf, epsg)
+        chunks = _iter_geojson_chunks(gdf, precision=precision, columns=columns)
 
         if out_geojson is None:
-            return geojson
+            return _geojson_loads("".join(chunks))
+        elif hasattr(out_geojson, "write"):
+            for chunk in chunks:
+                out_geojson.write(chunk)
         else:
             ext = os.path.splitext(out_geojson)[1]
             if ext.lower() not in [".json", ".geojson"]:
                 raise TypeError(
                     "The output file extension must be either .json or .geojson"
                 )
-            out_dir = os.path.dirname(out_geojson)
+            out_dir = os.path.dirname(os.path.abspath(out_geojson))
             if not os.path.exists(out_dir):
                 os.makedirs(out_dir)
 
-            gdf.to_file(out_geojson, driver="GeoJSON", encoding=encoding)
+            with open(out_geojson, "w", encoding=encoding) as f:
+                for chunk in chunks:
+                    f.write(chunk)
     except Exception as e:
         raise Exception(e)
 
@@ -2764,12 +2901,29 @@ def get_wms_layers(url):
     Returns:
         A list of WMS layers.
     """
+    import urllib.parse
+
     try:
         from owslib.wms import WebMapService
     except ImportError:
         raise ImportError("Please install owslib using 'pip install owslib'.")
 
-    wms = WebMapService(url)
+    # Fetch the capabilities document through the shared session (and the HTTP
+    # cache when enabled) instead of letting owslib download it on every call.
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+    present = {key.lower() for key in query}
+    params = {
+        key: value
+        for key, value in {
+            "service": "WMS",
+            "request": "GetCapabilities",
+            "version": "1.1.1",
+        }.items()
+        if key not in present
+    }
+    response = httpcache.get(url, params=params)
+    response.raise_for_status()
+    wms = WebMapService(url, xml=response.content)
     layers = list(wms.contents)
     layers.sort()
     return layers
@@ -2876,15 +3030,15 @@ def wms_to_geotiff(
     # Transform bbox if bbox_crs differs from output_crs
     if bbox_crs.upper() != output_crs.upper():
         try:
-            from pyproj import Transformer
+            import pyproj  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Please install pyproj using 'pip install pyproj' for CRS transformation."
             )
 
-        transformer = Transformer.from_crs(bbox_crs, output_crs, always_xy=True)
-        minx, miny = transformer.transform(minx, miny)
-        maxx, maxy = transformer.transform(maxx, maxy)
+        (minx, maxx), (miny, maxy) = transform_coords(
+            [minx, maxx], [miny, maxy], bbox_crs, output_crs
+        )
 
         if not quiet:
             print(
@@ -3077,14 +3231,15 @@ def read_file_from_url(url, return_type="list", encoding="utf-8"):
     Returns:
         The contents of the file as a list or string depending on return_type.
     """
-    from urllib.request import urlopen
+    if return_type not in ["list", "string"]:
+        raise ValueError("The return type must be either list or string.")
 
+    response = httpcache.get(url)
+    response.raise_for_status()
+    text = response.content.decode(encoding)
     if return_type == "list":
-        return [line.decode(encoding).rstrip() for line in urlopen(url).readlines()]
-    elif return_type == "string":
-        return urlopen(url).read().decode(encoding)
-    else:
-        raise ValueError("The return type must be either list or string.")
+        return [line.rstrip() for line in text.splitlines()]
+    return text
 
 
 def st_download_button(
@@ -3985,9 +4140,11 @@ def geojson_to_gdf(in_geojson, encoding="utf-8", **kwargs: Any):
             in_geojson = out_file
     elif isinstance(in_geojson, str) and in_geojson.startswith("http"):
         try:
-            return gpd.read_file(in_geojson, encoding=encoding, **kwargs)
+            return gpd.read_file(
+                httpcache.cached_path(in_geojson), encoding=encoding, **kwargs
+            )
         except Exception:
-            response = requests.get(in_geojson, timeout=30)
+            response = httpcache.get(in_geojson, timeout=30)
             response.raise_for_status()
             data = response.json()
             if isinstance(data, dict) and data.get("type") == "Feature":
@@ -4958,22 +5115,145 @@ def mosaic_info_geojson(url, titiler_endpoint=None, **kwargs: Any):
     return r
 
 
+def _lidar_chunks(
+    filename: str,
+    chunk_size: int = 1_000_000,
+    bbox: Optional[List[float]] = None,
+    classification: Optional[Union[int, List[int]]] = None,
+    max_points: Optional[int] = None,
+    voxel_size: Optional[float] = None,
+    seed: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Stream the points of a LAS/LAZ file chunk by chunk, filtering them on the fly.
+
+    Args:
+        filename (str): The path to the LAS/LAZ file.
+        chunk_size (int, optional): The number of points read at a time. Defaults to 1,000,000.
+        bbox (list, optional): Keep only the points within [minx, miny, maxx, maxy],
+            in the coordinate system of the file. Defaults to None.
+        classification (int | list, optional): Keep only the points of these
+            classification codes. Defaults to None.
+        max_points (int, optional): Randomly subsample the points that pass the bbox
+            and classification filters to about this number of points. When a filter
+            is set, the file is read twice: once to count the matching points.
+            Defaults to None.
+        voxel_size (float, optional): Keep one point per voxel of this size. Defaults to None.
+        seed (int, optional): The seed of the random subsampling. Defaults to 0.
+        **kwargs: Additional keyword arguments to pass to laspy.open().
+
+    Yields:
+        laspy.ScaleAwarePointRecord: The filtered points of each chunk.
+    """
+    import laspy
+    import numpy as np
+
+    if isinstance(classification, int):
+        classification = [classification]
+
+    def filter_mask(points):
+        mask = np.ones(len(points), dtype=bool)
+        if bbox is not None:
+            x = np.asarray(points.x)
+            y = np.asarray(points.y)
+            mask &= (x >= bbox[0]) & (y >= bbox[1]) & (x <= bbox[2]) & (y <= bbox[3])
+        if classification is not None:
+            mask &= np.isin(np.asarray(points.classification), classification)
+        return mask
+
+    rng = np.random.default_rng(seed)
+    # The sorted keys of the voxels kept so far. Its size is bounded by the number
+    # of points returned, not by the number of points read.
+    seen_voxels = np.zeros(0, dtype=np.int64)
+
+    with laspy.open(filename, **kwargs) as reader:
+        header = reader.header
+        probability = 1.0
+        if max_points is not None and header.point_count > max_points:
+            count = header.point_count
+            if bbox is not None or classification is not None:
+                # The rate is derived from the points that pass the filters.
+                with laspy.open(filename, **kwargs) as counter:
+                    count = sum(
+                        int(np.count_nonzero(filter_mask(points)))
+                        for points in counter.chunk_iterator(chunk_size)
+                    )
+            if count > max_points:
+                probability = max_points / count
+        if voxel_size is not None:
+            # Voxel indices are counted from the minimum of the file and packed
+            # into one int64 key per point.
+            origin = np.asarray(header.mins, dtype=float)
+            dims = (
+                np.floor((np.asarray(header.maxs) - origin) / voxel_size).astype(
+                    np.int64
+                )
+                + 1
+            )
+            if np.prod(dims.astype(float)) >= 2**63:
+                raise ValueError("voxel_size is too small for the extent of the file.")
+
+        for points in reader.chunk_iterator(chunk_size):
+            mask = filter_mask(points)
+            if probability < 1.0:
+                mask &= rng.random(len(points)) < probability
+            if voxel_size is not None:
+                index = np.flatnonzero(mask)
+                xyz = np.stack(
+                    [
+                        np.asarray(points.x)[index],
+                        np.asarray(points.y)[index],
+                        np.asarray(points.z)[index],
+                    ]
+                )
+                voxels = np.floor((xyz - origin[:, None]) / voxel_size).astype(np.int64)
+                voxels = np.clip(voxels, 0, dims[:, None] - 1)
+                keys = np.ravel_multi_index(tuple(voxels), tuple(dims))
+                keys, first = np.unique(keys, return_index=True)
+                position = np.searchsorted(seen_voxels, keys)
+                found = np.zeros(len(keys), dtype=bool)
+                inside = position < len(seen_voxels)
+                found[inside] = seen_voxels[position[inside]] == keys[inside]
+                seen_voxels = np.insert(seen_voxels, position[~found], keys[~found])
+                mask = np.zeros(len(points), dtype=bool)
+                mask[index[first[~found]]] = True
+
+            if mask.all():
+                yield points
+            elif mask.any():
+                yield points[mask]
+
+
 def view_lidar(
     filename,
     cmap="terrain",
     backend="pyvista",
     background=None,
     eye_dome_lighting=False,
+    max_points=None,
+    bbox=None,
+    classification=None,
+    voxel_size=None,
     **kwargs: Any,
 ):
     """View LiDAR data in 3D.
 
+    When any of max_points, bbox, classification, or voxel_size is set, the file is
+    read chunk by chunk and only the selected points are loaded, so that files with
+    hundreds of millions of points can be previewed.
+
     Args:
         filename (str): The filepath to the LiDAR data.
         cmap (str, optional): The colormap to use. Defaults to "terrain". cmap currently does not work for the open3d backend.
         backend (str, optional): The plotting backend to use, can be pyvista, ipygany, panel, and open3d. Defaults to "pyvista".
         background (str, optional): The background color to use. Defaults to None.
         eye_dome_lighting (bool, optional): Whether to use eye dome lighting. Defaults to False.
+        max_points (int, optional): The point budget of the view. The points are randomly
+            subsampled to about this number. Defaults to None.
+        bbox (list, optional): Only view the points within [minx, miny, maxx, maxy]. Defaults to None.
+        classification (int | list, optional): Only view the points of these classification codes.
+            Defaults to None.
+        voxel_size (float, optional): Only view one point per voxel of this size. Defaults to None.
 
     Raises:
         FileNotFoundError: If the file does not exist.
@@ -4994,6 +5274,10 @@ def view_lidar(
     if not os.path.exists(filename):
         raise FileNotFoundError(f"{filename} does not exist.")
 
+    subset = any(
+        arg is not None for arg in [max_points, bbox, classification, voxel_size]
+    )
+
     backend = backend.lower()
     if backend in ["pyvista", "ipygany", "panel"]:
         try:
@@ -5009,8 +5293,20 @@ def view_lidar(
                 backend = None
             if backend == "ipygany":
                 cmap = None
-            data = pyntcloud.PyntCloud.from_file(filename)
-            mesh = data.to_instance("pyvista", mesh=False)
+            if subset:
+                import pyvista
+
+                las = read_lidar(
+                    filename,
+                    max_points=max_points,
+                    bbox=bbox,
+                    classification=classification,
+                    voxel_size=voxel_size,
+                )
+                mesh = pyvista.PolyData(las.xyz)
+            else:
+                data = pyntcloud.PyntCloud.from_file(filename)
+                mesh = data.to_instance("pyvista", mesh=False)
             mesh = mesh.elevation()
             mesh.plot(
                 scalars="Elevation",
@@ -5038,7 +5334,16 @@ def view_lidar(
             return
 
         try:
-            las = laspy.read(filename)
+            if subset:
+                las = read_lidar(
+                    filename,
+                    max_points=max_points,
+                    bbox=bbox,
+                    classification=classification,
+                    voxel_size=voxel_size,
+                )
+            else:
+                las = laspy.read(filename)
             point_data = np.stack([las.X, las.Y, las.Z], axis=0).transpose((1, 0))
             geom = o3d.geometry.PointCloud()
             geom.points = o3d.utility.Vector3dVector(point_data)
@@ -5054,11 +5359,33 @@ def view_lidar(
         raise ValueError(f"{backend} is not a valid backend.")
 
 
-def read_lidar(filename, **kwargs: Any):
+def read_lidar(
+    filename,
+    chunk_size=1_000_000,
+    bbox=None,
+    classification=None,
+    max_points=None,
+    voxel_size=None,
+    **kwargs: Any,
+):
     """Read a LAS file.
 
+    When any of bbox, classification, max_points, or voxel_size is set, the file is
+    read chunk by chunk and the points are filtered while reading, so that only the
+    selected points are kept in memory.
+
     Args:
         filename (str): A local file path or HTTP URL to a LAS file.
+        chunk_size (int, optional): The number of points read at a time when filtering.
+            Defaults to 1,000,000.
+        bbox (list, optional): Keep only the points within [minx, miny, maxx, maxy],
+            in the coordinate system of the file. Defaults to None.
+        classification (int | list, optional): Keep only the points of these
+            classification codes. Defaults to None.
+        max_points (int, optional): Randomly subsample the points that pass the bbox
+            and classification filters to about this number of points. Defaults to None.
+        voxel_size (float, optional): Keep one point per voxel of this size. Defaults to None.
+        **kwargs: Additional keyword arguments to pass to laspy.read().
 
     Returns:
         The LasData object returned by laspy.read.
@@ -5079,11 +5406,46 @@ def read_lidar(filename, **kwargs: Any):
         filename = github_raw_url(filename)
         filename = download_file(filename)
 
-    return laspy.read(filename, **kwargs)
+    if all(arg is None for arg in [bbox, classification, max_points, voxel_size]):
+        return laspy.read(filename, **kwargs)
+
+    import numpy as np
+
+    with laspy.open(filename, **kwargs) as reader:
+        header = reader.header
+
+    chunks = [
+        points.array
+        for points in _lidar_chunks(
+            filename,
+            chunk_size,
+            bbox,
+            classification,
+            max_points,
+            voxel_size,
+            **kwargs,
+        )
+    ]
+    if chunks:
+        array = np.concatenate(chunks)
+    else:
+        array = np.zeros(0, dtype=header.point_format.dtype())
+
+    points = laspy.ScaleAwarePointRecord(
+        array, header.point_format, header.scales, header.offsets
+    )
+    las = laspy.LasData(header=header, points=points)
+    las.update_header()
+    return las
 
 
 def convert_lidar(
-    source, destination=None, point_format_id=None, file_version=None, **kwargs
+    source,
+    destination=None,
+    point_format_id=None,
+    file_version=None,
+    chunk_size=None,
+    **kwargs,
 ) -> Any:
     """Converts a Las from one point format to another Automatically upgrades the file version if source file version
         is not compatible with the new point_format_id
@@ -5094,6 +5456,8 @@ def convert_lidar(
         point_format_id (int, optional): The new point format id (the default is None, which won't change the source format id).
         file_version (str, optional): The new file version. None by default which means that the file_version may be upgraded
             for compatibility with the new point_format. The file version will not be downgraded.
+        chunk_size (int, optional): If set and both source and destination are file paths, the points are
+            converted and written chunk by chunk of this many points. Defaults to None.
 
     Returns:
         The converted LasData object.
@@ -5106,6 +5470,36 @@ def convert_lidar(
         )
         return
 
+    if chunk_size is not None and isinstance(source, str) and destination is not None:
+        import copy
+
+        from laspy.point import dims
+
+        destination = check_file_path(destination)
+        with laspy.open(source) as reader:
+            if point_format_id is None:
+                point_format_id = reader.header.point_format.id
+            if file_version is None:
+                file_version = max(
+                    str(reader.header.version),
+                    dims.preferred_file_version_for_point_format(point_format_id),
+                )
+            point_format = laspy.PointFormat(point_format_id)
+            point_format.dimensions.extend(reader.header.point_format.extra_dimensions)
+            header = copy.deepcopy(reader.header)
+            header.set_version_and_point_format(
+                laspy.header.Version.from_str(str(file_version)), point_format
+            )
+
+            with laspy.open(destination, mode="w", header=header, **kwargs) as writer:
+                for points in reader.chunk_iterator(chunk_size):
+                    writer.write_points(
+                        laspy.PackedPointRecord.from_point_record(
+                            points, header.point_format
+                        )
+                    )
+        return destination
+
     if isinstance(source, str):
         source = read_lidar(source)
 
@@ -5121,7 +5515,9 @@ def convert_lidar(
         return destination
 
 
-def write_lidar(source, destination, do_compress=None, laz_backend=None):
+def write_lidar(
+    source, destination, do_compress=None, laz_backend=None, chunk_size=None
+):
     """Writes to a stream or file.
 
     Args:
@@ -5129,6 +5525,8 @@ def write_lidar(source, destination, do_compress=None, laz_backend=None):
         destination (str): The destination filepath.
         do_compress (bool, optional): Flags to indicate if you want to compress the data. Defaults to None.
         laz_backend (str, optional): The laz backend to use. Defaults to None.
+        chunk_size (int, optional): If set and source is a file path, the points are copied
+            chunk by chunk of this many points instead of reading the whole file. Defaults to None.
     """
 
     try:
@@ -5139,6 +5537,19 @@ def write_lidar(source, destination, do_compress=None, laz_backend=None):
         )
         return
 
+    if chunk_size is not None and isinstance(source, str):
+        with laspy.open(source) as reader:
+            with laspy.open(
+                destination,
+                mode="w",
+                header=reader.header,
+                do_compress=do_compress,
+                laz_backend=laz_backend,
+            ) as writer:
+                for points in reader.chunk_iterator(chunk_size):
+                    writer.write_points(points)
+        return
+
     if isinstance(source, str):
         source = read_lidar(source)
 
@@ -5373,85 +5784,155 @@ def download_folder(
     return files
 
 
-def clip_image(image, mask, output, to_cog=True):
+def _clip_mask_shapes(mask, crs=None, output=None) -> List[Any]:
+    """Convert a clip_image mask to a list of geometries in the raster CRS.
+
+    Args:
+        mask (str | list | dict | GeoDataFrame): A path or URL to a vector dataset, a list of
+            coordinates, a GeoJSON dict (geometry, Feature or FeatureCollection), or a GeoDataFrame.
+        crs (optional): The CRS of the raster. Vector datasets with another CRS are reprojected.
+            Defaults to None.
+        output (str, optional): The path a remote mask is downloaded to. Defaults to None.
+
+    Returns:
+        list: The geometries to pass to rasterio.mask.mask().
+    """
+    import geopandas as gpd
+
+    if isinstance(mask, str):
+        if mask.startswith("http"):
+            mask = download_file(mask, output)
+        if not os.path.exists(mask):
+            raise FileNotFoundError(f"{mask} does not exist.")
+        mask = gpd.read_file(mask)
+
+    if isinstance(mask, gpd.GeoDataFrame):
+        if crs is not None and mask.crs is not None and mask.crs != crs:
+            mask = mask.to_crs(crs)
+        return list(mask.geometry)
+    elif isinstance(mask, list):
+        return [{"type": "Polygon", "coordinates": [mask]}]
+    elif isinstance(mask, dict):
+        if mask.get("type") == "FeatureCollection":
+            return [feature["geometry"] for feature in mask["features"]]
+        elif mask.get("type") == "Feature":
+            return [mask["geometry"]]
+        return [mask]
+    else:
+        raise ValueError(
+            "mask must be a file path, a list of coordinates, a GeoJSON dict or a GeoDataFrame."
+        )
+
+
+def clip_image(image, mask, output, to_cog=True, num_workers=None):
     """Clip an image by mask.
 
+    Only the window covering the mask is read from the image, so clipping small areas
+    from large or remote (HTTP) Cloud Optimized GeoTIFFs reads a few blocks only.
+    Several masks can be clipped from the same image at once by passing lists of
+    masks and outputs.
+
     Args:
-        image (str): Path to the image file in GeoTIFF format.
+        image (str): Path or URL to the image file in GeoTIFF format.
         mask (str | list | dict): The mask used to extract the image. It can be a path to vector datasets (e.g., GeoJSON, Shapefile), a list of coordinates, or m.user_roi.
-        output (str): Path to the output file.
+            If output is a list, a list of such masks.
+        output (str | list): Path to the output file, or a list of paths, one per mask.
         to_cog (bool, optional): Flags to indicate if you want to convert the output to COG. Defaults to True.
+        num_workers (int, optional): The number of threads clipping the masks. Defaults to None,
+            which uses the number of CPUs.
 
     Raises:
-        ImportError: If the fiona or rasterio package is not installed.
+        ImportError: If the rasterio package is not installed.
         FileNotFoundError: If the image is not found.
         ValueError: If the mask is not a valid GeoJSON or raster file.
         FileNotFoundError: If the mask file is not found.
     """
     try:
-        import json
-
-        import fiona
         import rasterio
         import rasterio.mask
     except ImportError as e:
         raise ImportError(e)
 
-    if not os.path.exists(image):
+    if not image.startswith("http") and not os.path.exists(image):
         raise FileNotFoundError(f"{image} does not exist.")
 
-    if not output.endswith(".tif"):
-        raise ValueError("Output must be a tif file.")
+    if isinstance(output, (list, tuple)):
+        if not isinstance(mask, (list, tuple)) or len(mask) != len(output):
+            raise ValueError(
+                "When output is a list, mask must be a list of the same length."
+            )
+        tasks = list(zip(mask, output))
+    else:
+        tasks = [(mask, output)]
 
-    output = check_file_path(output)
+    for _, item_output in tasks:
+        if not item_output.endswith(".tif"):
+            raise ValueError("Output must be a tif file.")
 
-    if isinstance(mask, str):
-        if mask.startswith("http"):
-            mask = download_file(mask, output)
-        if not os.path.exists(mask):
-            raise FileNotFoundError(f"{mask} does not exist.")
-    elif isinstance(mask, list) or isinstance(mask, dict):
-        if isinstance(mask, list):
-            geojson = {
-                "type": "FeatureCollection",
-                "features": [
-                    {
-                        "type": "Feature",
-                        "properties": {},
-                        "geometry": {"type": "Polygon", "coordinates": [mask]},
-                    }
-                ],
-            }
-        else:
-            geojson = {
-                "type": "FeatureCollection",
-                "features": [mask],
-            }
-        mask = temp_file_path(".geojson")
-        with open(mask, "w") as f:
-            json.dump(geojson, f)
+    pool = _DatasetPool()
 
-    with fiona.open(mask, "r") as shapefile:
-        shapes = [feature["geometry"] for feature in shapefile]
+    def clip(task):
+        item_mask, item_output = task
+        item_output = check_file_path(item_output)
+        src = pool.get(image)
+        shapes = _clip_mask_shapes(item_mask, src.crs, item_output)
 
-    with rasterio.open(image) as src:
+        # With crop=True, only the window covering the shapes is read.
         out_image, out_transform = rasterio.mask.mask(src, shapes, crop=True)
-        out_meta = src.meta
+        out_meta = src.meta.copy()
+        out_meta.update(
+            {
+                "driver": "GTiff",
+                "height": out_image.shape[1],
+                "width": out_image.shape[2],
+                "transform": out_transform,
+            }
+        )
 
-    out_meta.update(
-        {
-            "driver": "GTiff",
-            "height": out_image.shape[1],
-            "width": out_image.shape[2],
-            "transform": out_transform,
-        }
-    )
+        with rasterio.open(item_output, "w", **out_meta) as dest:
+            dest.write(out_image)
 
-    with rasterio.open(output, "w", **out_meta) as dest:
-        dest.write(out_image)
+        if to_cog:
+            image_to_cog(item_output, item_output)
 
-    if to_cog:
-        image_to_cog(output, output)
+    try:
+        _run_parallel(tasks, clip, num_workers)
+    finally:
+        pool.close()
+
+
+def _clip_geometry_to_gdf(geometry, geom_crs=None) -> "gpd.GeoDataFrame":
+    """Convert a clip_raster geometry to a GeoDataFrame.
+
+    Args:
+        geometry (str | geopandas.GeoDataFrame | dict | list): A path to a vector dataset, a
+            GeoDataFrame, a GeoJSON Feature or FeatureCollection, or a bounding box.
+        geom_crs (str, optional): The CRS to assign to the geometry. Defaults to None.
+
+    Returns:
+        gpd.GeoDataFrame: The geometry as a GeoDataFrame.
+    """
+    import geopandas as gpd
+
+    if isinstance(geometry, str):
+        gdf = gpd.read_file(geometry)
+    elif isinstance(geometry, gpd.GeoDataFrame):
+        gdf = geometry
+    elif isinstance(geometry, dict) and geometry.get("type") == "FeatureCollection":
+        gdf = gpd.GeoDataFrame.from_features(geometry)
+    elif isinstance(geometry, dict) and geometry.get("type") == "Feature":
+        gdf = gpd.GeoDataFrame.from_features([geometry])
+    elif isinstance(geometry, list) and len(geometry) == 4:
+        gdf = bbox_to_gdf(geometry)
+    else:
+        raise ValueError(
+            "geometry must be a string, geopandas.GeoDataFrame, dict, or list of 4 numbers"
+        )
+
+    if geom_crs is not None:
+        gdf.set_crs(geom_crs, inplace=True)
+
+    return gdf
 
 
 def clip_raster(
@@ -5466,15 +5947,20 @@ def clip_raster(
     match_raster=None,
     output=None,
     verbose=True,
+    num_workers=None,
     **kwargs: Any,
 ):
     """Clip a raster by a geometry.
 
+    The raster is opened lazily and cut to the bounding box of the geometry before it is
+    reprojected or clipped, so only the blocks around the geometry are read.
+
     Args:
         image (str): Path to the image file in GeoTIFF format.
         geometry (str | geopandas.GeoDataFrame | dict | list): The geometry to clip the raster by.
             It can be a path to vector datasets (e.g., GeoJSON, Shapefile), a geopandas.GeoDataFrame,
             a dictionary, or a list of 4 numbers (minx, miny, maxx, maxy) representing a bounding box.
+            It can also be a list of such geometries, which are clipped separately.
         geom_crs (str, optional): The coordinate reference system of the geometry. Defaults to None.
         dst_crs (str, optional): The coordinate reference system of the output raster. Defaults to None.
         resolution (int, optional): The resolution of the output raster. Defaults to None.
@@ -5485,10 +5971,15 @@ def clip_raster(
         compress (str, optional): The compression of the output raster. Defaults to "DEFLATE".
         bands (list, optional): The indices of the bands to clip. Defaults to None. Start from 1.
         match_raster (str, optional): Path to the raster to match the resolution and CRS of the output raster. Defaults to None.
-        output (str, optional): Path to the output raster file. Defaults to None.
+        output (str | list, optional): Path to the output raster file, or a list of paths when
+            geometry is a list of geometries. Defaults to None.
+        num_workers (int, optional): The number of threads clipping a list of geometries.
+            Defaults to None, which uses the number of CPUs.
         **kwargs: Additional keyword arguments to pass to rasterio.reproject.
+
+    Returns:
+        xarray.DataArray | list: The clipped raster, or a list of them when geometry is a list.
     """
-    import geopandas as gpd
     import rioxarray as rxr
     import xarray as xr
 
@@ -5510,27 +6001,6 @@ def clip_raster(
     if bands is not None:
         xds = xds.sel(band=bands)
 
-    if match_raster is not None:
-        xds = xds.rio.reproject_match(match_raster)
-
-    if isinstance(geometry, str):
-        gdf = gpd.read_file(geometry)
-    elif isinstance(geometry, gpd.GeoDataFrame):
-        gdf = geometry
-    elif isinstance(geometry, dict) and geometry.get("type") == "FeatureCollection":
-        gdf = gpd.GeoDataFrame.from_features(geometry)
-    elif isinstance(geometry, dict) and geometry.get("type") == "Feature":
-        gdf = gpd.GeoDataFrame.from_features([geometry])
-    elif isinstance(geometry, list) and len(geometry) == 4:
-        gdf = bbox_to_gdf(geometry)
-    else:
-        raise ValueError(
-            "geometry must be a string, geopandas.GeoDataFrame, dict, or list of 4 numbers"
-        )
-
-    if geom_crs is not None:
-        gdf.set_crs(geom_crs, inplace=True)
-
     if isinstance(resolution, (int, float)):
         resolution = (resolution, resolution)
     elif isinstance(resolution, tuple) and len(resolution) == 2:
@@ -5541,55 +6011,150 @@ def clip_raster(
     if dst_crs is None:
         dst_crs = xds.rio.crs
 
-    if resolution is not None and dst_crs is not None:
-        if verbose:
-            print(
-                f"Reprojecting the raster to {dst_crs} at {resolution} resolution ..."
+    def clip(geometry, output):
+        gdf = _clip_geometry_to_gdf(geometry, geom_crs)
+        clipped = xds
+
+        if gdf.crs is not None and xds.rio.crs is not None:
+            # Cut the lazily opened raster to the padded bounds of the geometry first,
+            # so that only these blocks are read, reprojected and masked.
+            minx, miny, maxx, maxy = gdf.to_crs(xds.rio.crs).total_bounds
+            pad = 2 * max(abs(value) for value in xds.rio.resolution())
+            clipped = clipped.rio.clip_box(
+                minx - pad, miny - pad, maxx + pad, maxy + pad
             )
-        xds = xds.rio.reproject(dst_crs, resolution=resolution, **kwargs)
-    elif resolution is not None:
+
+        if match_raster is not None:
+            clipped = clipped.rio.reproject_match(match_raster)
+
+        if resolution is not None:
+            if verbose:
+                print(
+                    f"Reprojecting the raster to {dst_crs} at {resolution} resolution ..."
+                )
+            clipped = clipped.rio.reproject(dst_crs, resolution=resolution, **kwargs)
+        elif dst_crs is not None and dst_crs != clipped.rio.crs:
+            if verbose:
+                print(f"Reprojecting the raster to {dst_crs} ...")
+            clipped = clipped.rio.reproject(dst_crs, **kwargs)
+
+        gdf = gdf.to_crs(dst_crs)
+
         if verbose:
-            print(
-                f"Reprojecting the raster to {dst_crs} at {resolution} resolution ..."
-            )
-        xds = xds.rio.reproject(dst_crs, resolution=resolution, **kwargs)
-    elif dst_crs is not None and dst_crs != xds.rio.crs:
+            print(f"Clipping the raster to the geometry ...")
+        clipped = clipped.rio.clip(gdf.geometry, gdf.crs)
+        if output is not None:
+            if verbose:
+                print(f"Saving the raster to {output} ...")
+            clipped.rio.to_raster(output, driver=driver, compress=compress)
         if verbose:
-            print(f"Reprojecting the raster to {dst_crs} ...")
-        xds = xds.rio.reproject(dst_crs, **kwargs)
-    else:
-        pass
+            print(f"The output raster is saved to {output}")
+        return clipped
 
-    gdf = gdf.to_crs(dst_crs)
+    is_bbox = (
+        isinstance(geometry, list)
+        and len(geometry) == 4
+        and all(isinstance(value, (int, float)) for value in geometry)
+    )
+    if not isinstance(geometry, list) or is_bbox:
+        return clip(geometry, output)
 
-    if verbose:
-        print(f"Clipping the raster to the geometry ...")
-    xds = xds.rio.clip(gdf.geometry, gdf.crs)
-    if output is not None:
-        if verbose:
-            print(f"Saving the raster to {output} ...")
-        xds.rio.to_raster(output, driver=driver, compress=compress)
-    if verbose:
-        print(f"The output raster is saved to {output}")
-    return xds
+    if output is None:
+        output = [None] * len(geometry)
+    elif not isinstance(output, (list, tuple)) or len(output) != len(geometry):
+        raise ValueError(
+            "When geometry is a list, output must be a list of the same length."
+        )
 
+    results = [None] * len(geometry)
 
-def netcdf_to_tif(
-    filename,
-    output=None,
-    variables=None,
-    shift_lon=True,
-    lat="lat",
-    lon="lon",
-    lev="lev",
-    level_index=0,
-    time=0,
-    crs="epsg:4326",
-    return_vars=False,
+    def clip_item(index):
+        results[index] = clip(geometry[index], output[index])
+
+    _run_parallel(list(range(len(geometry))), clip_item, num_workers)
+    return results
+
+
+def _open_netcdf(filename: str, chunks: Any = "auto", **kwargs: Any) -> Any:
+    """Open a netCDF file lazily with dask chunks when dask is available.
+
+    Args:
+        filename (str): Path to the netCDF file.
+        chunks (int | dict | str, optional): The dask chunks passed to xarray.open_dataset().
+            Falls back to None (no dask) if dask is not installed. Defaults to "auto".
+        **kwargs: Additional keyword arguments to pass to xarray.open_dataset().
+
+    Returns:
+        xarray.Dataset: The opened dataset.
+    """
+    import xarray as xr
+
+    if chunks is not None:
+        try:
+            import dask  # noqa: F401
+        except ImportError:
+            chunks = None
+
+    return xr.open_dataset(filename, chunks=chunks, **kwargs)
+
+
+def _netcdf_to_raster(xds: Any, output: str, block_size: int = 256) -> None:
+    """Write an xarray object with rioxarray as a tiled GeoTIFF, block by block.
+
+    Dask-backed data are computed and written chunk by chunk in parallel, while
+    in-memory data are written window by window.
+
+    Args:
+        xds (xarray.Dataset | xarray.DataArray): The data to write.
+        output (str): The output GeoTIFF path.
+        block_size (int, optional): The tile size of the GeoTIFF. Defaults to 256.
+    """
+    import threading
+
+    raster_args = {
+        "tiled": True,
+        "blockxsize": block_size,
+        "blockysize": block_size,
+        "compress": "deflate",
+        "BIGTIFF": "IF_SAFER",
+    }
+    # rioxarray's windowed writer expects the spatial dimensions to be named x and y.
+    dims = {xds.rio.x_dim: "x", xds.rio.y_dim: "y"}
+    xds = xds.rename({k: v for k, v in dims.items() if k != v})
+
+    if hasattr(xds, "data_vars"):
+        chunked = any(var.chunks is not None for var in xds.data_vars.values())
+    else:
+        chunked = xds.chunks is not None
+
+    if chunked:
+        raster_args["lock"] = threading.Lock()
+    else:
+        raster_args["windowed"] = True
+    xds.rio.to_raster(output, **raster_args)
+
+
+def netcdf_to_tif(
+    filename,
+    output=None,
+    variables=None,
+    shift_lon=True,
+    lat="lat",
+    lon="lon",
+    lev="lev",
+    level_index=0,
+    time=0,
+    crs="epsg:4326",
+    return_vars=False,
+    chunks="auto",
     **kwargs: Any,
 ):
     """Convert a netcdf file to a GeoTIFF file.
 
+    The file is opened lazily with dask chunks (if dask is installed), so only the
+    selected time/level slice of the selected variables is read, and the output
+    is written as a tiled GeoTIFF chunk by chunk.
+
     Args:
         filename (str): Path to the netcdf file.
         output (str, optional): Path to the output GeoTIFF file. Defaults to None. If None, the output file will be the same as the input file with the extension changed to .tif.
@@ -5602,6 +6167,9 @@ def netcdf_to_tif(
         time (int, optional): Index of the time dimension. Defaults to 0'.
         crs (str, optional): The coordinate reference system. Defaults to 'epsg:4326'.
         return_vars (bool, optional): Flag to return all variables. Defaults to False.
+        chunks (int | dict | str, optional): The dask chunks used to open the file. Set to None
+            to load the data without dask. Defaults to "auto".
+        **kwargs: Additional keyword arguments to pass to xarray.open_dataset().
 
     Raises:
         ImportError: If the xarray or rioxarray package is not installed.
@@ -5629,7 +6197,7 @@ def netcdf_to_tif(
     else:
         output = check_file_path(output)
 
-    xds = xr.open_dataset(filename, **kwargs)
+    xds = _open_netcdf(filename, chunks=chunks, **kwargs)
 
     coords = list(xds.coords.keys())
     if "time" in coords:
@@ -5651,14 +6219,12 @@ def netcdf_to_tif(
     if variables is not None and (not set(variables).issubset(allowed_vars)):
         raise ValueError(f"{variables} must be a subset of {allowed_vars}.")
 
-    if variables is None:
-        xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.write_crs(crs).rio.to_raster(
-            output
-        )
-    else:
-        xds[variables].rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.write_crs(
-            crs
-        ).rio.to_raster(output)
+    if variables is not None:
+        xds = xds[variables]
+
+    _netcdf_to_raster(
+        xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.write_crs(crs), output
+    )
 
     if return_vars:
         return output, allowed_vars
@@ -5666,11 +6232,14 @@ def netcdf_to_tif(
         return output
 
 
-def read_netcdf(filename, **kwargs: Any):
+def read_netcdf(filename, chunks=None, **kwargs: Any):
     """Read a netcdf file.
 
     Args:
         filename (str): File path or HTTP URL to the netcdf file.
+        chunks (int | dict | str, optional): The dask chunks used to open the file lazily,
+            e.g., "auto". Defaults to None, which opens the file without dask.
+        **kwargs: Additional keyword arguments to pass to xarray.open_dataset().
 
     Raises:
         ImportError: If the xarray or rioxarray package is not installed.
@@ -5690,10 +6259,18 @@ def read_netcdf(filename, **kwargs: Any):
     if not os.path.exists(filename):
         raise FileNotFoundError(f"{filename} does not exist.")
 
-    xds = xr.open_dataset(filename, **kwargs)
+    xds = _open_netcdf(filename, chunks=chunks, **kwargs)
     return xds
 
 
+def _delete_vsimem(path: str) -> None:
+    """Delete a file of GDAL's in-memory filesystem, if it exists."""
+    import rasterio.shutil
+
+    if rasterio.shutil.exists(path):
+        rasterio.shutil.delete(path)
+
+
 def netcdf_tile_layer(
     filename,
     variables=None,
@@ -5710,6 +6287,11 @@ def netcdf_tile_layer(
     shift_lon=True,
     lat="lat",
     lon="lon",
+    lev="lev",
+    level_index=0,
+    time=0,
+    in_memory=False,
+    chunks="auto",
     **kwargs: Any,
 ):
     """Generate an ipyleaflet/folium TileLayer from a netCDF file.
@@ -5735,6 +6317,15 @@ def netcdf_tile_layer(
         shift_lon (bool, optional): Flag to shift longitude values from [0, 360] to the range [-180, 180]. Defaults to True.
         lat (str, optional): Name of the latitude variable. Defaults to 'lat'.
         lon (str, optional): Name of the longitude variable. Defaults to 'lon'.
+        lev (str, optional): Name of the level variable. Defaults to 'lev'.
+        level_index (int, optional): Index of the level dimension. Defaults to 0.
+        time (int, optional): Index of the time dimension. Defaults to 0.
+        in_memory (bool, optional): If True, the selected slice is served from GDAL's
+            in-memory filesystem instead of an intermediate GeoTIFF on disk. The in-memory
+            file is deleted with the tile client. Defaults to False.
+        chunks (int | dict | str, optional): The dask chunks used to open the file. Set to None
+            to load the data without dask. Defaults to "auto".
+        **kwargs: Additional keyword arguments to pass to xarray.open_dataset().
 
     Returns:
         An ipyleaflet.TileLayer or folium.TileLayer.
@@ -5755,13 +6346,23 @@ def netcdf_tile_layer(
     if not os.path.exists(filename):
         raise FileNotFoundError(f"{filename} does not exist.")
 
-    output = filename.replace(".nc", ".tif")
+    if in_memory:
+        output = f"/vsimem/{os.path.basename(filename)}_{random_string(6)}.tif"
+    else:
+        output = filename.replace(".nc", ".tif")
+
+    xds = _open_netcdf(filename, chunks=chunks, **kwargs)
+
+    coords = list(xds.coords.keys())
+    if "time" in coords:
+        xds = xds.isel(time=time, drop=True)
 
-    xds = xr.open_dataset(filename, **kwargs)
+    if lev in coords:
+        xds = xds.isel({lev: level_index}, drop=True)
 
     if shift_lon:
         xds.coords[lon] = (xds.coords[lon] + 180) % 360 - 180
-        xds = xds.sortby(xds.lon)
+        xds = xds.sortby(xds[lon])
 
     allowed_vars = list(xds.data_vars.keys())
     if isinstance(variables, str):
@@ -5775,29 +6376,43 @@ def netcdf_tile_layer(
     if variables is not None and (not set(variables).issubset(allowed_vars)):
         raise ValueError(f"{variables} must be a subset of {allowed_vars}.")
 
-    xds.rio.set_spatial_dims(x_dim=lon, y_dim=lat).rio.to_raster(output)
+    # Only the displayed variables of the selected slice are written out.
     if variables is None:
         if len(allowed_vars) >= 3:
-            band_idx = [1, 2, 3]
+            variables = allowed_vars[:3]
         else:
-            band_idx = [1]
-    else:
-        band_idx = [allowed_vars.index(var) + 1 for var in variables]
+            variables = allowed_vars[:1]
+    band_idx = list(range(1, len(variables) + 1))
 
-    tile_layer = get_local_tile_layer(
-        output,
-        port=port,
-        debug=debug,
-        indexes=band_idx,
-        colormap=colormap,
-        vmin=vmin,
-        vmax=vmax,
-        nodata=nodata,
-        attribution=attribution,
-        tile_format=tile_format,
-        layer_name=layer_name,
-        return_client=return_client,
-    )
+    try:
+        _netcdf_to_raster(
+            xds[variables].rio.set_spatial_dims(x_dim=lon, y_dim=lat), output
+        )
+        tile_layer, tile_client = get_local_tile_layer(
+            output,
+            port=port,
+            debug=debug,
+            indexes=band_idx,
+            colormap=colormap,
+            vmin=vmin,
+            vmax=vmax,
+            nodata=nodata,
+            attribution=attribution,
+            tile_format=tile_format,
+            layer_name=layer_name,
+            return_client=True,
+        )
+    except Exception:
+        if in_memory:
+            _delete_vsimem(output)
+        raise
+
+    if in_memory:
+        # The tile client reads the in-memory file for as long as it serves tiles.
+        weakref.finalize(tile_client, _delete_vsimem, output)
+
+    if return_client:
+        return tile_layer, tile_client
     return tile_layer
 
 
@@ -5895,9 +6510,9 @@ def classify(
     init_column = None
     value_list = None
     if np.issubdtype(df[column].dtype, np.object_):
-        value_list = df[column].unique().tolist()
-        value_list.sort()
-        df["category"] = df[column].replace(value_list, range(0, len(value_list)))
+        codes, uniques = pd.factorize(df[column], sort=True)
+        value_list = uniques.tolist()
+        df["category"] = np.where(codes < 0, np.nan, codes)
         init_column = column
         column = "category"
         k = len(value_list)
@@ -5968,10 +6583,10 @@ def classify(
     binning = mapclassify.classify(
         np.asarray(values[~nan_idx]), scheme, **classification_kwds
     )
-    df["category"] = np.nan
-    df.loc[~nan_idx, "category"] = binning.yb
-    df["color"] = None
-    df.loc[~nan_idx, "color"] = [colors[int(i)] for i in df.loc[~nan_idx, "category"]]
+    codes = np.full(len(df), -1, dtype=np.int64)
+    codes[~nan_idx] = binning.yb
+    df["category"] = np.where(codes < 0, np.nan, codes)
+    df["color"] = _palette_lookup(codes, colors)
 
     if legend_kwds is None:
         legend_kwds = {}
@@ -6019,10 +6634,182 @@ def classify(
         raise ValueError("labels must be a list or None.")
 
     legend_dict = dict(zip(labels, colors))
-    df.loc[~nan_idx, "category"] = df.loc[~nan_idx, "category"] + 1
+    df["category"] = np.where(codes < 0, np.nan, codes + 1)
     return df, legend_dict
 
 
+def _palette_lookup(
+    codes: "np.ndarray", palette: List[Any], nodata: Optional[Any] = None
+) -> "np.ndarray":
+    """Look up the colors of an array of class codes in one indexing step.
+
+    Args:
+        codes (np.ndarray): An integer array of class codes. Negative codes mark
+            missing values.
+        palette (list): The colors of the classes, indexed by class code.
+        nodata (Any, optional): The color of missing values. Defaults to None.
+
+    Returns:
+        np.ndarray: An object array with one color per code.
+    """
+    codes = np.asarray(codes)
+    # The extra trailing entry is selected by the negative (missing) codes.
+    lookup = np.empty(len(palette) + 1, dtype=object)
+    lookup[:-1] = palette
+    lookup[-1] = nodata
+    return lookup[np.where(codes < 0, len(palette), codes)]
+
+
+def _class_palette(df: "pd.DataFrame") -> Tuple["np.ndarray", List[Any]]:
+    """Get the class codes and the class colors of a dataframe returned by classify().
+
+    Args:
+        df (pd.DataFrame): The classified dataframe, with the one-based "category"
+            column and the "color" column.
+
+    Returns:
+        tuple: An integer array of zero-based class codes, with -1 for missing
+            values, and the list of colors indexed by class code.
+    """
+    category = df["category"].to_numpy(dtype=float)
+    valid = ~np.isnan(category)
+    codes = np.where(valid, category - 1, -1).astype(np.int64)
+    palette = np.full(codes.max() + 1 if len(codes) else 0, None, dtype=object)
+    palette[codes[valid]] = df["color"].to_numpy()[valid]
+    return codes, palette.tolist()
+
+
+def _class_styles(
+    codes: "np.ndarray",
+    palette: List[Any],
+    style: Optional[Dict] = None,
+    key: str = "fillColor",
+) -> "np.ndarray":
+    """Build the per-feature styles of classified data, with one dict per class.
+
+    Features of the same class share the same style dict, so no function is
+    called per feature.
+
+    Args:
+        codes (np.ndarray): The zero-based class codes, with -1 for missing values.
+        palette (list): The colors indexed by class code.
+        style (dict, optional): The style shared by all classes. Defaults to None.
+        key (str, optional): The style key of the class color. Defaults to "fillColor".
+
+    Returns:
+        np.ndarray: An object array with the style dict of each feature.
+    """
+    style = style or {}
+    styles = [dict(style, **{key: color}) for color in palette]
+    return _palette_lookup(codes, styles, nodata=dict(style))
+
+
+def _merge_feature_styles(features: List[Dict], style: Dict) -> None:
+    """Merge a layer style into the style property of GeoJSON features in place.
+
+    This gives the same result as styling an ipyleaflet GeoJSON layer, which
+    deep-copies the data and calls a style function for every feature. Each
+    distinct feature style is merged once and features that shared a style dict
+    keep sharing the merged one.
+
+    Args:
+        features (list): The GeoJSON features.
+        style (dict): The layer style. It takes precedence over the feature styles.
+    """
+    merged = {}
+    # Keep the original styles alive so that their ids are not reused.
+    originals = []
+    for feature in features:
+        if feature.get("properties") is None:
+            feature["properties"] = {}
+        properties = feature["properties"]
+        feature_style = properties.get("style")
+        key = id(feature_style)
+        if key not in merged:
+            originals.append(feature_style)
+            if isinstance(feature_style, str):
+                feature_style = json.loads(feature_style)
+            if isinstance(feature_style, dict):
+                merged[key] = dict(feature_style, **style)
+            else:
+                merged[key] = style
+        properties["style"] = merged[key]
+
+
+def _class_match_expression(
+    palette: List[Any], fallback: str = "#000000", prop: str = "category"
+) -> Union[List, str]:
+    """Build a MapLibre expression that maps the one-based class codes to colors.
+
+    Restyling a classified layer then only requires a new expression, not new data.
+
+    Args:
+        palette (list): The colors indexed by zero-based class code.
+        fallback (str, optional): The color of features without a class.
+            Defaults to "#000000".
+        prop (str, optional): The feature property with the one-based class code.
+            Defaults to "category".
+
+    Returns:
+        list | str: The match expression, or the fallback if there are no classes.
+    """
+    expression = ["match", ["get", prop]]
+    for code, color in enumerate(palette, start=1):
+        if color is not None:
+            expression.extend([code, color])
+    if len(expression) == 2:
+        return fallback
+    expression.append(fallback)
+    return expression
+
+
+def _class_rgba(
+    codes: "np.ndarray", palette: List[Any], alpha: Optional[float] = None
+) -> "np.ndarray":
+    """Build the RGBA accessor array of classified data for deck.gl layers.
+
+    Args:
+        codes (np.ndarray): The zero-based class codes, with -1 for missing values.
+        palette (list): The colors indexed by class code.
+        alpha (float, optional): The opacity of the colors between 0 and 1.
+            Defaults to None (opaque).
+
+    Returns:
+        np.ndarray: An (N, 4) uint8 array. Features without a class are transparent.
+    """
+    table = np.zeros((len(palette) + 1, 4), dtype=np.uint8)
+    if palette:
+        colors = [color if color is not None else "#000000" for color in palette]
+        table[:-1, :3] = _colors_to_rgb(colors)
+        table[:-1, 3] = 255 if alpha is None else int(round(alpha * 255))
+    return table[np.where(codes < 0, len(palette), codes)]
+
+
+def _colors_to_rgb(
+    colors: Any, return_type: str = "array"
+) -> Union[List, "np.ndarray"]:
+    """Convert a sequence of colors to RGB values, converting each unique color once.
+
+    Args:
+        colors (Any): A list, array, or Series of colors.
+        return_type (str): The type of the returned values. Can be 'list' or 'array'.
+            Defaults to 'array'.
+
+    Returns:
+        An (N, 3) uint8 array or a list of RGB tuples.
+    """
+    codes, uniques = pd.factorize(
+        pd.Series(colors, dtype=object), use_na_sentinel=False
+    )
+    palette = np.array(
+        [hex_to_rgb(check_color(color)) for color in uniques], dtype=np.uint8
+    ).reshape(-1, 3)
+    rgb = palette[codes]
+    if return_type == "array":
+        return rgb
+    return [tuple(row) for row in rgb.tolist()]
+
+
 def check_cmap(cmap) -> List[str]:
     """Check the colormap and return a list of colors.
 
@@ -6590,6 +7377,117 @@ def download_ned(
     )
 
 
+def _block_windows(width: int, height: int, block_size: int = 1024) -> List[Any]:
+    """Split a raster grid into windows of at most block_size x block_size pixels.
+
+    Args:
+        width (int): The width of the raster in pixels.
+        height (int): The height of the raster in pixels.
+        block_size (int, optional): The size of the windows in pixels. Defaults to 1024.
+
+    Returns:
+        list: A list of rasterio.windows.Window objects covering the grid row by row.
+    """
+    from rasterio.windows import Window
+
+    return [
+        Window(col, row, min(block_size, width - col), min(block_size, height - row))
+        for row in range(0, height, block_size)
+        for col in range(0, width, block_size)
+    ]
+
+
+class _DatasetPool:
+    """Keeps a few open rasterio datasets per thread, reusing them across windows.
+
+    rasterio dataset handles must not be shared between threads, so each worker
+    thread opens its own handles lazily. Each thread keeps at most max_open
+    handles, closing the least recently used ones, so that the number of open
+    files does not grow with the number of sources. All handles are closed by
+    close().
+    """
+
+    def __init__(self, max_open: int = 8, **open_args: Any):
+        import threading
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened = set()
+        self.max_open = max_open
+        self.open_args = open_args
+
+    def get(self, source: str) -> Any:
+        """Return the dataset for source opened in the calling thread."""
+        return self.get_many([source])[0]
+
+    def get_many(self, sources: List[str]) -> List[Any]:
+        """Return the datasets for sources opened in the calling thread.
+
+        The returned datasets stay open together, even if there are more of them
+        than max_open.
+        """
+        from collections import OrderedDict
+
+        import rasterio
+
+        datasets = getattr(self._local, "datasets", None)
+        if datasets is None:
+            datasets = self._local.datasets = OrderedDict()
+        result = []
+        for source in sources:
+            if source in datasets:
+                datasets.move_to_end(source)
+            else:
+                datasets[source] = rasterio.open(source, **self.open_args)
+                with self._lock:
+                    self._opened.add(datasets[source])
+            result.append(datasets[source])
+
+        while len(datasets) > max(self.max_open, len(sources)):
+            _, dataset = datasets.popitem(last=False)
+            dataset.close()
+            with self._lock:
+                self._opened.discard(dataset)
+        return result
+
+    def close(self) -> None:
+        """Close all the datasets opened by the pool."""
+        with self._lock:
+            for dataset in self._opened:
+                dataset.close()
+            self._opened = set()
+
+
+def _run_parallel(
+    tasks: List[Any], func: Callable, num_workers: Optional[int] = None
+) -> None:
+    """Call func on every task across a thread pool.
+
+    The tasks can be raster windows, clip geometries, groups of points, etc. func
+    is expected to write its own result (e.g., under a lock), so no result is kept
+    in memory and the memory use does not grow with the number of tasks.
+
+    Args:
+        tasks (list): The arguments to call func with, one call per task.
+        func (Callable): The function to call with each task.
+        num_workers (int, optional): The number of threads. Defaults to None,
+            which uses the number of CPUs.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    if num_workers <= 1:
+        for task in tasks:
+            func(task)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for _ in executor.map(func, tasks):
+            pass
+
+
 def mosaic(
     images,
     output,
@@ -6598,10 +7496,17 @@ def mosaic(
     merge_args={},
     to_cog=True,
     verbose=True,
+    block_size=1024,
+    num_workers=None,
     **kwargs: Any,
 ):
     """Mosaics a list of images into a single image. Inspired by https://bit.ly/3A6roDK.
 
+    The output grid is computed from the metadata of the inputs only, like a VRT.
+    The output is then rendered block by block across a thread pool, reading for
+    each block only the inputs that overlap it. The memory use therefore depends
+    on the block size and the number of workers, not on the number of inputs.
+
     Args:
         images (str | list): An input directory containing images or a list of images.
         output (str): The output image filepath.
@@ -6610,12 +7515,19 @@ def mosaic(
         merge_args (dict, optional): A dictionary of arguments to pass to the rasterio.merge function. Defaults to {}.
         to_cog (bool, optional): Whether to convert the output image to a Cloud Optimized GeoTIFF. Defaults to True.
         verbose (bool, optional): Whether to print progress. Defaults to True.
+        block_size (int, optional): The size of the output blocks in pixels. Defaults to 1024.
+        num_workers (int, optional): The number of threads rendering blocks. Defaults to None,
+            which uses the number of CPUs.
+        **kwargs (Any): Additional keyword arguments to pass to rasterio.open().
 
     """
-    from pathlib import Path
+    import math
 
     import rasterio as rio
+    from rasterio.coords import disjoint_bounds
     from rasterio.merge import merge
+    from rasterio.transform import from_origin
+    from rasterio.windows import bounds as window_bounds
 
     output = os.path.abspath(output)
 
@@ -6626,38 +7538,113 @@ def mosaic(
     else:
         raise ValueError("images must be a list of raster files.")
 
-    raster_to_mosiac = []
+    if not raster_files:
+        raise ValueError("No input images found.")
 
     if not os.path.exists(os.path.dirname(output)):
         os.makedirs(os.path.dirname(output))
 
+    # Read only the metadata of the inputs to plan the output grid.
+    raster_bounds = []
     for index, p in enumerate(raster_files):
         if verbose:
             print(f"Reading {index + 1}/{len(raster_files)}: {os.path.basename(p)}")
-        raster = rio.open(p, **kwargs)
-        raster_to_mosiac.append(raster)
-
-    if verbose:
-        print("Merging rasters...")
-    arr, transform = merge(raster_to_mosiac, **merge_args)
-
-    output_meta = raster.meta.copy()
+        with rio.open(p, **kwargs) as raster:
+            raster_bounds.append(tuple(raster.bounds))
+            if index == 0:
+                first_meta = raster.meta.copy()
+                first_res = raster.res
+
+    merge_args = dict(merge_args)
+    bounds = merge_args.pop("bounds", None)
+    if bounds is None:
+        bounds = (
+            min(b[0] for b in raster_bounds),
+            min(b[1] for b in raster_bounds),
+            max(b[2] for b in raster_bounds),
+            max(b[3] for b in raster_bounds),
+        )
+    res = merge_args.pop("res", None) or first_res
+    if not isinstance(res, (tuple, list)):
+        res = (res, res)
+    nodata = merge_args.pop("nodata", first_meta["nodata"])
+    dtype = merge_args.pop("dtype", first_meta["dtype"])
+    indexes = merge_args.get("indexes")
+
+    west, south, east, north = bounds
+    width = max(int(math.ceil(round((east - west) / res[0], 6))), 1)
+    height = max(int(math.ceil(round((north - south) / res[1], 6))), 1)
+    transform = from_origin(west, north, res[0], res[1])
+
+    output_meta = first_meta.copy()
     output_meta.update(
         {
             "driver": "GTiff",
-            "height": arr.shape[1],
-            "width": arr.shape[2],
+            "height": height,
+            "width": width,
             "transform": transform,
+            "dtype": dtype,
+            "nodata": nodata,
+            "count": len(indexes) if indexes is not None else first_meta["count"],
+            "tiled": True,
+            "blockxsize": 512,
+            "blockysize": 512,
+            "compress": "deflate",
+            "BIGTIFF": "IF_SAFER",
         }
     )
 
-    with rio.open(output, "w", **output_meta) as m:
-        m.write(arr)
+    windows = _block_windows(width, height, block_size)
+    if verbose:
+        print(f"Merging rasters in {len(windows)} blocks...")
+
+    tif_path = output
+    if to_cog:
+        tif_path = os.path.splitext(output)[0] + "_tmp.tif"
+
+    datasets = _DatasetPool(**kwargs)
+    try:
+        with rio.open(tif_path, "w", **output_meta) as dst:
+            import threading
+
+            write_lock = threading.Lock()
+
+            def render(window):
+                win_bounds = window_bounds(window, transform)
+                sources = datasets.get_many(
+                    [
+                        path
+                        for path, b in zip(raster_files, raster_bounds)
+                        if not disjoint_bounds(b, win_bounds)
+                    ]
+                )
+                if not sources:
+                    return
+                arr, _ = merge(
+                    sources,
+                    bounds=win_bounds,
+                    res=res,
+                    nodata=nodata,
+                    dtype=dtype,
+                    **merge_args,
+                )
+                arr = arr[:, : window.height, : window.width]
+                if arr.shape[1:] != (window.height, window.width):
+                    window = window.__class__(
+                        window.col_off, window.row_off, arr.shape[2], arr.shape[1]
+                    )
+                with write_lock:
+                    dst.write(arr, window=window)
+
+            _run_parallel(windows, render, num_workers)
+    finally:
+        datasets.close()
 
     if to_cog:
         if verbose:
             print("Converting to COG...")
-        image_to_cog(output, output)
+        image_to_cog(tif_path, output, in_memory=False, quiet=not verbose)
+        os.remove(tif_path)
 
     if verbose:
         print(f"Saved mosaic to {output}")
@@ -6721,60 +7708,195 @@ def geometry_bounds(geometry, decimals=4):
 
 
 def reproject(
-    image, output, dst_crs="EPSG:4326", resampling="nearest", to_cog=True, **kwargs: Any
+    image,
+    output,
+    dst_crs="EPSG:4326",
+    resampling="nearest",
+    to_cog=True,
+    num_threads="ALL_CPUS",
+    warp_mem_limit=256,
+    num_workers=None,
+    **kwargs: Any,
 ) -> None:
     """Reprojects an image.
 
+    The image is warped block by block through a rasterio WarpedVRT, so it is never
+    read into memory as a whole. When to_cog is True, the tiling and overviews of the
+    Cloud Optimized GeoTIFF are written in the same pass.
+
     Args:
-        image (str): The input image filepath.
-        output (str): The output image filepath.
+        image (str | list): The input image filepath, or a list of filepaths.
+        output (str): The output image filepath. If image is a list, the output directory,
+            where each output is named after its input file.
         dst_crs (str, optional): The destination CRS. Defaults to "EPSG:4326".
         resampling (Resampling, optional): The resampling method. Defaults to "nearest".
         to_cog (bool, optional): Whether to convert the output image to a Cloud Optimized GeoTIFF. Defaults to True.
+        num_threads (int | str, optional): The number of threads GDAL uses to warp each
+            image. Defaults to "ALL_CPUS".
+        warp_mem_limit (int, optional): The working memory of the warper, in MB. Defaults to 256.
+        num_workers (int, optional): The number of images reprojected concurrently when
+            image is a list. Defaults to None, which uses the number of CPUs.
         **kwargs: Additional keyword arguments to pass to rasterio.open.
 
+    Raises:
+        ValueError: If image is a list containing files with the same name.
     """
-    import rasterio as rio
-    from rasterio.warp import Resampling, calculate_default_transform, reproject
+    from rasterio.warp import Resampling
 
     if isinstance(resampling, str):
         resampling = getattr(Resampling, resampling)
 
+    if isinstance(image, (list, tuple)):
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not image:
+            return
+        from collections import Counter
+
+        output = os.path.abspath(output)
+        names = Counter(os.path.basename(item) for item in image)
+        duplicates = sorted(name for name, count in names.items() if count > 1)
+        if duplicates:
+            raise ValueError(
+                f"The images {duplicates} share a file name and would overwrite "
+                f"each other in {output}. Reproject them to separate directories."
+            )
+        outputs = [os.path.join(output, os.path.basename(item)) for item in image]
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, len(image)))
+        if num_workers > 1 and num_threads == "ALL_CPUS":
+            # Share the CPUs between the images instead of oversubscribing them.
+            num_threads = max(1, (os.cpu_count() or 1) // num_workers)
+
+        # GDAL releases the GIL while warping, so threads run the images in parallel.
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    _reproject_image,
+                    item,
+                    item_output,
+                    dst_crs,
+                    resampling,
+                    to_cog,
+                    num_threads,
+                    warp_mem_limit,
+                    **kwargs,
+                )
+                for item, item_output in zip(image, outputs)
+            ]
+            for future in futures:
+                future.result()
+        return
+
+    _reproject_image(
+        image,
+        output,
+        dst_crs,
+        resampling,
+        to_cog,
+        num_threads,
+        warp_mem_limit,
+        **kwargs,
+    )
+
+
+def _reproject_image(
+    image,
+    output,
+    dst_crs,
+    resampling,
+    to_cog=True,
+    num_threads="ALL_CPUS",
+    warp_mem_limit=256,
+    **kwargs: Any,
+) -> None:
+    """Reprojects one image block by block through a WarpedVRT.
+
+    The result is written to a temporary file next to the output and moved into
+    place when complete, so output may be the input image.
+
+    Args:
+        image (str): The input image filepath.
+        output (str): The output image filepath.
+        dst_crs (str): The destination CRS.
+        resampling (Resampling): The resampling method.
+        to_cog (bool, optional): Whether to write a Cloud Optimized GeoTIFF. Defaults to True.
+        num_threads (int | str, optional): The number of warping threads. Defaults to "ALL_CPUS".
+        warp_mem_limit (int, optional): The working memory of the warper, in MB. Defaults to 256.
+        **kwargs: Additional keyword arguments to pass to rasterio.open.
+    """
+    import rasterio as rio
+    from rasterio.vrt import WarpedVRT
+    from rasterio.warp import calculate_default_transform
+
+    if to_cog:
+        try:
+            from rio_cogeo.cogeo import cog_translate
+            from rio_cogeo.profiles import cog_profiles
+        except ImportError:
+            raise ImportError(
+                "The rio-cogeo package is not installed. Please install it with `pip install rio-cogeo` or `conda install rio-cogeo -c conda-forge`."
+            )
+
     image = os.path.abspath(image)
     output = os.path.abspath(output)
 
     if not os.path.exists(os.path.dirname(output)):
-        os.makedirs(os.path.dirname(output))
+        os.makedirs(os.path.dirname(output), exist_ok=True)
 
-    with rio.open(image, **kwargs) as src:
-        transform, width, height = calculate_default_transform(
-            src.crs, dst_crs, src.width, src.height, *src.bounds
-        )
-        kwargs = src.meta.copy()
-        kwargs.update(
-            {
+    temp_output = os.path.join(
+        os.path.dirname(output), f".{random_string(6)}_{os.path.basename(output)}"
+    )
+
+    with rio.Env(GDAL_NUM_THREADS=str(num_threads)):
+        with rio.open(image, **kwargs) as src:
+            transform, width, height = calculate_default_transform(
+                src.crs, dst_crs, src.width, src.height, *src.bounds
+            )
+            vrt_options = {
                 "crs": dst_crs,
                 "transform": transform,
                 "width": width,
                 "height": height,
+                "resampling": resampling,
+                "warp_mem_limit": warp_mem_limit,
+                "warp_extras": {"NUM_THREADS": str(num_threads)},
             }
-        )
 
-        with rio.open(output, "w", **kwargs) as dst:
-            for i in range(1, src.count + 1):
-                reproject(
-                    source=rio.band(src, i),
-                    destination=rio.band(dst, i),
-                    src_transform=src.transform,
-                    src_crs=src.crs,
-                    dst_transform=transform,
-                    dst_crs=dst_crs,
-                    resampling=resampling,
-                    **kwargs,
-                )
-
-    if to_cog:
-        image_to_cog(output, output)
+            try:
+                with WarpedVRT(src, **vrt_options) as vrt:
+                    if to_cog:
+                        cog_translate(
+                            vrt,
+                            temp_output,
+                            cog_profiles.get("deflate"),
+                            overview_resampling=resampling.name,
+                            in_memory=False,
+                            config={"GDAL_NUM_THREADS": str(num_threads)},
+                            quiet=True,
+                        )
+                    else:
+                        profile = src.profile.copy()
+                        profile.update(
+                            {
+                                "driver": "GTiff",
+                                "crs": dst_crs,
+                                "transform": transform,
+                                "width": width,
+                                "height": height,
+                                "tiled": True,
+                                "blockxsize": 512,
+                                "blockysize": 512,
+                            }
+                        )
+                        with rio.open(temp_output, "w", **profile) as dst:
+                            for _, window in dst.block_windows(1):
+                                dst.write(vrt.read(window=window), window=window)
+                os.replace(temp_output, output)
+            finally:
+                if os.path.exists(temp_output):
+                    os.remove(temp_output)
 
 
 def image_check(image):
@@ -7095,51 +8217,30 @@ def lnglat_to_meters(longitude, latitude):
     """coordinate conversion between lat/lon in decimal degrees to web mercator
 
     Args:
-        longitude (float): The longitude.
-        latitude (float): The latitude.
+        longitude (float | array): The longitude.
+        latitude (float | array): The latitude.
 
     Returns:
         A tuple of (x, y) in meters.
     """
-    import numpy as np
-
-    origin_shift = np.pi * 6378137
-    easting = longitude * origin_shift / 180.0
-    northing = np.log(np.tan((90 + latitude) * np.pi / 360.0)) * origin_shift / np.pi
-
-    if np.isnan(easting):
-        if longitude > 0:
-            easting = 20026376
-        else:
-            easting = -20026376
-
-    if np.isnan(northing):
-        if latitude > 0:
-            northing = 20048966
-        else:
-            northing = -20048966
+    from .tilegrid import lnglat_to_meters
 
-    return (easting, northing)
+    return lnglat_to_meters(longitude, latitude)
 
 
 def meters_to_lnglat(x, y):
     """coordinate conversion between web mercator to lat/lon in decimal degrees
 
     Args:
-        x (float): The x coordinate.
-        y (float): The y coordinate.
+        x (float | array): The x coordinate.
+        y (float | array): The y coordinate.
 
     Returns:
         A tuple of (longitude, latitude) in decimal degrees.
     """
+    from .tilegrid import meters_to_lnglat
 
-    origin_shift = np.pi * 6378137
-    longitude = (x / origin_shift) * 180.0
-    latitude = (y / origin_shift) * 180.0
-    latitude = (
-        180 / np.pi * (2 * np.arctan(np.exp(latitude * np.pi / 180.0)) - np.pi / 2.0)
-    )
-    return (longitude, latitude)
+    return meters_to_lnglat(x, y)
 
 
 def bounds_to_xy_range(
@@ -7230,70 +8331,89 @@ def center_zoom_to_xy_range(
     return x_range, y_range
 
 
+def _bokeh_geometry_coords(geoms, shape_type, mercator=False):
+    """Extracts the x and y coordinates of geometries for Bokeh glyphs.
+
+    Points yield one (x, y) pair per geometry. Lines and polygon exteriors yield
+    one array per geometry, with the parts of multi-part geometries separated by
+    NaN, which is how Bokeh's multi_line and patches glyphs draw disjoint parts.
+    All coordinates are extracted and projected with single array operations.
+
+    Args:
+        geoms (array-like): The shapely geometries.
+        shape_type (str): The geometry type, e.g., "Polygon" or "MultiLineString".
+        mercator (bool, optional): Whether to project the coordinates from
+            longitude/latitude to Web Mercator. Defaults to False.
+
+    Returns:
+        tuple: The x and y coordinates. Arrays of floats for points, otherwise
+            lists of arrays.
+    """
+    import shapely
+
+    geoms = np.asarray(geoms, dtype=object)
+    shape_type = shape_type.lower()
+
+    if shape_type in ["point", "multipoint"]:
+        points = shapely.get_geometry(geoms, 0)
+        x, y = shapely.get_x(points), shapely.get_y(points)
+        if mercator:
+            valid = ~np.isnan(x)
+            x[valid], y[valid] = lnglat_to_meters(x[valid], y[valid])
+        return x, y
+
+    parts, owners = shapely.get_parts(geoms, return_index=True)
+    if shape_type in ["polygon", "multipolygon"]:
+        parts = shapely.get_exterior_ring(parts)
+    coords, coord_parts = shapely.get_coordinates(parts, return_index=True)
+    if mercator and len(coords):
+        coords[:, 0], coords[:, 1] = lnglat_to_meters(coords[:, 0], coords[:, 1])
+
+    # Each part is followed by a NaN slot that separates it from the next part.
+    counts = np.bincount(coord_parts, minlength=len(parts))
+    slot_starts = np.cumsum(counts + 1) - (counts + 1)
+    coord_starts = np.cumsum(counts) - counts
+    positions = (
+        slot_starts[coord_parts] + np.arange(len(coords)) - coord_starts[coord_parts]
+    )
+    values = np.full((int(counts.sum()) + len(parts), 2), np.nan)
+    values[positions] = coords
+
+    row_ends = np.cumsum(np.bincount(owners, weights=counts + 1, minlength=len(geoms)))
+    row_ends = row_ends.astype("int64")
+    xs, ys = [], []
+    for row in np.split(values, row_ends[:-1]):
+        xs.append(row[:-1, 0])
+        ys.append(row[:-1, 1])
+    return xs, ys
+
+
 def get_geometry_coords(row, geom, coord_type, shape_type, mercator=False):
     """
-    Returns the coordinates ('x' or 'y') of edges of a Polygon exterior.
+    Returns the coordinates ('x' or 'y') of a point, a line, or the edges of a
+    Polygon exterior. Parts of multi-part geometries are separated by NaN.
 
     :param: (GeoPandas Series) row : The row of each of the GeoPandas DataFrame.
     :param: (str) geom : The column name.
     :param: (str) coord_type : Whether it's 'x' or 'y' coordinate.
     :param: (str) shape_type
     """
+    x, y = _bokeh_geometry_coords([row[geom]], shape_type, mercator=mercator)
+    coords = x[0] if coord_type == "x" else y[0]
+    if shape_type.lower() in ["point", "multipoint"]:
+        return float(coords)
+    return coords.tolist()
 
-    # Parse the exterior of the coordinate
-    if shape_type.lower() in ["polygon", "multipolygon"]:
-        exterior = row[geom].geoms[0].exterior
-        if coord_type == "x":
-            # Get the x coordinates of the exterior
-            coords = list(exterior.coords.xy[0])
-            if mercator:
-                coords = [lnglat_to_meters(x, 0)[0] for x in coords]
-            return coords
-
-        elif coord_type == "y":
-            # Get the y coordinates of the exterior
-            coords = list(exterior.coords.xy[1])
-            if mercator:
-                coords = [lnglat_to_meters(0, y)[1] for y in coords]
-            return coords
-
-    elif shape_type.lower() in ["linestring", "multilinestring"]:
-        if coord_type == "x":
-            coords = list(row[geom].coords.xy[0])
-            if mercator:
-                coords = [lnglat_to_meters(x, 0)[0] for x in coords]
-            return coords
-        elif coord_type == "y":
-            coords = list(row[geom].coords.xy[1])
-            if mercator:
-                coords = [lnglat_to_meters(0, y)[1] for y in coords]
-            return coords
-
-    elif shape_type.lower() in ["point", "multipoint"]:
-        exterior = row[geom]
-
-        if coord_type == "x":
-            # Get the x coordinates of the exterior
-            coords = exterior.coords.xy[0][0]
-            if mercator:
-                coords = lnglat_to_meters(coords, 0)[0]
-            return coords
-
-        elif coord_type == "y":
-            # Get the y coordinates of the exterior
-            coords = exterior.coords.xy[1][0]
-            if mercator:
-                coords = lnglat_to_meters(0, coords)[1]
-            return coords
-
-
-def gdf_to_bokeh(gdf):
+
+def gdf_to_bokeh(gdf, mercator=True):
     """
     Function to convert a GeoPandas GeoDataFrame to a Bokeh
     ColumnDataSource object.
 
     :param: (GeoDataFrame) gdf: GeoPandas GeoDataFrame with polygon(s) under
                                 the column name 'geometry.'
+    :param: (bool) mercator: Whether to project the longitude/latitude
+                             coordinates to Web Mercator. Defaults to True.
 
     :return: ColumnDataSource for Bokeh.
     """
@@ -7301,26 +8421,12 @@ def gdf_to_bokeh(gdf):
 
     shape_type = gdf_geom_type(gdf)
 
-    gdf_new = gdf.drop("geometry", axis=1).copy()
-    gdf_new["x"] = gdf.apply(
-        get_geometry_coords,
-        geom="geometry",
-        coord_type="x",
-        shape_type=shape_type,
-        mercator=True,
-        axis=1,
-    )
-
-    gdf_new["y"] = gdf.apply(
-        get_geometry_coords,
-        geom="geometry",
-        coord_type="y",
-        shape_type=shape_type,
-        mercator=True,
-        axis=1,
+    data = ColumnDataSource.from_df(pd.DataFrame(gdf.drop(columns=gdf.geometry.name)))
+    data["x"], data["y"] = _bokeh_geometry_coords(
+        gdf.geometry.values, shape_type, mercator=mercator
     )
 
-    return ColumnDataSource(gdf_new)
+    return ColumnDataSource(data)
 
 
 def get_overlap(img1, img2, overlap, out_img1=None, out_img2=None, to_cog=True):
@@ -7969,56 +9075,76 @@ def png_to_gif(in_dir, out_gif, fps=10, loop=0):
     )
 
 
-def add_text_to_gif(
-    in_gif,
-    out_gif,
+def _parse_gif_xy(xy, width: int, height: int) -> Optional[Tuple[int, int]]:
+    """Parse a position given in pixels, e.g., (10, 10), or percentages, e.g., ('10%', '10%').
+
+    Args:
+        xy (tuple): The position to parse.
+        width (int): The width of the GIF.
+        height (int): The height of the GIF.
+
+    Returns:
+        tuple: The position in pixels, or None (after printing a message) if it is invalid.
+    """
+    if (not isinstance(xy, tuple)) and (len(xy) == 2):
+        print("xy must be a tuple, e.g., (10, 10), ('10%', '10%')")
+        return None
+    elif all(isinstance(item, int) for item in xy) and (len(xy) == 2):
+        x, y = xy
+        if (x > 0) and (x < width) and (y > 0) and (y < height):
+            return xy
+        print(
+            f"xy is out of bounds. x must be within [0, {width}], and y must be within [0, {height}]"
+        )
+        return None
+    elif all(isinstance(item, str) for item in xy) and (len(xy) == 2):
+        x, y = xy
+        if ("%" in x) and ("%" in y):
+            try:
+                x = int(float(x.replace("%", "")) / 100.0 * width)
+                y = int(float(y.replace("%", "")) / 100.0 * height)
+                return (x, y)
+            except Exception:
+                raise Exception(
+                    "The specified xy is invalid. It must be formatted like this ('10%', '10%')"
+                )
+        return xy
+    print(
+        "The specified xy is invalid. It must be formatted like this: (10, 10) or ('10%', '10%')"
+    )
+    return None
+
+
+def _gif_text_overlay(
+    size: Tuple[int, int],
+    count: int,
     xy=None,
     text_sequence=None,
     font_type="arial.ttf",
     font_size=20,
     font_color="#000000",
-    add_progress_bar=True,
-    progress_bar_color="white",
-    progress_bar_height=5,
-    duration=100,
-    loop=0,
-):
-    """Adds animated text to a GIF image.
+) -> Optional[Callable]:
+    """Create an overlay drawing animated text on GIF frames.
 
     Args:
-        in_gif (str): The file path to the input GIF image.
-        out_gif (str): The file path to the output GIF image.
-        xy (tuple, optional): Top left corner of the text. It can be formatted like this: (10, 10) or ('15%', '25%'). Defaults to None.
-        text_sequence (int, str, list, optional): Text to be drawn. It can be an integer number, a string, or a list of strings. Defaults to None.
+        size (tuple): The (width, height) of the frames.
+        count (int): The number of frames.
+        xy (tuple, optional): Top left corner of the text. Defaults to None.
+        text_sequence (int, str, list, optional): Text to be drawn. Defaults to None.
         font_type (str, optional): Font type. Defaults to "arial.ttf".
         font_size (int, optional): Font size. Defaults to 20.
-        font_color (str, optional): Font color. It can be a string (e.g., 'red'), rgb tuple (e.g., (255, 127, 0)), or hex code (e.g., '#ff00ff').  Defaults to '#000000'.
-        add_progress_bar (bool, optional): Whether to add a progress bar at the bottom of the GIF. Defaults to True.
-        progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
-        progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
-        duration (int, optional): controls how long each frame will be displayed for, in milliseconds. It is the inverse of the frame rate. Setting it to 100 milliseconds gives 10 frames per second. You can decrease the duration to give a smoother animation.. Defaults to 100.
-        loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
+        font_color (str, optional): Font color. Defaults to '#000000'.
 
+    Returns:
+        Callable: A function overlay(frame, index), or None if the arguments are invalid.
     """
     import importlib.resources
-    import io
 
-    from PIL import Image, ImageDraw, ImageFont, ImageSequence
+    from PIL import ImageDraw, ImageFont
 
-    warnings.simplefilter("ignore")
     pkg_dir = os.path.dirname(importlib.resources.files("leafmap") / "leafmap.py")
     default_font = os.path.join(pkg_dir, "data/fonts/arial.ttf")
 
-    in_gif = os.path.abspath(in_gif)
-    out_gif = os.path.abspath(out_gif)
-
-    if not os.path.exists(in_gif):
-        print("The input gif file does not exist.")
-        return
-
-    if not os.path.exists(os.path.dirname(out_gif)):
-        os.makedirs(os.path.dirname(out_gif))
-
     if font_type == "arial.ttf":
         font = ImageFont.truetype(default_font, font_size)
     elif font_type == "alibaba.otf":
@@ -8040,53 +9166,15 @@ def add_text_to_gif(
             font = ImageFont.truetype(default_font, font_size)
 
     color = check_color(font_color)
-    progress_bar_color = check_color(progress_bar_color)
-
-    try:
-        image = Image.open(in_gif)
-    except Exception as e:
-        print("An error occurred while opening the gif.")
-        print(e)
-        return
-
-    count = image.n_frames
-    W, H = image.size
-    progress_bar_widths = [i * 1.0 / count * W for i in range(1, count + 1)]
-    progress_bar_shapes = [
-        [(0, H - progress_bar_height), (x, H)] for x in progress_bar_widths
-    ]
+    W, H = size
 
     if xy is None:
         # default text location is 5% width and 5% height of the image.
         xy = (int(0.05 * W), int(0.05 * H))
-    elif (xy is not None) and (not isinstance(xy, tuple)) and (len(xy) == 2):
-        print("xy must be a tuple, e.g., (10, 10), ('10%', '10%')")
-        return
-    elif all(isinstance(item, int) for item in xy) and (len(xy) == 2):
-        x, y = xy
-        if (x > 0) and (x < W) and (y > 0) and (y < H):
-            pass
-        else:
-            print(
-                f"xy is out of bounds. x must be within [0, {W}], and y must be within [0, {H}]"
-            )
-            return
-    elif all(isinstance(item, str) for item in xy) and (len(xy) == 2):
-        x, y = xy
-        if ("%" in x) and ("%" in y):
-            try:
-                x = int(float(x.replace("%", "")) / 100.0 * W)
-                y = int(float(y.replace("%", "")) / 100.0 * H)
-                xy = (x, y)
-            except Exception:
-                raise Exception(
-                    "The specified xy is invalid. It must be formatted like this ('10%', '10%')"
-                )
     else:
-        print(
-            "The specified xy is invalid. It must be formatted like this: (10, 10) or ('10%', '10%')"
-        )
-        return
+        xy = _parse_gif_xy(xy, W, H)
+        if xy is None:
+            return None
 
     if text_sequence is None:
         text = [str(x) for x in range(1, count + 1)]
@@ -8102,166 +9190,69 @@ def add_text_to_gif(
         print(
             f"The length of the text sequence must be equal to the number ({count}) of frames in the gif."
         )
-        return
+        return None
     else:
         text = [str(x) for x in text_sequence]
 
-    try:
-        frames = []
-        # Loop over each frame in the animated image
-        for index, frame in enumerate(ImageSequence.Iterator(image)):
-            # Draw the text on the frame
-            frame = frame.convert("RGB")
-            draw = ImageDraw.Draw(frame)
-            # w, h = draw.textsize(text[index])
-            draw.text(xy, text[index], font=font, fill=color)
-            if add_progress_bar:
-                draw.rectangle(progress_bar_shapes[index], fill=progress_bar_color)
-            del draw
-
-            b = io.BytesIO()
-            frame.save(b, format="GIF")
-            frame = Image.open(b)
+    def overlay(frame, index):
+        draw = ImageDraw.Draw(frame)
+        draw.text(xy, text[index], font=font, fill=color)
+        return frame
 
-            frames.append(frame)
-        # https://www.pythoninformer.com/python-libraries/pillow/creating-animated-gif/
-        # Save the frames as a new image
-
-        frames[0].save(
-            out_gif,
-            save_all=True,
-            append_images=frames[1:],
-            duration=duration,
-            loop=loop,
-            optimize=True,
-        )
-    except Exception as e:
-        print(e)
+    return overlay
 
 
-def add_progress_bar_to_gif(
-    in_gif,
-    out_gif,
+def _gif_progress_bar_overlay(
+    size: Tuple[int, int],
+    count: int,
     progress_bar_color="blue",
     progress_bar_height=5,
-    duration=100,
-    loop=0,
-):
-    """Adds a progress bar to a GIF image.
+) -> Callable:
+    """Create an overlay drawing a progress bar at the bottom of GIF frames.
 
     Args:
-        in_gif (str): The file path to the input GIF image.
-        out_gif (str): The file path to the output GIF image.
-        progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
+        size (tuple): The (width, height) of the frames.
+        count (int): The number of frames.
+        progress_bar_color (str, optional): Color for the progress bar. Defaults to 'blue'.
         progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
-        duration (int, optional): controls how long each frame will be displayed for, in milliseconds. It is the inverse of the frame rate. Setting it to 100 milliseconds gives 10 frames per second. You can decrease the duration to give a smoother animation. Defaults to 100.
-        loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
 
+    Returns:
+        Callable: A function overlay(frame, index).
     """
-    import io
-
-    from PIL import Image, ImageDraw, ImageSequence
-
-    warnings.simplefilter("ignore")
-
-    in_gif = os.path.abspath(in_gif)
-    out_gif = os.path.abspath(out_gif)
-
-    if not os.path.exists(in_gif):
-        print("The input gif file does not exist.")
-        return
+    from PIL import ImageDraw
 
-    if not os.path.exists(os.path.dirname(out_gif)):
-        os.makedirs(os.path.dirname(out_gif))
-
-    progress_bar_color = check_color(progress_bar_color)
-
-    try:
-        image = Image.open(in_gif)
-    except Exception as e:
-        raise Exception("An error occurred while opening the gif.")
+    color = check_color(progress_bar_color)
+    W, H = size
 
-    count = image.n_frames
-    W, H = image.size
-    progress_bar_widths = [i * 1.0 / count * W for i in range(1, count + 1)]
-    progress_bar_shapes = [
-        [(0, H - progress_bar_height), (x, H)] for x in progress_bar_widths
-    ]
+    def overlay(frame, index):
+        draw = ImageDraw.Draw(frame)
+        x = (index + 1) * 1.0 / count * W
+        draw.rectangle([(0, H - progress_bar_height), (x, H)], fill=color)
+        return frame
 
-    try:
-        frames = []
-        # Loop over each frame in the animated image
-        for index, frame in enumerate(ImageSequence.Iterator(image)):
-            # Draw the text on the frame
-            frame = frame.convert("RGB")
-            draw = ImageDraw.Draw(frame)
-            # w, h = draw.textsize(text[index])
-            draw.rectangle(progress_bar_shapes[index], fill=progress_bar_color)
-            del draw
-
-            b = io.BytesIO()
-            frame.save(b, format="GIF")
-            frame = Image.open(b)
-
-            frames.append(frame)
-        # https://www.pythoninformer.com/python-libraries/pillow/creating-animated-gif/
-        # Save the frames as a new image
-
-        frames[0].save(
-            out_gif,
-            save_all=True,
-            append_images=frames[1:],
-            duration=duration,
-            loop=loop,
-            optimize=True,
-        )
-    except Exception as e:
-        raise Exception(e)
+    return overlay
 
 
-def add_image_to_gif(
-    in_gif, out_gif, in_image, xy=None, image_size=(80, 80), circle_mask=False
-):
-    """Adds an image logo to a GIF image.
+def _gif_image_overlay(
+    size: Tuple[int, int], in_image, xy=None, image_size=(80, 80), circle_mask=False
+) -> Optional[Callable]:
+    """Create an overlay pasting an image logo on GIF frames.
 
     Args:
-        in_gif (str): Input file path to the GIF image.
-        out_gif (str): Output file path to the GIF image.
-        in_image (str): Input file path to the image.
-        xy (tuple, optional): Top left corner of the text. It can be formatted like this: (10, 10) or ('15%', '25%'). Defaults to None.
+        size (tuple): The (width, height) of the frames.
+        in_image (str): Input file path or HTTP URL to the image.
+        xy (tuple, optional): Top left corner of the image. Defaults to None.
         image_size (tuple, optional): Resize image. Defaults to (80, 80).
-        circle_mask (bool, optional): Whether to apply a circle mask to the image. This only works with non-png images. Defaults to False.
-    """
-    import io
-
-    from PIL import Image, ImageDraw, ImageSequence
-
-    warnings.simplefilter("ignore")
-
-    in_gif = os.path.abspath(in_gif)
-
-    is_url = False
-    if in_image.startswith("http"):
-        is_url = True
+        circle_mask (bool, optional): Whether to apply a circle mask to the image. Defaults to False.
 
-    if not os.path.exists(in_gif):
-        print("The input gif file does not exist.")
-        return
+    Returns:
+        Callable: A function overlay(frame, index), or None if the arguments are invalid.
+    """
+    from PIL import Image, ImageDraw
 
-    if (not is_url) and (not os.path.exists(in_image)):
+    if (not in_image.startswith("http")) and (not os.path.exists(in_image)):
         print("The provided logo file does not exist.")
-        return
-
-    out_dir = check_dir((os.path.dirname(out_gif)))
-    if not os.path.exists(out_dir):
-        os.makedirs(out_dir)
-
-    try:
-        gif = Image.open(in_gif)
-    except Exception as e:
-        print("An error occurred while opening the image.")
-        print(e)
-        return
+        return None
 
     logo_raw_image = None
     try:
@@ -8286,9 +9277,9 @@ def add_image_to_gif(
     )
 
     logo_image = logo_raw_image.convert("RGBA")
-    logo_image.thumbnail(image_size, Image.ANTIALIAS)
+    logo_image.thumbnail(image_size, Image.LANCZOS)
 
-    gif_width, gif_height = gif.size
+    gif_width, gif_height = size
     mask_im = None
 
     if circle_mask:
@@ -8300,82 +9291,333 @@ def add_image_to_gif(
         mask_im = logo_image.copy()
 
     if xy is None:
-        # default logo location is 5% width and 5% height of the image.
+        # default logo location is the bottom right corner of the image.
         delta = 10
         xy = (gif_width - image_resize[0] - delta, gif_height - image_resize[1] - delta)
-        # xy = (int(0.05 * gif_width), int(0.05 * gif_height))
-    elif (xy is not None) and (not isinstance(xy, tuple)) and (len(xy) == 2):
-        print("xy must be a tuple, e.g., (10, 10), ('10%', '10%')")
-        return
-    elif all(isinstance(item, int) for item in xy) and (len(xy) == 2):
-        x, y = xy
-        if (x > 0) and (x < gif_width) and (y > 0) and (y < gif_height):
-            pass
-        else:
-            print(
-                "xy is out of bounds. x must be within [0, {}], and y must be within [0, {}]".format(
-                    gif_width, gif_height
-                )
-            )
-            return
-    elif all(isinstance(item, str) for item in xy) and (len(xy) == 2):
-        x, y = xy
-        if ("%" in x) and ("%" in y):
-            try:
-                x = int(float(x.replace("%", "")) / 100.0 * gif_width)
-                y = int(float(y.replace("%", "")) / 100.0 * gif_height)
-                xy = (x, y)
-            except Exception:
-                raise Exception(
-                    "The specified xy is invalid. It must be formatted like this ('10%', '10%')"
-                )
-
     else:
-        raise Exception(
-            "The specified xy is invalid. It must be formatted like this: (10, 10) or ('10%', '10%')"
-        )
+        xy = _parse_gif_xy(xy, gif_width, gif_height)
+        if xy is None:
+            return None
 
-    try:
-        frames = []
-        for _, frame in enumerate(ImageSequence.Iterator(gif)):
-            frame = frame.convert("RGBA")
-            frame.paste(logo_image, xy, mask_im)
+    def overlay(frame, index):
+        frame.paste(logo_image, xy, mask_im)
+        return frame
 
-            b = io.BytesIO()
-            frame.save(b, format="GIF")
-            frame = Image.open(b)
-            frames.append(frame)
+    return overlay
 
-        frames[0].save(out_gif, save_all=True, append_images=frames[1:])
-    except Exception as e:
-        print(e)
 
+def _save_gif(
+    frames: Iterator[Any],
+    out_gif: str,
+    duration=100,
+    loop=0,
+    optimize=False,
+    shared_palette=False,
+) -> None:
+    """Encode frames into a GIF as they are produced.
 
-def reduce_gif_size(in_gif, out_gif=None):
-    """Reduces a GIF image using ffmpeg.
+    The frames are consumed lazily, so only the palette-based (one byte per pixel)
+    copies kept by Pillow's GIF encoder stay in memory, not the decoded RGB frames.
+    The output is written to a temporary file first, so out_gif may be the GIF the
+    frames are read from.
 
     Args:
-        in_gif (str): The input file path to the GIF image.
-        out_gif (str, optional): The output file path to the GIF image. Defaults to None.
-    """
-
+        frames (Iterator): The frames to encode.
+        out_gif (str): The file path to the output GIF image.
+        duration (int, optional): How long each frame is displayed, in milliseconds. Defaults to 100.
+        loop (int, optional): How many times the animation repeats. 0 repeats forever. Defaults to 0.
+        optimize (bool, optional): Whether to optimize the palettes. Defaults to False.
+        shared_palette (bool, optional): If True, all frames are quantized to the palette
+            of the first frame instead of one adaptive palette per frame. Defaults to False.
+    """
+    if shared_palette:
+        frames = _quantize_frames(frames)
+
+    frames = iter(frames)
+    first = next(frames)
+    temp_gif = os.path.join(
+        os.path.dirname(out_gif), f".{random_string(6)}_{os.path.basename(out_gif)}"
+    )
     try:
-        import ffmpeg
-    except ImportError:
-        print("ffmpeg is not installed on your computer. Skip reducing gif size.")
-        return
+        first.save(
+            temp_gif,
+            format="GIF",
+            save_all=True,
+            append_images=frames,
+            duration=duration,
+            loop=loop,
+            optimize=optimize,
+        )
+        os.replace(temp_gif, out_gif)
+    finally:
+        if os.path.exists(temp_gif):
+            os.remove(temp_gif)
 
-    warnings.filterwarnings("ignore")
 
-    if not is_tool("ffmpeg"):
-        print("ffmpeg is not installed on your computer. Skip reducing gif size.")
-        return
+def _quantize_frames(frames: Iterator[Any]) -> Iterator[Any]:
+    """Quantize frames to the adaptive palette of the first frame."""
+    palette = None
+    for frame in frames:
+        if palette is None:
+            palette = frame.convert("RGB").quantize(256)
+            yield palette
+        else:
+            yield frame.convert("RGB").quantize(palette=palette)
 
-    if not os.path.exists(in_gif):
-        print("The input gif file does not exist.")
-        return
 
-    if out_gif is None:
+def _stream_gif(
+    in_gif: str,
+    out_gif: str,
+    overlays: List[Callable],
+    duration=None,
+    loop=0,
+    mode="RGB",
+    optimize=True,
+    shared_palette=False,
+) -> None:
+    """Decode a GIF frame by frame, apply overlays, and encode the result in one pass.
+
+    Args:
+        in_gif (str): The file path to the input GIF image.
+        out_gif (str): The file path to the output GIF image.
+        overlays (list): Functions called as overlay(frame, index) on each frame.
+        duration (int, optional): How long each frame is displayed, in milliseconds.
+            Defaults to None, which keeps the duration of the input GIF.
+        loop (int, optional): How many times the animation repeats. Defaults to 0.
+        mode (str, optional): The image mode the frames are converted to. Defaults to "RGB".
+        optimize (bool, optional): Whether to optimize the palettes. Defaults to True.
+        shared_palette (bool, optional): Whether to quantize all frames to one palette. Defaults to False.
+    """
+    from PIL import Image, ImageSequence
+
+    with Image.open(in_gif) as image:
+        if duration is None:
+            duration = image.info.get("duration", 100)
+
+        def frames():
+            for index, frame in enumerate(ImageSequence.Iterator(image)):
+                frame = frame.convert(mode)
+                for overlay in overlays:
+                    frame = overlay(frame, index)
+                yield frame
+
+        _save_gif(frames(), out_gif, duration, loop, optimize, shared_palette)
+
+
+def add_overlays_to_gif(
+    in_gif,
+    out_gif,
+    text_args=None,
+    progress_bar_args=None,
+    image_args=None,
+    duration=None,
+    loop=0,
+    shared_palette=False,
+):
+    """Adds text, a progress bar, and/or an image logo to a GIF image in a single pass.
+
+    Each frame is decoded once, all the overlays are drawn on it, and it is encoded
+    before the next frame is decoded.
+
+    Args:
+        in_gif (str): The file path to the input GIF image.
+        out_gif (str): The file path to the output GIF image.
+        text_args (dict, optional): Arguments of the text overlay: xy, text_sequence, font_type,
+            font_size, and font_color. See add_text_to_gif(). Defaults to None (no text).
+        progress_bar_args (dict, optional): Arguments of the progress bar: progress_bar_color
+            and progress_bar_height. See add_progress_bar_to_gif(). Defaults to None (no progress bar).
+        image_args (dict, optional): Arguments of the image logo: in_image, xy, image_size, and
+            circle_mask. See add_image_to_gif(). Defaults to None (no logo).
+        duration (int, optional): How long each frame is displayed, in milliseconds.
+            Defaults to None, which keeps the duration of the input GIF.
+        loop (int, optional): How many times the animation repeats. 0 repeats forever. Defaults to 0.
+        shared_palette (bool, optional): If True, all frames are quantized to the palette of the
+            first frame instead of one adaptive palette per frame. Defaults to False.
+    """
+    from PIL import Image
+
+    warnings.simplefilter("ignore")
+
+    in_gif = os.path.abspath(in_gif)
+    out_gif = os.path.abspath(out_gif)
+
+    if not os.path.exists(in_gif):
+        print("The input gif file does not exist.")
+        return
+
+    if not os.path.exists(os.path.dirname(out_gif)):
+        os.makedirs(os.path.dirname(out_gif))
+
+    with Image.open(in_gif) as image:
+        count = image.n_frames
+        size = image.size
+
+    overlays = []
+    if image_args is not None:
+        overlays.append(_gif_image_overlay(size, **image_args))
+    if text_args is not None:
+        overlays.append(_gif_text_overlay(size, count, **text_args))
+    if progress_bar_args is not None:
+        overlays.append(_gif_progress_bar_overlay(size, count, **progress_bar_args))
+
+    if any(overlay is None for overlay in overlays):
+        return
+
+    _stream_gif(
+        in_gif,
+        out_gif,
+        overlays,
+        duration,
+        loop,
+        mode="RGBA" if image_args is not None else "RGB",
+        shared_palette=shared_palette,
+    )
+
+
+def add_text_to_gif(
+    in_gif,
+    out_gif,
+    xy=None,
+    text_sequence=None,
+    font_type="arial.ttf",
+    font_size=20,
+    font_color="#000000",
+    add_progress_bar=True,
+    progress_bar_color="white",
+    progress_bar_height=5,
+    duration=100,
+    loop=0,
+):
+    """Adds animated text to a GIF image.
+
+    Args:
+        in_gif (str): The file path to the input GIF image.
+        out_gif (str): The file path to the output GIF image.
+        xy (tuple, optional): Top left corner of the text. It can be formatted like this: (10, 10) or ('15%', '25%'). Defaults to None.
+        text_sequence (int, str, list, optional): Text to be drawn. It can be an integer number, a string, or a list of strings. Defaults to None.
+        font_type (str, optional): Font type. Defaults to "arial.ttf".
+        font_size (int, optional): Font size. Defaults to 20.
+        font_color (str, optional): Font color. It can be a string (e.g., 'red'), rgb tuple (e.g., (255, 127, 0)), or hex code (e.g., '#ff00ff').  Defaults to '#000000'.
+        add_progress_bar (bool, optional): Whether to add a progress bar at the bottom of the GIF. Defaults to True.
+        progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
+        progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
+        duration (int, optional): controls how long each frame will be displayed for, in milliseconds. It is the inverse of the frame rate. Setting it to 100 milliseconds gives 10 frames per second. You can decrease the duration to give a smoother animation.. Defaults to 100.
+        loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
+
+    """
+    progress_bar_args = None
+    if add_progress_bar:
+        progress_bar_args = {
+            "progress_bar_color": progress_bar_color,
+            "progress_bar_height": progress_bar_height,
+        }
+
+    try:
+        add_overlays_to_gif(
+            in_gif,
+            out_gif,
+            text_args={
+                "xy": xy,
+                "text_sequence": text_sequence,
+                "font_type": font_type,
+                "font_size": font_size,
+                "font_color": font_color,
+            },
+            progress_bar_args=progress_bar_args,
+            duration=duration,
+            loop=loop,
+        )
+    except Exception as e:
+        print(e)
+
+
+def add_progress_bar_to_gif(
+    in_gif,
+    out_gif,
+    progress_bar_color="blue",
+    progress_bar_height=5,
+    duration=100,
+    loop=0,
+):
+    """Adds a progress bar to a GIF image.
+
+    Args:
+        in_gif (str): The file path to the input GIF image.
+        out_gif (str): The file path to the output GIF image.
+        progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
+        progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
+        duration (int, optional): controls how long each frame will be displayed for, in milliseconds. It is the inverse of the frame rate. Setting it to 100 milliseconds gives 10 frames per second. You can decrease the duration to give a smoother animation. Defaults to 100.
+        loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
+
+    """
+    try:
+        add_overlays_to_gif(
+            in_gif,
+            out_gif,
+            progress_bar_args={
+                "progress_bar_color": progress_bar_color,
+                "progress_bar_height": progress_bar_height,
+            },
+            duration=duration,
+            loop=loop,
+        )
+    except Exception as e:
+        raise Exception(e)
+
+
+def add_image_to_gif(
+    in_gif, out_gif, in_image, xy=None, image_size=(80, 80), circle_mask=False
+):
+    """Adds an image logo to a GIF image.
+
+    Args:
+        in_gif (str): Input file path to the GIF image.
+        out_gif (str): Output file path to the GIF image.
+        in_image (str): Input file path to the image.
+        xy (tuple, optional): Top left corner of the text. It can be formatted like this: (10, 10) or ('15%', '25%'). Defaults to None.
+        image_size (tuple, optional): Resize image. Defaults to (80, 80).
+        circle_mask (bool, optional): Whether to apply a circle mask to the image. This only works with non-png images. Defaults to False.
+    """
+    try:
+        add_overlays_to_gif(
+            in_gif,
+            out_gif,
+            image_args={
+                "in_image": in_image,
+                "xy": xy,
+                "image_size": image_size,
+                "circle_mask": circle_mask,
+            },
+        )
+    except Exception as e:
+        print(e)
+
+
+def reduce_gif_size(in_gif, out_gif=None):
+    """Reduces a GIF image using ffmpeg.
+
+    Args:
+        in_gif (str): The input file path to the GIF image.
+        out_gif (str, optional): The output file path to the GIF image. Defaults to None.
+    """
+
+    try:
+        import ffmpeg
+    except ImportError:
+        print("ffmpeg is not installed on your computer. Skip reducing gif size.")
+        return
+
+    warnings.filterwarnings("ignore")
+
+    if not is_tool("ffmpeg"):
+        print("ffmpeg is not installed on your computer. Skip reducing gif size.")
+        return
+
+    if not os.path.exists(in_gif):
+        print("The input gif file does not exist.")
+        return
+
+    if out_gif is None:
         out_gif = in_gif
     elif not os.path.exists(os.path.dirname(out_gif)):
         os.makedirs(os.path.dirname(out_gif))
@@ -8394,9 +9636,21 @@ def reduce_gif_size(in_gif, out_gif=None):
         ffmpeg.run(stream)
 
 
-def make_gif(images, out_gif, ext="jpg", fps=10, loop=0, mp4=False, clean_up=False):
+def make_gif(
+    images,
+    out_gif,
+    ext="jpg",
+    fps=10,
+    loop=0,
+    mp4=False,
+    clean_up=False,
+    overlays=None,
+    shared_palette=False,
+):
     """Creates a gif from a list of images.
 
+    The images are opened one at a time while the gif is being encoded.
+
     Args:
         images (list | str): The list of images or input directory to create the gif from.
         out_gif (str): File path to the output gif.
@@ -8404,6 +9658,11 @@ def make_gif(images, out_gif, ext="jpg", fps=10, loop=0, mp4=False, clean_up=Fal
         fps (int, optional): The frames per second of the gif. Defaults to 10.
         loop (int, optional): The number of times to loop the gif. Defaults to 0.
         mp4 (bool, optional): Whether to convert the gif to mp4. Defaults to False.
+        clean_up (bool, optional): Whether to delete the input images. Defaults to False.
+        overlays (list, optional): Functions called as overlay(frame, index) to draw on each
+            frame before it is encoded. Defaults to None.
+        shared_palette (bool, optional): If True, all frames are quantized to the palette of the
+            first frame instead of one adaptive palette per frame. Defaults to False.
 
     """
     import glob
@@ -8421,15 +9680,23 @@ def make_gif(images, out_gif, ext="jpg", fps=10, loop=0, mp4=False, clean_up=Fal
 
     images.sort()
 
-    frames = [Image.open(image) for image in images]
-    frame_one = frames[0]
-    frame_one.save(
-        out_gif,
-        format="GIF",
-        append_images=frames,
-        save_all=True,
+    if overlays is None:
+        overlays = []
+
+    def frames():
+        for index, image in enumerate(images):
+            with Image.open(image) as frame:
+                frame = frame.convert("RGB")
+            for overlay in overlays:
+                frame = overlay(frame, index)
+            yield frame
+
+    _save_gif(
+        frames(),
+        os.path.abspath(out_gif),
         duration=int(1000 / fps),
         loop=loop,
+        shared_palette=shared_palette,
     )
 
     if mp4:
@@ -8470,6 +9737,7 @@ def create_timelapse(
     quiet: bool = True,
     reduce_size: bool = False,
     clean_up: bool = True,
+    num_workers: Optional[int] = None,
     **kwargs: Any,
 ):
     """Creates a timelapse gif from a list of images.
@@ -8498,11 +9766,17 @@ def create_timelapse(
         quiet (bool, optional): Whether to print the progress. Defaults to False.
         reduce_size (bool, optional): Whether to reduce the size of the gif using ffmpeg. Defaults to False.
         clean_up (bool, optional): Whether to clean up the temporary files. Defaults to True.
+        num_workers (int, optional): The number of threads clipping and converting the images.
+            Defaults to None, which uses the number of CPUs.
 
     """
 
+    import contextlib
     import glob
     import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    from PIL import Image
 
     if isinstance(images, str):
         if not images.endswith(ext):
@@ -8536,68 +9810,81 @@ def create_timelapse(
     else:
         out_ext = ".jpg"
 
+    def process(index, image):
+        if bbox is not None:
+            clip_file = os.path.join(clip_dir, f"{index}-{os.path.basename(image)}")
+            clip_image(image, mask=bbox, output=clip_file, to_cog=False)
+            source = clip_file
+        else:
+            source = image
+
+        if "add_prefix" in kwargs:
+            basename = (
+                str(f"{index + 1}").zfill(len(str(len(images))))
+                + "-"
+                + os.path.basename(image).replace(ext, out_ext)
+            )
+        else:
+            basename = os.path.basename(image).replace(ext, out_ext)
+        if not quiet:
+            print(f"Processing {index + 1}/{len(images)}: {basename} ...")
+
+        frame_file = os.path.join(temp_dir, basename)
+        numpy_to_image(source, frame_file, bands=bands, size=size)
+        return frame_file
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(images)))
+
     try:
-        for index, image in enumerate(images):
-            if bbox is not None:
-                clip_file = os.path.join(clip_dir, os.path.basename(image))
-                with output:
-                    clip_image(image, mask=bbox, output=clip_file, to_cog=False)
-                image = clip_file
-
-            if "add_prefix" in kwargs:
-                basename = (
-                    str(f"{index + 1}").zfill(len(str(len(images))))
-                    + "-"
-                    + os.path.basename(image).replace(ext, out_ext)
+        # The images are clipped and converted concurrently. GDAL releases the GIL
+        # while reading and writing, and the output widget hides its warnings.
+        with output if quiet else contextlib.nullcontext():
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                frame_files = list(executor.map(process, range(len(images)), images))
+
+        # Draw the text and progress bar while encoding, in the same pass.
+        frame_files.sort()
+        with Image.open(frame_files[0]) as frame:
+            frame_size = frame.size
+        overlays = []
+        if add_text:
+            overlays.append(
+                _gif_text_overlay(
+                    frame_size,
+                    len(frame_files),
+                    text_xy,
+                    text_sequence,
+                    font_type,
+                    font_size,
+                    font_color,
                 )
-            else:
-                basename = os.path.basename(image).replace(ext, out_ext)
-            if not quiet:
-                print(f"Processing {index + 1}/{len(images)}: {basename} ...")
-
-            # ignore GDAL warnings
-            with output:
-                numpy_to_image(
-                    image, os.path.join(temp_dir, basename), bands=bands, size=size
+            )
+        if add_progress_bar:
+            overlays.append(
+                _gif_progress_bar_overlay(
+                    frame_size,
+                    len(frame_files),
+                    progress_bar_color,
+                    progress_bar_height,
                 )
+            )
+
         make_gif(
-            temp_dir,
+            frame_files,
             out_gif,
             ext=out_ext,
             fps=fps,
             loop=loop,
             mp4=mp4,
             clean_up=clean_up,
+            overlays=[overlay for overlay in overlays if overlay is not None],
         )
 
         if clip_dir is not None:
             shutil.rmtree(clip_dir)
 
-        if add_text:
-            add_text_to_gif(
-                out_gif,
-                out_gif,
-                text_xy,
-                text_sequence,
-                font_type,
-                font_size,
-                font_color,
-                add_progress_bar,
-                progress_bar_color,
-                progress_bar_height,
-                1000 / fps,
-                loop,
-            )
-        elif add_progress_bar:
-            add_progress_bar_to_gif(
-                out_gif,
-                out_gif,
-                progress_bar_color,
-                progress_bar_height,
-                1000 / fps,
-                loop,
-            )
-
         if reduce_size:
             reduce_gif_size(out_gif)
     except Exception as e:
@@ -8801,6 +10088,151 @@ def is_tool(name):
     return shutil.which(name) is not None
 
 
+_VECTOR_GIF_STATE = {}
+
+
+def _init_vector_gif_worker(gdf, settings, use_agg=True):
+    """Store the sorted GeoDataFrame and plot settings for rendering vector_to_gif frames.
+
+    Args:
+        gdf (GeoDataFrame): The features sorted by the animated column.
+        settings (dict): The plot settings shared by all frames.
+        use_agg (bool, optional): Whether to switch matplotlib to the non-interactive Agg
+            backend. Only set in worker processes. Defaults to True.
+    """
+    if use_agg:
+        import matplotlib
+
+        matplotlib.use("Agg")
+
+    _VECTOR_GIF_STATE["gdf"] = gdf
+    _VECTOR_GIF_STATE["settings"] = settings
+
+
+def _style_vector_gif_axes(ax, settings):
+    """Apply the title, extent and layout shared by all vector_to_gif frames."""
+    bbox = settings["bbox"]
+    ax.set_title(settings["title"], fontsize=settings["fontsize"])
+    ax.set_axis_off()
+    ax.set_xlim([bbox[0], bbox[2]])
+    ax.set_ylim([bbox[1], bbox[3]])
+
+
+def _render_vector_gif_frame(task):
+    """Render one cumulative vector_to_gif frame to a PNG file.
+
+    Args:
+        task (tuple): (index, value, end, path), where the first ``end`` rows of the
+            sorted GeoDataFrame are drawn.
+
+    Returns:
+        str: The path to the PNG file.
+    """
+    import matplotlib.pyplot as plt
+
+    _, value, end, path = task
+    gdf = _VECTOR_GIF_STATE["gdf"]
+    settings = _VECTOR_GIF_STATE["settings"]
+
+    fig, ax = plt.subplots(figsize=settings["figsize"])
+    if end > 0:
+        gdf.iloc[:end].plot(
+            ax=ax, facecolor=settings["facecolor"], **settings["plot_args"]
+        )
+    _style_vector_gif_axes(ax, settings)
+    if settings["add_text"]:
+        x, y = settings["text_xy"]
+        ax.text(x, y, value, fontsize=settings["fontsize"])
+    fig.tight_layout(pad=settings["padding"])
+    fig.savefig(path, dpi=settings["dpi"])
+    plt.close(fig)
+    return path
+
+
+def _render_vector_gif_frames(gdf, tasks, settings, num_workers=None, verbose=True):
+    """Render the vector_to_gif frames independently, in parallel processes.
+
+    Args:
+        gdf (GeoDataFrame): The features sorted by the animated column.
+        tasks (list): The (index, value, end, path) tuples of the frames.
+        settings (dict): The plot settings shared by all frames.
+        num_workers (int, optional): The number of processes. Defaults to None, which
+            uses the number of CPUs.
+        verbose (bool, optional): Whether to print the progress. Defaults to True.
+
+    Yields:
+        str: The paths to the PNG files, in frame order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(tasks)))
+
+    def report(task):
+        if verbose:
+            print(f"Processing {task[0] + 1}/{len(tasks)}: {task[1]}...")
+
+    if num_workers == 1:
+        _init_vector_gif_worker(gdf, settings, use_agg=False)
+        try:
+            for task in tasks:
+                report(task)
+                yield _render_vector_gif_frame(task)
+        finally:
+            _VECTOR_GIF_STATE.clear()
+        return
+
+    # The GeoDataFrame is pickled once per worker rather than once per frame.
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_vector_gif_worker,
+        initargs=(gdf, settings),
+    ) as executor:
+        for task, path in zip(tasks, executor.map(_render_vector_gif_frame, tasks)):
+            report(task)
+            yield path
+
+
+def _render_vector_gif_incremental(gdf, tasks, settings, verbose=True):
+    """Render the vector_to_gif frames on one figure, adding only the new features.
+
+    Args:
+        gdf (GeoDataFrame): The features sorted by the animated column.
+        tasks (list): The (index, value, end, path) tuples of the frames.
+        settings (dict): The plot settings shared by all frames.
+        verbose (bool, optional): Whether to print the progress. Defaults to True.
+
+    Yields:
+        str: The paths to the PNG files, in frame order.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=settings["figsize"])
+    text = None
+    if settings["add_text"]:
+        x, y = settings["text_xy"]
+        text = ax.text(x, y, "", fontsize=settings["fontsize"], zorder=10)
+    start = 0
+    try:
+        for index, value, end, path in tasks:
+            if verbose:
+                print(f"Processing {index + 1}/{len(tasks)}: {value}...")
+            if end > start:
+                gdf.iloc[start:end].plot(
+                    ax=ax, facecolor=settings["facecolor"], **settings["plot_args"]
+                )
+                start = end
+            _style_vector_gif_axes(ax, settings)
+            if text is not None:
+                text.set_text(str(value))
+            fig.tight_layout(pad=settings["padding"])
+            fig.savefig(path, dpi=settings["dpi"])
+            yield path
+    finally:
+        plt.close(fig)
+
+
 def vector_to_gif(
     filename,
     out_gif,
@@ -8826,6 +10258,8 @@ def vector_to_gif(
     verbose=True,
     open_args={},
     plot_args={},
+    incremental=False,
+    num_workers=None,
 ):
     """Convert a vector to a gif. This function was inspired by by Johannes Uhl's shapefile2gif repo at
             https://github.com/johannesuhl/shapefile2gif. Credits to Johannes Uhl.
@@ -8855,10 +10289,14 @@ def vector_to_gif(
         verbose (bool, optional): Whether to print the progress. Defaults to True.
         open_args (dict, optional): The arguments for the geopandas.read_file() function. Defaults to {}.
         plot_args (dict, optional): The arguments for the geopandas.GeoDataFrame.plot() function. Defaults to {}.
+        incremental (bool, optional): If True, the frames are rendered on one figure, plotting
+            only the features added since the previous frame. Defaults to False.
+        num_workers (int, optional): The number of processes rendering the frames when
+            incremental is False. Defaults to None, which uses the number of CPUs.
 
     """
     import geopandas as gpd
-    import matplotlib.pyplot as plt
+    from PIL import Image
 
     out_dir = os.path.dirname(out_gif)
     tmp_dir = os.path.join(out_dir, "tmp_png")
@@ -8927,36 +10365,50 @@ def vector_to_gif(
     x = bbox[0] + x
     y = bbox[1] + y
 
-    for index, v in enumerate(options):
-        if verbose:
-            print(f"Processing {index + 1}/{len(options)}: {v}...")
-        yrdf = gdf[gdf[colname] <= v]
-        fig, ax = plt.subplots()
-        ax = yrdf.plot(facecolor=facecolor, figsize=figsize, **plot_args)
-        ax.set_title(title, fontsize=fontsize)
-        ax.set_axis_off()
-        ax.set_xlim([bbox[0], bbox[2]])
-        ax.set_ylim([bbox[1], bbox[3]])
-        if add_text:
-            ax.text(x, y, v, fontsize=fontsize)
-        fig = ax.get_figure()
-        plt.tight_layout(pad=padding)
-        fig.savefig(tmp_dir + os.sep + "%s.png" % v, dpi=dpi)
-        plt.clf()
-        plt.close("all")
-
-    png_to_gif(tmp_dir, out_gif, fps=fps, loop=loop)
+    # Sort once, so that each cumulative frame is a prefix of the GeoDataFrame.
+    gdf = gdf.sort_values(colname, kind="stable")
+    ends = np.searchsorted(gdf[colname].to_numpy(), list(options), side="right")
+
+    settings = {
+        "facecolor": facecolor,
+        "figsize": figsize,
+        "padding": padding,
+        "title": title,
+        "add_text": add_text,
+        "text_xy": (x, y),
+        "fontsize": fontsize,
+        "bbox": bbox,
+        "dpi": dpi,
+        "plot_args": plot_args,
+    }
+    tasks = [
+        (index, v, int(end), os.path.join(tmp_dir, "%s.png" % v))
+        for index, (v, end) in enumerate(zip(options, ends))
+    ]
 
-    if add_progress_bar:
-        add_progress_bar_to_gif(
-            out_gif,
-            out_gif,
-            progress_bar_color,
-            progress_bar_height,
-            duration=1000 / fps,
-            loop=loop,
+    if incremental:
+        frame_files = _render_vector_gif_incremental(gdf, tasks, settings, verbose)
+    else:
+        frame_files = _render_vector_gif_frames(
+            gdf, tasks, settings, num_workers, verbose
         )
 
+    # Frames are encoded as soon as they are rendered, in order.
+    def frames():
+        overlay = None
+        for index, frame_file in enumerate(frame_files):
+            with Image.open(frame_file) as frame:
+                frame = frame.convert("RGB")
+            if add_progress_bar:
+                if overlay is None:
+                    overlay = _gif_progress_bar_overlay(
+                        frame.size, len(tasks), progress_bar_color, progress_bar_height
+                    )
+                frame = overlay(frame, index)
+            yield frame
+
+    _save_gif(frames(), os.path.abspath(out_gif), duration=1000 / fps, loop=loop)
+
     if mp4:
         gif_to_mp4(out_gif, out_gif.replace(".gif", ".mp4"))
 
@@ -9257,6 +10709,144 @@ def arc_zoom_to_bounds(bounds):
     arc_zoom_to_extent(xmin, ymin, xmax, ymax)
 
 
+def _rasterize_vector(
+    gdf,
+    output,
+    field="FID",
+    assign="last",
+    nodata=True,
+    cell_size=None,
+    base=None,
+    to_epsg=3857,
+    all_touched=False,
+    dtype=None,
+    block_size=1024,
+    num_workers=None,
+    verbose=False,
+) -> None:
+    """Rasterize a GeoDataFrame window by window with rasterio.features.rasterize.
+
+    See vector_to_raster() for the arguments.
+    """
+    import math
+    import threading
+
+    import rasterio
+    import shapely
+    from rasterio import features
+    from rasterio.enums import MergeAlg
+    from rasterio.transform import from_origin
+
+    assigns = ["first", "last", "min", "max", "sum", "number"]
+    if assign not in assigns:
+        raise ValueError(f"assign must be one of {assigns}.")
+
+    if base is not None:
+        with rasterio.open(base) as src:
+            crs, transform = src.crs, src.transform
+            width, height = src.width, src.height
+        gdf = gdf.to_crs(crs)
+    elif cell_size is not None:
+        if gdf.crs.is_geographic:
+            gdf = gdf.to_crs(epsg=to_epsg)
+        crs = gdf.crs
+        minx, miny, maxx, maxy = gdf.total_bounds
+        width = max(1, math.ceil((maxx - minx) / cell_size))
+        height = max(1, math.ceil((maxy - miny) / cell_size))
+        transform = from_origin(minx, maxy, cell_size, cell_size)
+    else:
+        raise ValueError("Either cell_size or base must be specified.")
+
+    if field in gdf.columns:
+        values = gdf[field].to_numpy()
+    elif field == "FID":
+        values = np.arange(1, len(gdf) + 1)
+    else:
+        raise ValueError(f"{field} is not a column of the vector data.")
+    if assign == "number":
+        values = np.ones(len(gdf), dtype="int32")
+
+    if dtype is None:
+        dtype = "float32" if np.issubdtype(values.dtype, np.floating) else "int32"
+    values = values.astype(dtype)
+    if not nodata:
+        nodata_value = None
+    elif np.issubdtype(np.dtype(dtype), np.signedinteger):
+        nodata_value = np.iinfo(dtype).min
+    elif np.issubdtype(np.dtype(dtype), np.unsignedinteger):
+        nodata_value = np.iinfo(dtype).max
+    else:
+        nodata_value = -32768
+    fill = nodata_value if nodata and assign not in ("sum", "number") else 0
+
+    # rasterize() keeps the last value burnt into a cell, so the features are ordered
+    # to make the last one the first, smallest or largest as requested.
+    geoms = gdf.geometry.values
+    if assign == "first":
+        order = np.arange(len(gdf))[::-1]
+    elif assign == "min":
+        order = np.argsort(values, kind="stable")[::-1]
+    elif assign == "max":
+        order = np.argsort(values, kind="stable")
+    else:
+        order = np.arange(len(gdf))
+    geoms, values = geoms[order], values[order]
+    merge_alg = MergeAlg.add if assign in ("sum", "number") else MergeAlg.replace
+    tree = shapely.STRtree(geoms)
+
+    profile = {
+        "driver": "GTiff",
+        "width": width,
+        "height": height,
+        "count": 1,
+        "dtype": dtype,
+        "crs": crs,
+        "transform": transform,
+        "nodata": nodata_value,
+        "tiled": True,
+        "blockxsize": 256,
+        "blockysize": 256,
+        "compress": "deflate",
+        "BIGTIFF": "IF_SAFER",
+    }
+    windows = _block_windows(width, height, block_size)
+    lock = threading.Lock()
+
+    with rasterio.open(output, "w", **profile) as dst:
+
+        def burn(window):
+            window_transform = rasterio.windows.transform(window, transform)
+            bounds = rasterio.windows.bounds(window, transform)
+            index = np.sort(tree.query(shapely.box(*bounds)))
+            out = np.full((window.height, window.width), fill, dtype=dtype)
+            if len(index):
+                out = features.rasterize(
+                    zip(geoms[index], values[index]),
+                    out=out,
+                    transform=window_transform,
+                    all_touched=all_touched,
+                    merge_alg=merge_alg,
+                )
+                if nodata and assign in ("sum", "number"):
+                    covered = features.rasterize(
+                        geoms[index],
+                        out_shape=out.shape,
+                        transform=window_transform,
+                        all_touched=all_touched,
+                        dtype="uint8",
+                    )
+                    out[covered == 0] = nodata_value
+            elif nodata:
+                out[:] = nodata_value
+            with lock:
+                dst.write(out, 1, window=window)
+
+        _run_parallel(windows, burn, num_workers)
+
+    if verbose:
+        print(f"The raster is saved to {output}")
+
+
 def vector_to_raster(
     vector,
     output,
@@ -9268,13 +10858,26 @@ def vector_to_raster(
     callback=None,
     verbose=False,
     to_epsg=None,
+    engine="whitebox",
+    all_touched=False,
+    dtype=None,
+    block_size=1024,
+    num_workers=None,
 ):
     """Convert a vector to a raster.
 
+    The default whitebox engine runs the WhiteboxTools vector-to-raster tools. With
+    the rasterio engine, the output grid is rasterized window by window across a
+    thread pool and written to a tiled GeoTIFF as the windows complete, so neither
+    the grid nor a temporary copy of the vector is needed. The NoData value of the
+    rasterio engine is the minimum of signed integer types, the maximum of unsigned
+    integer types, and -32768 for floating point types.
+
     Args:
         vector (str | GeoPandas.GeoDataFrame): The input vector data, can be a file path or a GeoDataFrame.
         output (str): The output raster file path.
-        field (str, optional): Input field name in attribute table. Defaults to 'FID'.
+        field (str, optional): Input field name in attribute table. Defaults to 'FID', which uses
+            the feature numbers (starting from 1) if there is no such column.
         assign (str, optional): Assignment operation, where multiple points are in the same grid cell; options
             include 'first', 'last' (default), 'min', 'max', 'sum', 'number'. Defaults to 'last'.
         nodata (bool, optional): Background value to set to NoData. Without this flag, it will be set to 0.0.
@@ -9283,10 +10886,18 @@ def vector_to_raster(
         callback (fuct, optional): A callback function to report progress. Defaults to None.
         verbose (bool, optional): Whether to print progress to the console. Defaults to False.
         to_epsg (integer, optional): Optionally specified the EPSG code to reproject the raster to. Defaults to None.
+        engine (str, optional): Either "whitebox" or "rasterio". Defaults to "whitebox".
+        all_touched (bool, optional): Whether to burn all the cells touched by a geometry rather than
+            only those whose center is inside it. Only used by the rasterio engine. Defaults to False.
+        dtype (str, optional): The data type of the output raster. Defaults to None, which is
+            float32 for floating point fields and int32 otherwise. Only used by the rasterio engine.
+        block_size (int, optional): The size of the windows in pixels. Only used by the
+            rasterio engine. Defaults to 1024.
+        num_workers (int, optional): The number of threads rasterizing windows. Only used by
+            the rasterio engine. Defaults to None, which uses the number of CPUs.
 
     """
     import geopandas as gpd
-    import whitebox
 
     output = os.path.abspath(output)
 
@@ -9303,6 +10914,28 @@ def vector_to_raster(
     if to_epsg == 4326:
         raise ValueError("to_epsg cannot be 4326")
 
+    if engine == "rasterio":
+        _rasterize_vector(
+            gdf,
+            output,
+            field=field,
+            assign=assign,
+            nodata=nodata,
+            cell_size=cell_size,
+            base=base,
+            to_epsg=to_epsg,
+            all_touched=all_touched,
+            dtype=dtype,
+            block_size=block_size,
+            num_workers=num_workers,
+            verbose=verbose,
+        )
+        return
+    elif engine != "whitebox":
+        raise ValueError("engine must be either 'rasterio' or 'whitebox'.")
+
+    import whitebox
+
     if gdf.crs.is_geographic:
         gdf = gdf.to_crs(epsg=to_epsg)
         vector = temp_file_path(extension=".shp")
@@ -10366,23 +11999,88 @@ def read_rasters(
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def _crs_wkt(crs: Union[str, int]) -> str:
+    import pyproj
+
+    return pyproj.CRS.from_user_input(crs).to_wkt()
+
+
+def _crs_cache_key(crs: Any) -> str:
+    """Get a hashable key for a CRS given in any form accepted by pyproj.
+
+    The key is the WKT of the CRS, so that equivalent spellings (e.g., "epsg:4326"
+    and 4326) share a transformer while PROJ strings keep their case.
+    """
+    import pyproj
+
+    if isinstance(crs, (str, int)):
+        return _crs_wkt(crs)
+    return pyproj.CRS.from_user_input(crs).to_wkt()
+
+
+_TRANSFORMERS = {}
+_TRANSFORMERS_LOCK = threading.Lock()
+_TRANSFORMERS_MAX_SIZE = 128
+
+
+def get_transformer(src_crs, dst_crs, always_xy=True, **kwargs: Any):
+    """Get a cached pyproj Transformer between two CRSs.
+
+    Creating a Transformer looks up the CRS definitions and the operation in the PROJ
+    database, which takes far longer than transforming coordinates. Transformers are
+    cached by (src_crs, dst_crs, always_xy) and by thread, since a pyproj Transformer
+    must not be shared between threads.
+
+    Args:
+        src_crs (str | int | CRS): The source CRS, e.g., "EPSG:4326".
+        dst_crs (str | int | CRS): The destination CRS, e.g., "EPSG:3857".
+        always_xy (bool, optional): Whether to use the (x, y) / (lon, lat) axis order.
+            Defaults to True.
+        **kwargs: Additional keyword arguments to pass to pyproj.Transformer.from_crs().
+
+    Returns:
+        pyproj.Transformer: The transformer.
+    """
+    import pyproj
+
+    key = (
+        _crs_cache_key(src_crs),
+        _crs_cache_key(dst_crs),
+        always_xy,
+        threading.get_ident(),
+        tuple(sorted(kwargs.items())),
+    )
+    with _TRANSFORMERS_LOCK:
+        transformer = _TRANSFORMERS.pop(key, None)
+        if transformer is not None:
+            # Re-insert the entry to mark it as the most recently used.
+            _TRANSFORMERS[key] = transformer
+            return transformer
+
+    transformer = pyproj.Transformer.from_crs(
+        src_crs, dst_crs, always_xy=always_xy, **kwargs
+    )
+    with _TRANSFORMERS_LOCK:
+        _TRANSFORMERS[key] = transformer
+        while len(_TRANSFORMERS) > _TRANSFORMERS_MAX_SIZE:
+            _TRANSFORMERS.pop(next(iter(_TRANSFORMERS)))
+    return transformer
+
+
 def transform_coords(x, y, src_crs, dst_crs, **kwargs: Any):
     """Transform coordinates from one CRS to another.
 
     Args:
-        x (float): The x coordinate.
-        y (float): The y coordinate.
+        x (float | array): The x coordinates.
+        y (float | array): The y coordinates.
         src_crs (str): The source CRS, e.g., "EPSG:4326".
         dst_crs (str): The destination CRS, e.g., "EPSG:3857".
 
     Returns:
         The transformed coordinates in the format of (x, y).
     """
-    import pyproj
-
-    transformer = pyproj.Transformer.from_crs(
-        src_crs, dst_crs, always_xy=True, **kwargs
-    )
+    transformer = get_transformer(src_crs, dst_crs, always_xy=True, **kwargs)
     return transformer.transform(x, y)
 
 
@@ -10399,14 +12097,15 @@ def transform_bbox_coords(bbox, src_crs, dst_crs, **kwargs: Any):
     """
     x1, y1, x2, y2 = bbox
 
-    x1, y1 = transform_coords(
-        x1, y1, src_crs, dst_crs, **kwargs
-    )  # pylint: disable=E0633
-    x2, y2 = transform_coords(
-        x2, y2, src_crs, dst_crs, **kwargs
+    xs, ys = transform_coords(
+        np.array([x1, x2], dtype="float64"),
+        np.array([y1, y2], dtype="float64"),
+        src_crs,
+        dst_crs,
+        **kwargs,
     )  # pylint: disable=E0633
 
-    return [x1, y1, x2, y2]
+    return [float(xs[0]), float(ys[0]), float(xs[1]), float(ys[1])]
 
 
 def coords_to_xy(
@@ -10416,33 +12115,34 @@ def coords_to_xy(
     request_payer="bucket-owner",
     env_args={},
     open_args={},
+    return_array: bool = False,
     **kwargs: Any,
 ) -> list:
     """Converts a list of coordinates to pixel coordinates, i.e., (col, row) coordinates.
 
     Args:
         src_fp (str): The source raster file path.
-        coords (list): A list of coordinates in the format of [[x1, y1], [x2, y2], ...]
+        coords (list | np.ndarray): A list of coordinates in the format of [[x1, y1], [x2, y2], ...],
+            or an (N, 2) array.
         coord_crs (str): The coordinate CRS of the input coordinates. Defaults to "epsg:4326".
         request_payer (str): Specifies who pays for the download from S3.
             Can be "bucket-owner" or "requester". Defaults to "bucket-owner".
         env_args (dict): Additional keyword arguments to pass to rasterio.Env.
         open_args (dict): Additional keyword arguments to pass to rasterio.open.
+        return_array (bool): If True, return an (N, 2) integer array of [col, row] instead of a list.
+            Defaults to False.
         **kwargs (Any): Additional keyword arguments to pass to rasterio.transform.rowcol.
 
     Returns:
         A list of pixel coordinates in the format of [[x1, y1], [x2, y2], ...]
     """
-    import numpy as np
     import rasterio
 
-    if isinstance(coords, np.ndarray):
-        coords = coords.tolist()
-
-    if len(coords) == 4 and all([isinstance(c, (int, float)) for c in coords]):
-        coords = [[coords[0], coords[1]], [coords[2], coords[3]]]
+    coords = np.asarray(coords, dtype="float64")
+    if coords.shape == (4,):
+        coords = coords.reshape(2, 2)
 
-    xs, ys = zip(*coords)
+    xs, ys = coords[:, 0], coords[:, 1]
     with rasterio.Env(AWS_REQUEST_PAYER=request_payer, **env_args):
         with rasterio.open(src_fp, **open_args) as src:
             width = src.width
@@ -10452,17 +12152,147 @@ def coords_to_xy(
                     xs, ys, coord_crs, src.crs, **kwargs
                 )  # pylint: disable=E0633
             rows, cols = rasterio.transform.rowcol(src.transform, xs, ys, **kwargs)
-        result = [[col, row] for col, row in zip(cols, rows)]
 
-        result = [
-            [x, y] for x, y in result if x >= 0 and y >= 0 and x < width and y < height
-        ]
+        result = np.column_stack(
+            [np.asarray(cols, dtype="int64"), np.asarray(rows, dtype="int64")]
+        ).reshape(-1, 2)
+        inside = (
+            (result[:, 0] >= 0)
+            & (result[:, 1] >= 0)
+            & (result[:, 0] < width)
+            & (result[:, 1] < height)
+        )
+        result = result[inside]
         if len(result) == 0:
             print("No valid pixel coordinates found.")
         elif len(result) < len(coords):
             print("Some coordinates are out of the image boundary.")
 
-        return result
+        if return_array:
+            return result
+        return result.tolist()
+
+
+def sample_raster(
+    source: str,
+    points: Any,
+    bands: Optional[List[int]] = None,
+    points_crs: str = "EPSG:4326",
+    columns: Optional[List[str]] = None,
+    num_workers: Optional[int] = None,
+    request_payer: str = "bucket-owner",
+    env_args: Dict = {},
+    open_args: Dict = {},
+) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
+    """Sample the pixel values of a raster at many points.
+
+    The points are transformed and converted to pixel coordinates in one vectorized
+    step, then grouped by the internal block of the raster they fall in. Each block
+    is read once, locally or through HTTP range requests for remote COGs, and the
+    blocks are read across a thread pool.
+
+    Args:
+        source (str): The path or URL to the raster.
+        points (GeoDataFrame | np.ndarray | list): A GeoDataFrame of points, or the
+            coordinates as an (N, 2) array or a list of [x, y].
+        bands (list, optional): The band indices to sample, starting from 1.
+            Defaults to None, which samples all bands.
+        points_crs (str, optional): The CRS of the coordinates when points is not a
+            GeoDataFrame. Defaults to "EPSG:4326".
+        columns (list, optional): The names of the value columns. Defaults to None,
+            which uses "band_1", "band_2", etc.
+        num_workers (int, optional): The number of threads reading blocks. Defaults to
+            None, which uses the number of CPUs.
+        request_payer (str, optional): Specifies who pays for the download from S3.
+            Can be "bucket-owner" or "requester". Defaults to "bucket-owner".
+        env_args (dict, optional): Additional keyword arguments to pass to rasterio.Env.
+        open_args (dict, optional): Additional keyword arguments to pass to rasterio.open.
+
+    Returns:
+        pd.DataFrame | gpd.GeoDataFrame: A copy of the GeoDataFrame with the sampled values
+            attached, or a DataFrame with x, y and the sampled values. Points outside the
+            raster or on NoData pixels get NaN.
+    """
+    import geopandas as gpd
+    import rasterio
+    from rasterio.windows import Window
+
+    if isinstance(points, gpd.GeoDataFrame):
+        xs = points.geometry.x.to_numpy()
+        ys = points.geometry.y.to_numpy()
+        crs = points.crs if points.crs is not None else points_crs
+    else:
+        coords = np.asarray(points, dtype="float64").reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        crs = points_crs
+
+    env = {"AWS_REQUEST_PAYER": request_payer, **env_args}
+    with rasterio.Env(**env):
+        with rasterio.open(source, **open_args) as src:
+            if bands is None:
+                bands = list(range(1, src.count + 1))
+            width, height = src.width, src.height
+            block_height, block_width = src.block_shapes[bands[0] - 1]
+            inverse = ~src.transform
+            if src.crs is not None and crs is not None:
+                src_xs, src_ys = transform_coords(xs, ys, crs, src.crs)
+            else:
+                src_xs, src_ys = xs, ys
+
+    cols, rows = inverse * (np.asarray(src_xs), np.asarray(src_ys))
+    cols = np.floor(cols).astype("int64")
+    rows = np.floor(rows).astype("int64")
+    inside = np.flatnonzero(
+        (cols >= 0) & (rows >= 0) & (cols < width) & (rows < height)
+    )
+
+    values = np.full((len(bands), len(xs)), np.nan, dtype="float64")
+
+    # Group the points by the block they fall in, so that each block is read once.
+    block_ids = (rows[inside] // block_height) * (
+        (width + block_width - 1) // block_width
+    ) + cols[inside] // block_width
+    order = np.argsort(block_ids, kind="stable")
+    sorted_ids = block_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    groups = np.split(inside[order], starts[1:]) if len(inside) else []
+
+    pool = _DatasetPool(**open_args)
+
+    def read_block(group):
+        block_row = rows[group[0]] // block_height
+        block_col = cols[group[0]] // block_width
+        row_off = block_row * block_height
+        col_off = block_col * block_width
+        window = Window(
+            col_off,
+            row_off,
+            min(block_width, width - col_off),
+            min(block_height, height - row_off),
+        )
+        with rasterio.Env(**env):
+            data = pool.get(source).read(bands, window=window, masked=True)
+        sampled = data[:, rows[group] - row_off, cols[group] - col_off]
+        # Each group owns distinct points, so the threads write disjoint columns.
+        values[:, group] = sampled.astype("float64").filled(np.nan)
+
+    try:
+        _run_parallel(groups, read_block, num_workers)
+    finally:
+        pool.close()
+
+    if columns is None:
+        columns = [f"band_{band}" for band in bands]
+    elif len(columns) != len(bands):
+        raise ValueError("columns must have the same length as bands.")
+
+    if isinstance(points, gpd.GeoDataFrame):
+        result = points.copy()
+    else:
+        result = pd.DataFrame({"x": xs, "y": ys})
+    for name, column in zip(columns, values):
+        result[name] = column
+    return result
 
 
 def xy_to_window(xy) -> Tuple[float, float, float, float]:
@@ -10518,13 +12348,14 @@ def map_tiles_to_geotiff(
     """
     import concurrent.futures
     import io
-    import itertools
     import math
     import re
 
     import numpy
     from PIL import Image
 
+    from . import tilegrid
+
     try:
         from osgeo import gdal, osr
     except ImportError:
@@ -10588,31 +12419,6 @@ def map_tiles_to_geotiff(
             'source must be one of "OpenStreetMap", "ROADMAP", "SATELLITE", "TERRAIN", "HYBRID", or a URL'
         )
 
-    # Web Mercator tile size in meters at zoom level 0
-    MERCATOR_ZOOM_0_RESOLUTION_M = 156543.03392804097
-
-    def resolution_to_zoom_level(resolution):
-        """
-        Convert map resolution in meters to zoom level for Web Mercator (EPSG:3857) tiles.
-        """
-        initial_resolution = MERCATOR_ZOOM_0_RESOLUTION_M
-
-        # Calculate the zoom level
-        zoom_level = math.log2(initial_resolution / resolution)
-
-        return int(zoom_level)
-
-    def zoom_level_to_resolution(zoom):
-        """
-        Convert map zoom level to resolution in meters for Web Mercator (EPSG:3857) tiles.
-        """
-        initial_resolution = MERCATOR_ZOOM_0_RESOLUTION_M
-
-        # Calculate resolution
-        resolution_m = initial_resolution / (2**zoom)
-
-        return resolution_m
-
     if isinstance(bbox, list) and len(bbox) == 4:
         west, south, east, north = bbox
     else:
@@ -10627,12 +12433,10 @@ def map_tiles_to_geotiff(
         raise ValueError("Only one of zoom or resolution can be provided")
 
     elif (zoom is None) and (resolution is not None):
-        zoom = resolution_to_zoom_level(resolution)
+        zoom = int(tilegrid.resolution_to_zoom(resolution))
     else:
         # condition: (resolution is None) and (zoom is not None):
-        resolution = zoom_level_to_resolution(zoom)
-
-    EARTH_EQUATORIAL_RADIUS = 6378137.0
+        resolution = float(tilegrid.zoom_to_resolution(zoom))
 
     Image.MAX_IMAGE_PIXELS = None
 
@@ -10653,20 +12457,6 @@ def map_tiles_to_geotiff(
 
     WKT_3857 = web_mercator.ExportToWkt()
 
-    def from4326_to3857(lat, lon):
-        xtile = math.radians(lon) * EARTH_EQUATORIAL_RADIUS
-        ytile = (
-            math.log(math.tan(math.radians(45 + lat / 2.0))) * EARTH_EQUATORIAL_RADIUS
-        )
-        return (xtile, ytile)
-
-    def deg2num(lat, lon, zoom):
-        lat_r = math.radians(lat)
-        n = 2**zoom
-        xtile = (lon + 180) / 360 * n
-        ytile = (1 - math.log(math.tan(lat_r) + 1 / math.cos(lat_r)) / math.pi) / 2 * n
-        return (xtile, ytile)
-
     def is_empty(im):
         extrema = im.getextrema()
         if len(extrema) >= 3:
@@ -10740,14 +12530,23 @@ def map_tiles_to_geotiff(
     def draw_tile(
         source, lat0, lon0, lat1, lon1, zoom, filename, quiet=False, **kwargs
     ):
-        x0, y0 = deg2num(lat0, lon0, zoom)
-        x1, y1 = deg2num(lat1, lon1, zoom)
-        x0, x1 = sorted([x0, x1])
-        y0, y1 = sorted([y0, y1])
+        xs, ys = tilegrid.lnglat_to_tile(
+            [lon0, lon1], [lat0, lat1], zoom, fractional=True
+        )
+        x0, x1 = sorted(xs.tolist())
+        y0, y1 = sorted(ys.tolist())
         corners = tuple(
-            itertools.product(
-                range(math.floor(x0), math.ceil(x1)),
-                range(math.floor(y0), math.ceil(y1)),
+            map(
+                tuple,
+                tilegrid.bbox_to_tiles(
+                    [
+                        min(lon0, lon1),
+                        min(lat0, lat1),
+                        max(lon0, lon1),
+                        max(lat0, lat1),
+                    ],
+                    zoom,
+                )[:, :2].tolist(),
             )
         )
         totalnum = len(corners)
@@ -10791,8 +12590,7 @@ def map_tiles_to_geotiff(
 
         gtiff.SetMetadata({"ZOOM_LEVEL": str(zoom), "RESOLUTION_M": str(resolution)})
 
-        xp0, yp0 = from4326_to3857(lat0, lon0)
-        xp1, yp1 = from4326_to3857(lat1, lon1)
+        (xp0, xp1), (yp0, yp1) = tilegrid.lnglat_to_meters([lon0, lon1], [lat0, lat1])
         pwidth = abs(xp1 - xp0) / img.size[0]
         pheight = abs(yp1 - yp0) / img.size[1]
         gtiff.SetGeoTransform((min(xp0, xp1), pwidth, 0, max(yp0, yp1), 0, -pheight))
@@ -14113,44 +15911,229 @@ def pmtiles_style(
     return style
 
 
+class _PolygonWriter:
+    """Writes (value, polygon) batches to a vector file as they are produced.
+
+    GeoParquet (.parquet, .geoparquet) is streamed through a pyarrow ParquetWriter
+    and GeoPackage (.gpkg) is appended to, so neither keeps the polygons in memory.
+    Other formats are collected and written by close().
+    """
+
+    def __init__(self, output: str, crs: Any = None, dst_crs: Any = None, **kwargs):
+        self.output = output
+        self.crs = crs
+        self.dst_crs = dst_crs
+        self.kwargs = kwargs
+        ext = os.path.splitext(output)[1].lower()
+        if ext in (".parquet", ".geoparquet"):
+            self.format = "parquet"
+        elif ext == ".gpkg":
+            self.format = "gpkg"
+        else:
+            self.format = None
+        self._writer = None
+        self._pending = []
+        self._count = 0
+
+    def _to_gdf(self, values, geoms):
+        import geopandas as gpd
+
+        gdf = gpd.GeoDataFrame({"value": values}, geometry=geoms, crs=self.crs)
+        if self.dst_crs is not None:
+            gdf = gdf.to_crs(self.dst_crs)
+        return gdf
+
+    def write(self, values, geoms) -> None:
+        """Write a batch of polygons and their raster values."""
+        if len(geoms) == 0:
+            return
+
+        gdf = self._to_gdf(values, geoms)
+        if self.format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            import shapely
+
+            table = pa.table(
+                {
+                    "value": gdf["value"].to_numpy(),
+                    "geometry": shapely.to_wkb(gdf.geometry.values),
+                }
+            )
+            if self._writer is None:
+                crs = gdf.crs.to_json_dict() if gdf.crs is not None else None
+                geo = {
+                    "version": "1.0.0",
+                    "primary_column": "geometry",
+                    "columns": {
+                        "geometry": {
+                            "encoding": "WKB",
+                            "geometry_types": ["Polygon"],
+                            "crs": crs,
+                        }
+                    },
+                }
+                schema = table.schema.with_metadata({"geo": json.dumps(geo)})
+                self._writer = pq.ParquetWriter(self.output, schema, **self.kwargs)
+            self._writer.write_table(table.cast(self._writer.schema))
+        elif self.format == "gpkg":
+            gdf.to_file(
+                self.output,
+                driver="GPKG",
+                mode="a" if self._count else "w",
+                **self.kwargs,
+            )
+        else:
+            self._pending.append(gdf)
+        self._count += len(gdf)
+
+    def close(self) -> None:
+        """Finish the output file, writing an empty layer if no polygon was written."""
+        import pandas as pd
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self._pending:
+            gdf = pd.concat(self._pending, ignore_index=True)
+            self._pending = []
+            gdf.to_file(self.output, **self.kwargs)
+        elif self._count == 0:
+            gdf = self._to_gdf(np.array([], dtype="float64"), [])
+            if self.format == "parquet":
+                gdf.to_parquet(self.output, index=False)
+            else:
+                gdf.to_file(self.output, **self.kwargs)
+
+
 def raster_to_vector(
-    source, output, simplify_tolerance=None, dst_crs=None, open_args={}, **kwargs
+    source,
+    output,
+    simplify_tolerance=None,
+    dst_crs=None,
+    open_args={},
+    block_size=None,
+    num_workers=None,
+    min_area=None,
+    **kwargs,
 ):
     """Vectorize a raster dataset.
 
+    Pixels with a value of 0 are treated as background. When block_size is set, the
+    first band is polygonized window by window across a thread pool. Polygons that
+    do not touch a window edge are written as soon as their window is done, and only
+    those touching an edge are kept and dissolved with their neighbours at the end,
+    so large classification maps never have to fit in memory.
+
     Args:
         source (str): The path to the tiff file.
-        output (str): The path to the vector file.
+        output (str): The path to the vector file. GeoParquet (.parquet) and GeoPackage
+            (.gpkg) outputs are written incrementally.
         simplify_tolerance (float, optional): The maximum allowed geometry displacement.
             The higher this value, the smaller the number of vertices in the resulting geometry.
-    """
-    import geopandas as gpd
+        dst_crs (str, optional): The CRS of the output vector. Defaults to None, using the raster CRS.
+        open_args (dict, optional): The arguments for rasterio.open(). Defaults to {}.
+        block_size (int, optional): The size of the windows in pixels. Defaults to None,
+            which polygonizes the whole raster at once.
+        num_workers (int, optional): The number of threads processing windows. Defaults to
+            None, which uses the number of CPUs.
+        min_area (float, optional): Drop polygons smaller than this area, in the units of the
+            raster CRS. Defaults to None.
+        **kwargs: Additional keyword arguments for the output writer.
+    """
+    import threading
+
     import rasterio
     import shapely
     from rasterio import features
 
     with rasterio.open(source, **open_args) as src:
-        band = src.read()
+        width, height = src.width, src.height
+        transform = src.transform
+        crs = src.crs
 
-        mask = band != 0
-        shapes = features.shapes(band, mask=mask, transform=src.transform)
+    if block_size is None:
+        windows = _block_windows(width, height, max(width, height, 1))
+        num_workers = 1
+    else:
+        windows = _block_windows(width, height, block_size)
 
-    fc = [
-        {"geometry": shapely.geometry.shape(shape), "properties": {"value": value}}
-        for shape, value in shapes
-    ]
-    if simplify_tolerance is not None:
-        for i in fc:
-            i["geometry"] = i["geometry"].simplify(tolerance=simplify_tolerance)
+    def to_map(geoms):
+        return shapely.transform(
+            geoms,
+            lambda xy: np.column_stack(
+                [
+                    transform.a * xy[:, 0] + transform.b * xy[:, 1] + transform.c,
+                    transform.d * xy[:, 0] + transform.e * xy[:, 1] + transform.f,
+                ]
+            ),
+        )
 
-    gdf = gpd.GeoDataFrame.from_features(fc)
-    if src.crs is not None:
-        gdf.set_crs(crs=src.crs, inplace=True)
+    def finish(values, geoms):
+        geoms = to_map(geoms)
+        if min_area is not None:
+            keep = shapely.area(geoms) >= min_area
+            values, geoms = values[keep], geoms[keep]
+        if simplify_tolerance is not None:
+            geoms = shapely.simplify(geoms, simplify_tolerance)
+            keep = ~shapely.is_empty(geoms)
+            values, geoms = values[keep], geoms[keep]
+        return values, geoms
+
+    writer = _PolygonWriter(output, crs=crs, dst_crs=dst_crs, **kwargs)
+    pool = _DatasetPool(**open_args)
+    lock = threading.Lock()
+    seam_values = []
+    seam_geoms = []
+
+    def polygonize(window):
+        band = pool.get(source).read(1, window=window)
+        mask = band != 0
+        if not mask.any():
+            return
 
-    if dst_crs is not None:
-        gdf = gdf.to_crs(dst_crs)
+        shapes = list(features.shapes(band, mask=mask))
+        values = np.array([value for _, value in shapes], dtype="float64")
+        # Polygons are built in global pixel coordinates, so the edges shared by
+        # neighbouring windows have identical vertices and dissolve exactly.
+        geoms = shapely.transform(
+            np.array([shapely.geometry.shape(shape) for shape, _ in shapes]),
+            lambda xy: xy + (window.col_off, window.row_off),
+        )
+        bounds = shapely.bounds(geoms)
+        on_seam = (
+            ((bounds[:, 0] == window.col_off) & (window.col_off > 0))
+            | ((bounds[:, 1] == window.row_off) & (window.row_off > 0))
+            | (
+                (bounds[:, 2] == window.col_off + window.width)
+                & (window.col_off + window.width < width)
+            )
+            | (
+                (bounds[:, 3] == window.row_off + window.height)
+                & (window.row_off + window.height < height)
+            )
+        )
 
-    gdf.to_file(output, **kwargs)
+        done_values, done_geoms = finish(values[~on_seam], geoms[~on_seam])
+        with lock:
+            seam_values.append(values[on_seam])
+            seam_geoms.append(geoms[on_seam])
+            writer.write(done_values, done_geoms)
+
+    try:
+        _run_parallel(windows, polygonize, num_workers)
+
+        if seam_geoms:
+            values = np.concatenate(seam_values)
+            geoms = np.concatenate(seam_geoms)
+            for value in np.unique(values):
+                parts = shapely.get_parts(shapely.union_all(geoms[values == value]))
+                # Drop the collinear vertices left where windows were joined.
+                parts = shapely.simplify(parts, 0)
+                writer.write(*finish(np.full(len(parts), value), parts))
+    finally:
+        pool.close()
+        writer.close()
 
 
 def overlay_images(
@@ -15404,14 +17387,10 @@ def assign_discrete_colors(
     # Map colors to the categorical values
     category_column = category_column.map(cmap)
 
-    values = category_column.values.tolist()
-
     if to_rgb:
-        values = [hex_to_rgb(check_color(color)) for color in values]
-        if return_type == "array":
-            values = np.array(values, dtype=np.uint8)
+        return _colors_to_rgb(category_column.values, return_type)
 
-    return values
+    return category_column.values.tolist()
 
 
 def assign_continuous_colors(
@@ -15453,12 +17432,10 @@ def assign_continuous_colors(
     new_df, legend = classify(
         data, column, cmap, colors, labels, scheme, k, legend_kwds, classification_kwds
     )
-    values = new_df["color"].values.tolist()
-
     if to_rgb:
-        values = [hex_to_rgb(check_color(color)) for color in values]
-        if return_type == "array":
-            values = np.array(values, dtype=np.uint8)
+        values = _colors_to_rgb(new_df["color"].values, return_type)
+    else:
+        values = new_df["color"].values.tolist()
 
     if return_legend:
         return values, legend
@@ -16397,10 +18374,7 @@ def convert_coordinates(
     Returns:
         A tuple containing the converted longitude and latitude.
     """
-    import pyproj
-
-    # Create the transformer
-    transformer = pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+    transformer = get_transformer(source_crs, target_crs, always_xy=True)
 
     # Perform the transformation
     lon, lat = transformer.transform(x, y)  # pylint: disable=E0633
@@ -17902,7 +19876,7 @@ def read_geojson(data: str, **kwargs: Any) -> Dict[str, Any]:
         Dict[str, Any]: The parsed GeoJSON data.
     """
 
-    return requests.get(data, **kwargs).json()
+    return httpcache.get(data, **kwargs).json()
 
 
 def get_max_pixel_coords(
@@ -18748,82 +20722,84 @@ def color_code_dataframe(
             nodata_color = legend_dict[key]
             break
 
-    # Function to get color based on numeric value and range legend
-    def get_color_for_numeric(value: Any) -> Optional[str]:
-        """Maps a numeric value to a color based on the range legend.
-
-        Args:
-            value: The value to map to a color
-
-        Returns:
-            The corresponding color code or None if no match is found
-        """
-        if pd.isna(value) or value is None:
-            return nodata_color
-
-        if not isinstance(value, (int, float)):
-            return nodata_color
-
+    if is_range_legend:
+        # Parse the range strings like "[ 182913, 357522]" or "( 357522, 415584]" once
+        ranges = []
         for range_str, color in legend_dict.items():
             # Skip the Nodata entry
             if isinstance(range_str, str) and range_str.lower() == "nodata":
                 continue
-
-            # Parse the range string like "[ 182913, 357522]" or "( 357522, 415584]"
             match = re.search(r"[\[\(]\s*(\d+),\s*(\d+)[\]\)]", range_str)
             if not match:
                 continue
-
-            lower_bound = int(match.group(1))
-            upper_bound = int(match.group(2))
-            lower_inclusive = range_str.startswith("[")
-            upper_inclusive = range_str.endswith("]")
-
-            # Check if the value is within the range
-            above_lower = (
-                value >= lower_bound if lower_inclusive else value > lower_bound
-            )
-            below_upper = (
-                value <= upper_bound if upper_inclusive else value < upper_bound
+            ranges.append(
+                (
+                    int(match.group(1)),
+                    int(match.group(2)),
+                    range_str.startswith("["),
+                    range_str.endswith("]"),
+                    color,
+                )
             )
+    else:
+        # Lowercased category -> color, where an exact lowercase key takes
+        # precedence over a case-insensitive match.
+        category_lookup = {}
+        for cat, color in legend_dict.items():
+            if not isinstance(cat, str):
+                continue
+            if cat.lower() != "nodata":
+                category_lookup.setdefault(cat.lower(), color)
+        for cat, color in legend_dict.items():
+            if isinstance(cat, str) and cat == cat.lower():
+                category_lookup[cat] = color
 
-            if above_lower and below_upper:
-                return color
-
-        return None
-
-    # Function to get color based on categorical value
-    def get_color_for_categorical(value: Any) -> Optional[str]:
-        """Maps a categorical value to a color.
+    def get_colors_for_numeric(series: pd.Series) -> np.ndarray:
+        """Maps a numeric column to colors based on the range legend.
 
         Args:
-            value: The value to map to a color
+            series: The column to map to colors
 
         Returns:
-            The corresponding color code or None if no match is found
+            An object array of color codes, None where no range matches
         """
-        if pd.isna(value) or value is None:
-            return nodata_color
-
-        # Convert to string for comparison
-        str_value = str(value).lower()
-
-        # Try direct matching
-        if str_value in legend_dict:
-            return legend_dict[str_value]
+        if pd.api.types.is_numeric_dtype(series):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = series.map(
+                lambda v: v if isinstance(v, (int, float)) else np.nan
+            ).to_numpy(dtype=float)
+
+        nodata_mask = np.isnan(values)
+        colors = np.full(len(values), None, dtype=object)
+        assigned = nodata_mask.copy()
+        for lower, upper, lower_inclusive, upper_inclusive, color in ranges:
+            above_lower = values >= lower if lower_inclusive else values > lower
+            below_upper = values <= upper if upper_inclusive else values < upper
+            # The first matching range wins, as in the legend order
+            mask = above_lower & below_upper & ~assigned
+            colors[mask] = color
+            assigned |= mask
+        colors[nodata_mask] = nodata_color
+        return colors
 
-        # Try case-insensitive matching
-        for cat, color in legend_dict.items():
-            if isinstance(cat, str) and cat.lower() == "nodata":
-                continue
+    def get_colors_for_categorical(series: pd.Series) -> np.ndarray:
+        """Maps a categorical column to colors, looking up each unique value once.
 
-            if isinstance(cat, str) and cat.lower() == str_value:
-                return color
+        Args:
+            series: The column to map to colors
 
-        return None
+        Returns:
+            An object array of color codes, None where no category matches
+        """
+        codes, uniques = pd.factorize(series)
+        palette = [category_lookup.get(str(value).lower()) for value in uniques]
+        return _palette_lookup(codes, palette, nodata=nodata_color)
 
     # Select appropriate color mapping function
-    get_color = get_color_for_numeric if is_range_legend else get_color_for_categorical
+    get_colors = (
+        get_colors_for_numeric if is_range_legend else get_colors_for_categorical
+    )
 
     # Identify columns to process
     if is_range_legend:
@@ -18858,7 +20834,7 @@ def color_code_dataframe(
 
     # Replace each value with its corresponding color
     for col in columns_to_process:
-        df[col] = df[col].apply(get_color)
+        df[col] = get_colors(df[col])
 
     return df
 
@@ -19032,6 +21008,8 @@ def read_vector(source, layer=None, **kwargs: Any):
     import fiona
     import geopandas as gpd
 
+    source = httpcache.cached_path(source)
+
     # Determine if source is a URL or local file
     parsed_url = urllib.parse.urlparse(source)
     is_url = parsed_url.scheme in ["http", "https"]
@@ -19607,16 +21585,153 @@ def add_unique_class(
     return gdf
 
 
+def _is_valid_cog(path: str) -> bool:
+    """Check whether a file is a valid Cloud Optimized GeoTIFF, if rio-cogeo is available.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        bool: True if the file is a valid COG, False if it is not or cannot be validated.
+    """
+    try:
+        from rio_cogeo.cogeo import cog_validate
+    except ImportError:
+        return False
+
+    try:
+        return cog_validate(path, quiet=True)[0]
+    except Exception:
+        return False
+
+
+def _cog_options(path: str) -> Optional[List[str]]:
+    """Read the gdal_translate options recorded in a COG written by convert_to_cog().
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        list: The recorded options, an empty list if none were recorded, or None if
+            the file cannot be read.
+    """
+    import rasterio
+
+    try:
+        with rasterio.open(path) as src:
+            value = src.tags().get("LEAFMAP_COG_OPTIONS")
+        return json.loads(value) if value else []
+    except (rasterio.errors.RasterioError, ValueError):
+        return None
+
+
+def _convert_file_to_cog(
+    tif: str,
+    out_file: str,
+    options: List[str],
+    cache_max: int = 512,
+    skip_valid: bool = True,
+    overwrite: bool = False,
+) -> Dict[str, Any]:
+    """Convert one GeoTIFF to a COG with gdal_translate, skipping work when possible.
+
+    Args:
+        tif (str): The input GeoTIFF.
+        out_file (str): The output COG.
+        options (list): The gdal_translate creation options.
+        cache_max (int, optional): The GDAL block cache of the gdal_translate process, in MB.
+            Defaults to 512.
+        skip_valid (bool, optional): Whether to copy inputs that are already valid COGs
+            instead of converting them. Ignored when options are given, since a copy
+            would not apply them. Defaults to True.
+        overwrite (bool, optional): Whether to convert again when the output already exists,
+            is newer than the input, is a valid COG and was written with the same
+            options. Defaults to False.
+
+    Returns:
+        dict: The input, output, status ("converted", "copied" or "skipped") and seconds.
+    """
+    import time
+
+    start = time.time()
+    status = "converted"
+
+    if (
+        not overwrite
+        and os.path.exists(out_file)
+        and os.path.getmtime(out_file) >= os.path.getmtime(tif)
+        and _cog_options(out_file) == list(options)
+        and _is_valid_cog(out_file)
+    ):
+        status = "skipped"
+    else:
+        # Written under a temporary name and renamed, so an interrupted run never
+        # leaves a truncated COG behind that a later run would skip.
+        temp_file = os.path.join(
+            os.path.dirname(out_file),
+            f".{random_string(6)}_{os.path.basename(out_file)}",
+        )
+        try:
+            if skip_valid and not options and _is_valid_cog(tif):
+                shutil.copyfile(tif, temp_file)
+                status = "copied"
+            else:
+                cmd = [
+                    "gdal_translate",
+                    tif,
+                    temp_file,
+                    "-of",
+                    "COG",
+                    "-co",
+                    "COMPRESS=DEFLATE",
+                    "--config",
+                    "GDAL_CACHEMAX",
+                    str(cache_max),
+                ]
+                cmd.extend(options)
+                if options:
+                    # Recorded in the output, so a later run skips it only when
+                    # the same options are requested.
+                    cmd.extend(["-mo", f"LEAFMAP_COG_OPTIONS={json.dumps(options)}"])
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+            os.replace(temp_file, out_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    return {
+        "input": tif,
+        "output": out_file,
+        "status": status,
+        "seconds": round(time.time() - start, 3),
+    }
+
+
 def convert_to_cog(
     images: str,
     output_dir: str,
     prefix: str = "",
     suffix: str = "_cog",
     extra_options: Optional[List[str]] = None,
-):
+    num_workers: Optional[int] = None,
+    cache_max: int = 512,
+    skip_valid: bool = True,
+    overwrite: bool = False,
+    raise_on_error: bool = True,
+    quiet: bool = False,
+) -> pd.DataFrame:
     """
     Convert all .tif files in a directory to Cloud Optimized GeoTIFFs (COGs).
 
+    Each file is converted by its own gdal_translate process, and up to num_workers
+    of them run at the same time. Inputs that are already valid COGs are copied when
+    no extra_options are given, and outputs that are newer than their input, valid and
+    written with the same extra_options are left alone, so an interrupted batch can be
+    re-run cheaply. A file that fails to convert does not stop the batch: once all the
+    files are processed, a RuntimeError listing the failures is raised, or with
+    raise_on_error=False they are reported with the "failed" status and their error
+    in the returned DataFrame.
+
     Args:
         images (str | list): Input directory containing .tif files, or a list of .tif file paths.
         output_dir (str): Path to the output directory where COGs will be saved.
@@ -19624,13 +21739,30 @@ def convert_to_cog(
         suffix (str): Suffix to add to the output filenames before the .tif extension.
         extra_options (List[str], optional): Additional gdal_translate options.
             Example: ["-co", "TILED=YES", "-co", "BLOCKSIZE=512"]
+        num_workers (int, optional): The number of concurrent conversions. Defaults to None,
+            which uses the number of CPUs.
+        cache_max (int, optional): The GDAL block cache of each conversion, in MB. Defaults to 512.
+        skip_valid (bool, optional): Whether to copy inputs that are already valid COGs
+            instead of converting them. Requires rio-cogeo, and only applies when
+            extra_options is empty. Defaults to True.
+        overwrite (bool, optional): Whether to convert files whose valid output already
+            exists. Defaults to False.
+        raise_on_error (bool, optional): Whether to raise a RuntimeError after the batch
+            when any file failed to convert. The DataFrame of all the files is attached
+            to the error as its results attribute. Defaults to True.
+        quiet (bool, optional): Whether to hide the per-file progress. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The input, output, status ("converted", "copied", "skipped" or
+            "failed"), seconds and error of each file.
     """
     import glob
+    from concurrent.futures import ThreadPoolExecutor
 
     os.makedirs(output_dir, exist_ok=True)
 
     if isinstance(images, str):
-        tif_files = glob.glob(os.path.join(images, "*.tif"))
+        tif_files = sorted(glob.glob(os.path.join(images, "*.tif")))
     elif isinstance(images, list):
         tif_files = [tif for tif in images if tif.endswith(".tif")]
     else:
@@ -19639,15 +21771,68 @@ def convert_to_cog(
     if extra_options is None:
         extra_options = []
 
-    for tif in tif_files:
-        base = os.path.splitext(os.path.basename(tif))[0]
-        out_file = os.path.join(output_dir, f"{prefix}{base}{suffix}.tif")
+    out_files = [
+        os.path.join(
+            output_dir,
+            f"{prefix}{os.path.splitext(os.path.basename(tif))[0]}{suffix}.tif",
+        )
+        for tif in tif_files
+    ]
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(tif_files) or 1))
+
+    records = []
+    # Each conversion runs in its own gdal_translate process, so threads are enough
+    # to keep num_workers of them busy.
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(
+                _convert_file_to_cog,
+                tif,
+                out_file,
+                extra_options,
+                cache_max,
+                skip_valid,
+                overwrite,
+            )
+            for tif, out_file in zip(tif_files, out_files)
+        ]
+        for index, (tif, out_file, future) in enumerate(
+            zip(tif_files, out_files, futures)
+        ):
+            try:
+                record = future.result()
+            except (subprocess.CalledProcessError, OSError) as e:
+                record = {
+                    "input": tif,
+                    "output": out_file,
+                    "status": "failed",
+                    "seconds": None,
+                    "error": str(getattr(e, "stderr", None) or e).strip(),
+                }
+                if not quiet:
+                    print(f"Failed: {tif}: {record['error']}")
+            else:
+                if not quiet:
+                    print(
+                        f"[{index + 1}/{len(tif_files)}] {record['status'].capitalize()}: "
+                        f"{tif} -> {out_file} ({record['seconds']:.2f} s)"
+                    )
+            records.append(record)
 
-        cmd = ["gdal_translate", tif, out_file, "-of", "COG", "-co", "COMPRESS=DEFLATE"]
-        cmd.extend(extra_options)
+    results = pd.DataFrame(
+        records, columns=["input", "output", "status", "seconds", "error"]
+    )
+    failed = results[results["status"] == "failed"]
+    if raise_on_error and len(failed):
+        details = "\n".join(f"{row.input}: {row.error}" for row in failed.itertuples())
+        error = RuntimeError(f"Failed to convert {len(failed)} file(s):\n{details}")
+        error.results = results
+        raise error
 
-        print(f"Converting: {tif} -> {out_file}")
-        subprocess.run(cmd, check=True)
+    return results
 
 
 def start_martin(
@@ -19938,7 +22123,7 @@ def get_wayback_layers(url: str = None) -> dict:
     if url is None:
         url = "https://wayback.maptiles.arcgis.com/arcgis/rest/services/world_imagery/mapserver/wmts/1.0.0/wmtscapabilities.xml"
 
-    response = requests.get(url)
+    response = httpcache.get(url)
     response.raise_for_status()
 
     root = ET.fromstring(response.content)
@@ -118,7 +118,7 @@ class Map(lonboard.Map):
         zoom_to_layer: bool = True,
         pickable: bool = True,
         color_column: Optional[str] = None,
-        color_scheme: Optional[str] = "Quantiles",
+        color_scheme: Optional[str] = None,
         color_map: Optional[Union[str, Dict]] = None,
         color_k: Optional[int] = 5,
         color_args: dict = {},
@@ -135,7 +135,7 @@ class Map(lonboard.Map):
             pickable (bool, optional): Flag to enable picking on the added layer. Defaults to True.
             color_column (Optional[str], optional): The column to be used for color encoding. Defaults to None.
             color_map (Optional[Union[str, Dict]], optional): The color map to use for color encoding. It can be a string or a dictionary. Defaults to None.
-            color_scheme (Optional[str], optional): The color scheme to use for color encoding. Defaults to "Quantiles".
+            color_scheme (Optional[str], optional): The color scheme to use for color encoding. Defaults to None.
                 Name of a choropleth classification scheme (requires mapclassify).
                 A mapclassify.MapClassifier object will be used
                 under the hood. Supported are all schemes provided by mapclassify (e.g.
@@ -143,7 +143,9 @@ class Map(lonboard.Map):
                 'HeadTailBreaks', 'JenksCaspall', 'JenksCaspallForced',
                 'JenksCaspallSampled', 'MaxP', 'MaximumBreaks',
                 'NaturalBreaks', 'Quantiles', 'Percentiles', 'StdMean',
-                'UserDefined'). Arguments can be passed in classification_kwds.
+                'UserDefined'). Used when color_map is a colormap name to color the
+                features by class. When None, the values are mapped through the
+                colormap continuously.
             color_k (Optional[int], optional): The number of classes to use for color encoding. Defaults to 5.
             color_args (dict, optional): Additional keyword arguments that will be passed to assign_continuous_colors(). Defaults to {}.
             zoom (Optional[float], optional): The zoom level to zoom to. Defaults to 10.0.
@@ -159,11 +161,31 @@ class Map(lonboard.Map):
         geom_type = gdf.geometry.iloc[0].geom_type
         kwargs["pickable"] = pickable
 
+        class_colors = None
+        if (
+            color_column is not None
+            and isinstance(color_map, str)
+            and color_scheme is not None
+        ):
+            # Classify the column values once and look the colors up by class
+            # code, instead of mapping every value through the colormap.
+            classified, _ = common.classify(
+                gdf[[color_column]],
+                color_column,
+                cmap=color_map,
+                scheme=color_scheme,
+                k=color_k,
+            )
+            codes, palette = common._class_palette(classified)
+            class_colors = common._class_rgba(codes, palette, alpha)
+
         if geom_type in ["Point", "MultiPoint"]:
             if "get_radius" not in kwargs:
                 kwargs["get_radius"] = 10
             if color_column is not None:
-                if isinstance(color_map, str):
+                if class_colors is not None:
+                    kwargs["get_fill_color"] = class_colors
+                elif isinstance(color_map, str):
                     kwargs["get_fill_color"] = apply_continuous_cmap(
                         gdf[color_column], color_map, alpha, rescale
                     )
@@ -179,7 +201,9 @@ class Map(lonboard.Map):
             if "get_width" not in kwargs:
                 kwargs["get_width"] = 5
             if color_column is not None:
-                if isinstance(color_map, str):
+                if class_colors is not None:
+                    kwargs["get_color"] = class_colors
+                elif isinstance(color_map, str):
                     cmap = plt.get_cmap(color_map)
                     kwargs["get_color"] = apply_continuous_cmap(
                         gdf[color_column], cmap, alpha, rescale
@@ -191,7 +215,9 @@ class Map(lonboard.Map):
             layer = PathLayer.from_geopandas(gdf, **kwargs)
         elif geom_type in ["Polygon", "MultiPolygon"]:
             if color_column is not None:
-                if isinstance(color_map, str):
+                if class_colors is not None:
+                    kwargs["get_fill_color"] = class_colors
+                elif isinstance(color_map, str):
                     kwargs["get_fill_color"] = apply_continuous_cmap(
                         gdf[color_column], color_map, alpha, rescale
                     )
@@ -231,7 +257,7 @@ class Map(lonboard.Map):
         zoom_to_layer: bool = True,
         pickable: bool = True,
         color_column: Optional[str] = None,
-        color_scheme: Optional[str] = "Quantiles",
+        color_scheme: Optional[str] = None,
         color_map: Optional[Union[str, Dict]] = None,
         color_k: Optional[int] = 5,
         color_args: dict = {},
@@ -246,7 +272,7 @@ class Map(lonboard.Map):
             pickable (bool, optional): Flag to enable picking on the added layer. Defaults to True.
             color_column (Optional[str], optional): The column to be used for color encoding. Defaults to None.
             color_map (Optional[Union[str, Dict]], optional): The color map to use for color encoding. It can be a string or a dictionary. Defaults to None.
-            color_scheme (Optional[str], optional): The color scheme to use for color encoding. Defaults to "Quantiles".
+            color_scheme (Optional[str], optional): The color scheme to use for color encoding. Defaults to None.
                 Name of a choropleth classification scheme (requires mapclassify).
                 A mapclassify.MapClassifier object will be used
                 under the hood. Supported are all schemes provided by mapclassify (e.g.
@@ -254,7 +280,9 @@ class Map(lonboard.Map):
                 'HeadTailBreaks', 'JenksCaspall', 'JenksCaspallForced',
                 'JenksCaspallSampled', 'MaxP', 'MaximumBreaks',
                 'NaturalBreaks', 'Quantiles', 'Percentiles', 'StdMean',
-                'UserDefined'). Arguments can be passed in classification_kwds.
+                'UserDefined'). Used when color_map is a colormap name to color the
+                features by class. When None, the values are mapped through the
+                colormap continuously.
             color_k (Optional[int], optional): The number of classes to use for color encoding. Defaults to 5.
             color_args (dict, optional): Additional keyword arguments that will be passed to assign_continuous_colors(). Defaults to {}.
             open_args (dict, optional): Additional keyword arguments that will be passed to geopandas.read_file(). Defaults to {}.
@@ -145,12 +145,76 @@ def _normalize_datetime(datetime_str: str) -> str:
         return datetime_str
 
 
+# Directory and lifetime (in seconds) of the on-disk cache of fetched pages
+FIRE_CACHE_DIR = os.getenv(
+    "LEAFMAP_FIRE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "leafmap", "fire"),
+)
+FIRE_CACHE_TTL = int(os.getenv("LEAFMAP_FIRE_CACHE_TTL", "3600"))
+
+
+def _cache_path(url: str, params: Dict[str, Any]) -> str:
+    """Return the cache file of a query, keyed by its URL and parameters."""
+    import hashlib
+    import json
+
+    key = json.dumps([url, sorted(params.items())], default=str)
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(FIRE_CACHE_DIR, f"{digest}.json")
+
+
+def _read_cached_page(path: str, ttl: int) -> Optional[Dict[str, Any]]:
+    """Return a cached page if it exists and is younger than ``ttl`` seconds."""
+    import json
+    import time
+
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_page(path: str, data: Dict[str, Any]) -> None:
+    """Write a page to the cache."""
+    import json
+    import tempfile
+
+    os.makedirs(FIRE_CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=FIRE_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _prune_cached_pages(ttl: int) -> None:
+    """Remove the cached pages older than ``ttl`` and FIRE_CACHE_TTL seconds."""
+    import time
+
+    if not os.path.isdir(FIRE_CACHE_DIR):
+        return
+    now = time.time()
+    for name in os.listdir(FIRE_CACHE_DIR):
+        cached = os.path.join(FIRE_CACHE_DIR, name)
+        try:
+            if name.endswith(".json") and now - os.path.getmtime(cached) > max(
+                ttl, FIRE_CACHE_TTL
+            ):
+                os.remove(cached)
+        except OSError:
+            pass
+
+
 def _fetch_fire_features(
     collection_id: str,
     bbox: Optional[List[float]] = None,
     datetime: Optional[str] = None,
     limit: int = 1000,
     offset: int = 0,
+    cql_filter: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Fetch features from OGC API with pagination support.
 
@@ -160,11 +224,14 @@ def _fetch_fire_features(
         datetime: ISO 8601 date/time or interval (e.g., "2024-07-01/2024-07-31").
         limit: Maximum number of features to return per request.
         offset: Number of features to skip (for pagination).
+        cql_filter: A CQL2 text filter evaluated by the API.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
+            Defaults to FIRE_CACHE_TTL. Use 0 to bypass the cache.
 
     Returns:
         GeoJSON FeatureCollection dictionary.
     """
-    import requests
+    from .httpcache import get_session
 
     # Resolve collection alias to full ID
     resolved_collection = _resolve_collection(collection_id)
@@ -179,10 +246,171 @@ def _fetch_fire_features(
         # Normalize datetime to full ISO 8601 format
         params["datetime"] = _normalize_datetime(datetime)
 
-    response = requests.get(url, params=params, timeout=60)
+    if cql_filter:
+        params["filter"] = cql_filter
+        params["filter-lang"] = "cql2-text"
+
+    if cache_ttl is None:
+        cache_ttl = FIRE_CACHE_TTL
+    cache_path = _cache_path(url, params)
+    if cache_ttl > 0:
+        data = _read_cached_page(cache_path, cache_ttl)
+        if data is not None:
+            return data
+
+    response = get_session().get(url, params=params, timeout=60)
     response.raise_for_status()
+    data = response.json()
+
+    if cache_ttl > 0:
+        _write_cached_page(cache_path, data)
+
+    return data
+
+
+def _cql2_filter(
+    farea_min: Optional[float] = None,
+    farea_max: Optional[float] = None,
+    duration_min: Optional[float] = None,
+    duration_max: Optional[float] = None,
+    meanfrp_min: Optional[float] = None,
+    fire_id: Optional[Union[str, int]] = None,
+) -> Optional[str]:
+    """Build a CQL2 text filter equivalent to the client-side filters.
+
+    Returns:
+        The CQL2 expression, or None if no filter is set.
+    """
+    conditions = []
+    for column, operator, value in [
+        ("farea", ">=", farea_min),
+        ("farea", "<=", farea_max),
+        ("duration", ">=", duration_min),
+        ("duration", "<=", duration_max),
+        ("meanfrp", ">=", meanfrp_min),
+    ]:
+        if value is not None:
+            conditions.append(f"{column} {operator} {float(value)}")
+    if fire_id is not None:
+        if str(fire_id).isdigit():
+            conditions.append(f"fireid = {int(fire_id)}")
+        else:
+            quoted = str(fire_id).replace("'", "''")
+            conditions.append(f"fireid = '{quoted}'")
+    return " AND ".join(conditions) or None
+
+
+def _fetch_all_fire_features(
+    collection_id: str,
+    bbox: Optional[List[float]] = None,
+    datetime: Optional[str] = None,
+    cql_filter: Optional[str] = None,
+    limit: int = 1000,
+    max_requests: int = 10,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch up to ``limit`` features, requesting the pages concurrently.
+
+    The first page reports ``numberMatched``, from which the offsets of the
+    remaining pages are known and fetched in parallel. If the API does not report
+    it, the pages are fetched one after another.
+
+    Args:
+        collection_id: The collection to query (alias or full ID).
+        bbox: Bounding box [west, south, east, north] in EPSG:4326.
+        datetime: ISO 8601 date/time or interval.
+        cql_filter: A CQL2 text filter evaluated by the API.
+        limit: Maximum total number of features to return.
+        max_requests: Maximum number of API requests.
+        max_workers: Maximum number of concurrent requests.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
+
+    Returns:
+        The list of GeoJSON features.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Use smaller page size when datetime filtering is used (API limitation)
+    max_page_size = 500 if datetime else 1000
+    page_limit = min(limit, max_page_size)
+
+    def fetch(offset):
+        return _fetch_fire_features(
+            collection_id=collection_id,
+            bbox=bbox,
+            datetime=datetime,
+            limit=page_limit,
+            offset=offset,
+            cql_filter=cql_filter,
+            cache_ttl=cache_ttl,
+        )
+
+    data = fetch(0)
+    features = list(data.get("features", []))
+    matched = data.get("numberMatched")
+
+    if len(features) < page_limit or max_requests <= 1:
+        return features[:limit]
+
+    if isinstance(matched, int):
+        total = min(matched, limit)
+        offsets = list(range(page_limit, total, page_limit))[: max_requests - 1]
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for page in executor.map(fetch, offsets):
+                features.extend(page.get("features", []))
+        return features[:limit]
+
+    offset = len(features)
+    requests_made = 1
+    while len(features) < limit and requests_made < max_requests:
+        page = fetch(offset).get("features", [])
+        if not page:
+            break
+        features.extend(page)
+        offset += len(page)
+        requests_made += 1
+        if len(page) < page_limit:
+            break
+    return features[:limit]
+
 
-    return response.json()
+def _fetch_filtered_fire_features(
+    collection_id: str,
+    filters: Dict[str, Any],
+    limit: int,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Fetch features with the filters pushed to the API as CQL2.
+
+    If the endpoint rejects the CQL2 filter, or ignores it and returns features
+    that do not match, the features are fetched unfiltered (three times ``limit``
+    to leave room for filtering) and the caller is expected to filter them on the
+    client side, which is always safe to repeat. Expired cached pages are pruned
+    once per query.
+    """
+    import pandas as pd
+    import requests
+
+    cache_ttl = kwargs.get("cache_ttl")
+    _prune_cached_pages(FIRE_CACHE_TTL if cache_ttl is None else cache_ttl)
+
+    cql_filter = _cql2_filter(**filters)
+    if cql_filter is None:
+        return _fetch_all_fire_features(collection_id, limit=limit, **kwargs)
+
+    try:
+        features = _fetch_all_fire_features(
+            collection_id, cql_filter=cql_filter, limit=limit, **kwargs
+        )
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code not in (400, 501):
+            raise
+    else:
+        properties = pd.DataFrame([f.get("properties") or {} for f in features])
+        if len(_apply_client_filters(properties, **filters)) == len(properties):
+            return features
+    return _fetch_all_fire_features(collection_id, limit=limit * 3, **kwargs)
 
 
 def _apply_client_filters(
@@ -243,9 +471,17 @@ def fire_gdf_from_bbox(
     meanfrp_min: Optional[float] = None,
     limit: int = 1000,
     max_requests: int = 10,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
 ) -> "gpd.GeoDataFrame":
     """Get fire perimeter data for a bounding box.
 
+    The filters are evaluated by the API as a CQL2 expression, and the pages of
+    results are requested concurrently. Fetched pages are cached on disk in
+    FIRE_CACHE_DIR (~/.cache/leafmap/fire, or the LEAFMAP_FIRE_CACHE_DIR
+    environment variable) and reused for cache_ttl seconds, so results can be
+    up to one hour stale by default. Pass cache_ttl=0 for fresh results.
+
     Args:
         bbox: Bounding box [west, south, east, north] in EPSG:4326.
         collection: Fire collection ID. One of:
@@ -262,6 +498,9 @@ def fire_gdf_from_bbox(
         meanfrp_min: Minimum mean Fire Radiative Power.
         limit: Maximum total number of features to return.
         max_requests: Maximum number of API requests for pagination.
+        max_workers: Maximum number of pages requested concurrently.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
+            Defaults to FIRE_CACHE_TTL (one hour). Use 0 to bypass the cache.
 
     Returns:
         A GeoDataFrame containing fire perimeter features.
@@ -284,42 +523,23 @@ def fire_gdf_from_bbox(
             "Install it with: pip install geopandas"
         )
 
-    # Determine if we need client-side filtering
-    has_filters = any(
-        x is not None
-        for x in [farea_min, farea_max, duration_min, duration_max, meanfrp_min]
+    filters = dict(
+        farea_min=farea_min,
+        farea_max=farea_max,
+        duration_min=duration_min,
+        duration_max=duration_max,
+        meanfrp_min=meanfrp_min,
+    )
+    all_features = _fetch_filtered_fire_features(
+        collection,
+        filters,
+        limit=limit,
+        bbox=bbox,
+        datetime=datetime,
+        max_requests=max_requests,
+        max_workers=max_workers,
+        cache_ttl=cache_ttl,
     )
-
-    # If filtering, fetch more data to account for filtering
-    fetch_limit = limit * 3 if has_filters else limit
-
-    all_features = []
-    offset = 0
-    # Use smaller page size when datetime filtering is used (API limitation)
-    max_page_size = 500 if datetime else 1000
-    page_limit = min(fetch_limit, max_page_size)
-    requests_made = 0
-
-    while len(all_features) < fetch_limit and requests_made < max_requests:
-        data = _fetch_fire_features(
-            collection_id=collection,
-            bbox=bbox,
-            datetime=datetime,
-            limit=page_limit,
-            offset=offset,
-        )
-
-        features = data.get("features", [])
-        if not features:
-            break
-
-        all_features.extend(features)
-        offset += len(features)
-        requests_made += 1
-
-        # Check if we got fewer features than requested (last page)
-        if len(features) < page_limit:
-            break
 
     if not all_features:
         # Return empty GeoDataFrame with expected columns
@@ -331,15 +551,8 @@ def fire_gdf_from_bbox(
     geojson = {"type": "FeatureCollection", "features": all_features}
     gdf = gpd.GeoDataFrame.from_features(geojson, crs="EPSG:4326")
 
-    # Apply client-side filters
-    gdf = _apply_client_filters(
-        gdf,
-        farea_min=farea_min,
-        farea_max=farea_max,
-        duration_min=duration_min,
-        duration_max=duration_max,
-        meanfrp_min=meanfrp_min,
-    )
+    # Apply client-side filters, in case the API could not evaluate them
+    gdf = _apply_client_filters(gdf, **filters)
 
     # Limit to requested number after filtering
     if len(gdf) > limit:
@@ -359,6 +572,8 @@ def fire_gdf_from_place(
     meanfrp_min: Optional[float] = None,
     limit: int = 1000,
     buffer_dist: Optional[float] = None,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
 ) -> "gpd.GeoDataFrame":
     """Get fire perimeter data for a place by name.
 
@@ -375,6 +590,8 @@ def fire_gdf_from_place(
         meanfrp_min: Minimum mean Fire Radiative Power.
         limit: Maximum number of features to return.
         buffer_dist: Distance to buffer around the place geometry, in meters.
+        max_workers: Maximum number of pages requested concurrently.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
 
     Returns:
         A GeoDataFrame containing fire perimeter features.
@@ -428,6 +645,8 @@ def fire_gdf_from_place(
         duration_max=duration_max,
         meanfrp_min=meanfrp_min,
         limit=limit,
+        max_workers=max_workers,
+        cache_ttl=cache_ttl,
     )
 
     return gdf
@@ -437,6 +656,9 @@ def get_fire_by_id(
     fire_id: Union[str, int],
     collection: str = "snapshot_perimeter_nrt",
     datetime: Optional[str] = None,
+    limit: int = 10000,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
 ) -> "gpd.GeoDataFrame":
     """Get a specific fire by its ID.
 
@@ -444,6 +666,9 @@ def get_fire_by_id(
         fire_id: The fire ID to retrieve (can be string or numeric).
         collection: Fire collection ID. Defaults to "snapshot_perimeter_nrt".
         datetime: ISO 8601 date/time or interval to filter by.
+        limit: Maximum number of features to return.
+        max_workers: Maximum number of pages requested concurrently.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
 
     Returns:
         A GeoDataFrame containing the fire perimeter.
@@ -456,14 +681,16 @@ def get_fire_by_id(
     except ImportError:
         raise ImportError("geopandas is required. Install with: pip install geopandas")
 
-    # Fetch all features and filter client-side
-    data = _fetch_fire_features(
-        collection_id=collection,
+    features = _fetch_filtered_fire_features(
+        collection,
+        {"fire_id": fire_id},
+        limit=limit,
         datetime=datetime,
-        limit=1000,
+        max_requests=-(-limit // 500),
+        max_workers=max_workers,
+        cache_ttl=cache_ttl,
     )
 
-    features = data.get("features", [])
     if not features:
         return gpd.GeoDataFrame(
             columns=["geometry", "fireid", "farea", "duration", "t"],
@@ -473,7 +700,7 @@ def get_fire_by_id(
     geojson = {"type": "FeatureCollection", "features": features}
     gdf = gpd.GeoDataFrame.from_features(geojson, crs="EPSG:4326")
 
-    # Apply client-side filter for fire_id
+    # Apply client-side filter for fire_id, in case the API could not evaluate it
     gdf = _apply_client_filters(gdf, fire_id=fire_id)
 
     return gdf
@@ -483,6 +710,8 @@ def fire_timeseries(
     fire_id: str,
     collection: str = "snapshot_perimeter_nrt",
     datetime: Optional[str] = None,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
 ) -> "gpd.GeoDataFrame":
     """Get fire perimeter evolution over time for a specific fire.
 
@@ -492,6 +721,8 @@ def fire_timeseries(
         fire_id: The fire ID to track.
         collection: Fire collection ID. Defaults to "snapshot_perimeter_nrt".
         datetime: ISO 8601 date/time or interval to filter by.
+        max_workers: Maximum number of pages requested concurrently.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
 
     Returns:
         A GeoDataFrame with perimeters sorted by time.
@@ -500,7 +731,13 @@ def fire_timeseries(
         >>> gdf = fire_timeseries("2024_CA_001")
         >>> print(f"Found {len(gdf)} perimeter snapshots")
     """
-    gdf = get_fire_by_id(fire_id=fire_id, collection=collection, datetime=datetime)
+    gdf = get_fire_by_id(
+        fire_id=fire_id,
+        collection=collection,
+        datetime=datetime,
+        max_workers=max_workers,
+        cache_ttl=cache_ttl,
+    )
 
     # Sort by time if available
     if not gdf.empty and "t" in gdf.columns:
@@ -520,6 +757,8 @@ def search_fires(
     duration_max: Optional[float] = None,
     meanfrp_min: Optional[float] = None,
     limit: int = 1000,
+    max_workers: int = 4,
+    cache_ttl: Optional[int] = None,
 ) -> "gpd.GeoDataFrame":
     """Search for fires with flexible filters.
 
@@ -537,6 +776,8 @@ def search_fires(
         duration_max: Maximum fire duration in days.
         meanfrp_min: Minimum mean Fire Radiative Power.
         limit: Maximum number of features to return.
+        max_workers: Maximum number of pages requested concurrently.
+        cache_ttl: Seconds a fetched page is reused from the on-disk cache.
 
     Returns:
         A GeoDataFrame containing fire perimeter features.
@@ -566,6 +807,8 @@ def search_fires(
             duration_max=duration_max,
             meanfrp_min=meanfrp_min,
             limit=limit,
+            max_workers=max_workers,
+            cache_ttl=cache_ttl,
         )
     else:
         return fire_gdf_from_bbox(
@@ -578,4 +821,6 @@ def search_fires(
             duration_max=duration_max,
             meanfrp_min=meanfrp_min,
             limit=limit,
+            max_workers=max_workers,
+            cache_ttl=cache_ttl,
         )
@@ -2067,7 +2067,7 @@ class Map(folium.Map):
             gdf.crs = "EPSG:4326"
         elif gdf.crs != "EPSG:4326":
             gdf = gdf.to_crs("EPSG:4326")
-        data = common.sanitize_geojson(gdf.__geo_interface__)
+        data = common.gdf_to_geojson(gdf)
 
         # interchangeable parameters between ipyleaflet and folium.
 
@@ -2495,11 +2495,23 @@ class Map(folium.Map):
         )
         layer.add_to(self)
 
-    def to_html(self, outfile: Optional[str] = None, **kwargs) -> str:
+    def to_html(
+        self,
+        outfile: Optional[str] = None,
+        external_data: Optional[bool] = False,
+        data_format: Optional[str] = "geojson.gz",
+        **kwargs,
+    ) -> str:
         """Exports a map as an HTML file.
 
         Args:
             outfile (str, optional): File path to the output HTML. Defaults to None.
+            external_data (bool, optional): Whether to write the data of GeoJSON layers to
+                side-car files in a <outfile>_data directory instead of inlining it.
+                The page must be served over HTTP to load them. See the htmlexport
+                module. Defaults to False.
+            data_format (str, optional): The format of the side-car files, either
+                "geojson.gz" or "geojson". Defaults to "geojson.gz".
 
         Raises:
             ValueError: If it is an invalid HTML file.
@@ -2511,6 +2523,9 @@ class Map(folium.Map):
         if self.options["layersControl"]:
             self.add_layer_control()
 
+        if external_data and outfile is None:
+            raise ValueError("An output file is required to use external_data.")
+
         if outfile is not None:
             if not outfile.endswith(".html"):
                 raise ValueError("The output file extension must be html.")
@@ -2518,7 +2533,12 @@ class Map(folium.Map):
             out_dir = os.path.dirname(outfile)
             if not os.path.exists(out_dir):
                 os.makedirs(out_dir)
-            self.save(outfile, **kwargs)
+            if external_data:
+                from .htmlexport import save_folium_html
+
+                save_folium_html(self, outfile, data_format, **kwargs)
+            else:
+                self.save(outfile, **kwargs)
         else:
             outfile = common.temp_file_path(".html")
             try:
@@ -3588,18 +3608,20 @@ class Map(folium.Map):
             kwargs.pop("style_callback")
 
         if style_function is None:
-            style_function = lambda feat: {
-                # "stroke": False,
-                # "color": "#ff0000",
-                "weight": 1,
-                "opacity": opacity,
-                # "fill": True,
-                # "fillColor": "#ffffff",
-                "fillOpacity": opacity,
-                # "dashArray": "9"
-                # "clickable": True,
-                "fillColor": feat["properties"]["color"],
-            }
+            # One style dict per class in the "style" property, applied by a
+            # Leaflet style function in the page instead of a Python callback
+            # evaluated for every feature.
+            codes, palette = common._class_palette(gdf)
+            gdf["style"] = common._class_styles(
+                codes,
+                palette,
+                {"weight": 1, "opacity": opacity, "fillOpacity": opacity},
+            )
+            kwargs["style"] = folium.JsCode(
+                "function (feature) { return feature.properties.style; }"
+            )
+        else:
+            kwargs["style_function"] = style_function
 
         if highlight_function is None:
             highlight_function = lambda feat: {
@@ -3610,7 +3632,6 @@ class Map(folium.Map):
         self.add_gdf(
             gdf,
             layer_name=layer_name,
-            style_function=style_function,
             highlight_function=highlight_function,
             info_mode=info_mode,
             encoding=encoding,
@@ -4772,12 +4793,10 @@ def geojson_layer(
     import json
     import random
 
-    import requests
-
     try:
         if isinstance(in_geojson, str):
             if in_geojson.startswith("http"):
-                data = requests.get(in_geojson).json()
+                data = common.httpcache.get(in_geojson).json()
             else:
                 in_geojson = os.path.abspath(in_geojson)
                 if not os.path.exists(in_geojson):
@@ -0,0 +1,392 @@
+"""Exporting maps to HTML with the layer data in side-car files.
+
+By default, ``to_html()`` inlines every GeoJSON layer into the HTML page, so
+exports of large datasets become very large files that browsers are slow to
+parse. With ``to_html(..., external_data=True)``, the data of each GeoJSON layer
+is written to a gzip-compressed GeoJSON file in a ``<name>_data`` directory next
+to the HTML file, and the page fetches it after loading. Identical data shared by
+several layers is written once.
+
+The side-car files are decompressed in the browser with ``DecompressionStream``.
+Browsers do not allow pages opened from ``file://`` to fetch other files, so the
+exported page must be served over HTTP (e.g., ``python -m http.server``).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import urllib.parse
+from typing import Any, Dict, List
+
+DATA_FORMATS = ["geojson.gz", "geojson"]
+
+_LOADER_JS = """
+var leafmapData = {};
+function leafmapLoadData(url) {
+    if (!(url in leafmapData)) {
+        leafmapData[url] = fetch(url)
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error(url + ": " + response.status);
+                }
+                return response.arrayBuffer();
+            })
+            .then(function (buffer) {
+                var bytes = new Uint8Array(buffer, 0, Math.min(buffer.byteLength, 2));
+                var stream = new Blob([buffer]).stream();
+                // The server may already have decoded the gzip content.
+                if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+                    stream = stream.pipeThrough(new DecompressionStream("gzip"));
+                }
+                return new Response(stream).json();
+            });
+    }
+    return leafmapData[url];
+}
+"""
+
+
+class DataWriter:
+    """Writes layer data to side-car files next to an HTML file.
+
+    Args:
+        outfile (str): The path to the HTML file.
+        data_format (str, optional): The format of the side-car files, either
+            "geojson.gz" or "geojson". Defaults to "geojson.gz".
+    """
+
+    def __init__(self, outfile: str, data_format: str = "geojson.gz") -> None:
+        if data_format not in DATA_FORMATS:
+            raise ValueError(f"data_format must be one of {DATA_FORMATS}.")
+        self.data_format = data_format
+        self.data_dir = os.path.splitext(os.path.abspath(outfile))[0] + "_data"
+        self.files = []
+        self._urls = {}
+        # Keep a reference to the objects so that their ids are not reused.
+        self._objects = []
+
+    def add(self, data: Any) -> str:
+        """Writes data to a side-car file unless the same data was already written.
+
+        Args:
+            data (Any): The JSON-serializable data, e.g., a GeoJSON dict.
+
+        Returns:
+            str: The URL of the file, relative to the HTML file.
+        """
+        if id(data) in self._urls:
+            return self._urls[id(data)]
+
+        content = _dumps(data)
+        name = hashlib.sha256(content).hexdigest()[:16] + "." + self.data_format
+        path = os.path.join(self.data_dir, name)
+        if name not in self.files:
+            os.makedirs(self.data_dir, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                if self.data_format.endswith(".gz"):
+                    with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                        gz.write(content)
+                else:
+                    f.write(content)
+            os.replace(path + ".tmp", path)
+            self.files.append(name)
+
+        url = urllib.parse.quote(os.path.basename(self.data_dir)) + "/" + name
+        self._urls[id(data)] = url
+        self._objects.append(data)
+        return url
+
+    @property
+    def urls(self) -> List[str]:
+        """The URLs of the written files, relative to the HTML file."""
+        prefix = urllib.parse.quote(os.path.basename(self.data_dir))
+        return [prefix + "/" + name for name in self.files]
+
+    def close(self) -> None:
+        """Removes the side-car files left over from previous exports."""
+        if not os.path.isdir(self.data_dir):
+            return
+        pattern = re.compile(r"^[0-9a-f]{16}\.geojson(\.gz)?$")
+        for name in os.listdir(self.data_dir):
+            if pattern.match(name) and name not in self.files:
+                os.remove(os.path.join(self.data_dir, name))
+
+
+def _dumps(data: Any) -> bytes:
+    """Serializes data to JSON bytes, using orjson when it is installed."""
+    try:
+        import orjson
+
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    except ImportError:
+        return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def loader_script() -> str:
+    """Returns the script tag defining the ``leafmapLoadData(url)`` function.
+
+    The function fetches a side-car file once and resolves to the parsed JSON.
+    """
+    return f"<script>{_LOADER_JS}</script>\n"
+
+
+def _externalize_widget_state(state: Dict, writer: DataWriter) -> Dict[str, str]:
+    """Moves the data of the ipyleaflet GeoJSON models of a widget state to files.
+
+    Args:
+        state (dict): The widget state returned by ``ipywidgets.embed.dependency_state``.
+            The data of the GeoJSON models is replaced by empty dicts.
+        writer (DataWriter): The writer of the side-car files.
+
+    Returns:
+        dict: The side-car file URL of each externalized model id.
+    """
+    refs = {}
+    for model_id, model in state.items():
+        if model.get("model_name") != "LeafletGeoJSONModel":
+            continue
+        data = model["state"].get("data")
+        if not data:
+            continue
+        refs[model_id] = writer.add(data)
+        model["state"] = dict(model["state"], data={})
+    return refs
+
+
+def _widget_state_script(refs: Dict[str, str], embed_url: str) -> str:
+    """Returns the script that restores the externalized widget data.
+
+    The widget manager script is only loaded once the side-car files have been
+    fetched and their data put back into the embedded widget state.
+
+    Args:
+        refs (dict): The side-car file URL of each model id.
+        embed_url (str): The URL of the widget manager script.
+
+    Returns:
+        str: The script tag.
+    """
+    return f"""<script>
+(function () {{
+    var refs = {json.dumps(refs)};
+    var script = document.querySelector(
+        'script[type="application/vnd.jupyter.widget-state+json"]'
+    );
+    var manager = JSON.parse(script.textContent);
+    Promise.all(
+        Object.keys(refs).map(function (id) {{
+            return leafmapLoadData(refs[id]).then(function (data) {{
+                manager.state[id].state.data = data;
+            }});
+        }})
+    ).then(function () {{
+        script.textContent = JSON.stringify(manager);
+        var embed = document.createElement("script");
+        embed.src = {json.dumps(embed_url)};
+        embed.crossOrigin = "anonymous";
+        document.body.appendChild(embed);
+    }});
+}})();
+</script>
+"""
+
+
+def externalize_maplibre_calls(calls: List, writer: DataWriter) -> List:
+    """Replaces the GeoJSON data of the addSource calls of a MapLibre map with URLs.
+
+    Args:
+        calls (list): The ``[method_name, args]`` calls of the map.
+        writer (DataWriter): The writer of the side-car files.
+
+    Returns:
+        list: The calls, with the data of GeoJSON sources replaced by the URLs
+            of their side-car files.
+    """
+    result = []
+    for call in calls:
+        name, args = call[0], call[1]
+        if name == "addSource" and len(args) > 1 and isinstance(args[1], dict):
+            source = args[1]
+            if source.get("type") == "geojson" and isinstance(source.get("data"), dict):
+                source = dict(source, data=writer.add(source["data"]))
+                call = [name, (args[0], source) + tuple(args[2:])]
+        result.append(call)
+    return result
+
+
+def maplibre_sources_script(writer: DataWriter) -> str:
+    """Returns the script defining ``leafmapLoadSources(data)`` for MapLibre maps.
+
+    MapLibre fetches plain GeoJSON URLs by itself. Compressed side-car files are
+    fetched and decompressed before the map is created.
+
+    Args:
+        writer (DataWriter): The writer of the side-car files.
+
+    Returns:
+        str: The script tag.
+    """
+    urls = [url for url in writer.urls if url.endswith(".gz")]
+    return f"""<script>
+function leafmapLoadSources(data) {{
+    var urls = {json.dumps(urls)};
+    var jobs = data.calls
+        .filter(function (call) {{
+            return call[0] === "addSource" && urls.indexOf(call[1][1].data) >= 0;
+        }})
+        .map(function (call) {{
+            return leafmapLoadData(call[1][1].data).then(function (geojson) {{
+                call[1][1].data = geojson;
+            }});
+        }});
+    return Promise.all(jobs).then(function () {{
+        return data;
+    }});
+}}
+</script>
+"""
+
+
+def _externalize_folium(m: Any, writer: DataWriter) -> List:
+    """Points the embedded GeoJson layers of a folium map at side-car files.
+
+    The layers are switched to ``embed=False`` so that folium renders a request
+    for the file instead of the data. Use ``_restore_folium()`` to undo it.
+
+    Args:
+        m (folium.Map): The map.
+        writer (DataWriter): The writer of the side-car files.
+
+    Returns:
+        list: The externalized layers.
+    """
+    import folium
+
+    layers = []
+    stack = [m]
+    while stack:
+        element = stack.pop()
+        stack.extend(element._children.values())
+        if (
+            isinstance(element, folium.GeoJson)
+            and element.embed
+            and isinstance(element.data, dict)
+        ):
+            element.embed_link = writer.add(element.data)
+            element.embed = False
+            layers.append(element)
+    return layers
+
+
+def _restore_folium(layers: List) -> None:
+    """Restores the layers changed by ``_externalize_folium()``."""
+    for layer in layers:
+        layer.embed = True
+        layer.embed_link = None
+
+
+def _folium_load_data(html: str) -> str:
+    """Replaces the synchronous GeoJSON requests of a folium page with the loader.
+
+    Args:
+        html (str): The rendered HTML of the map.
+
+    Returns:
+        str: The HTML that loads the side-car files with ``leafmapLoadData``.
+    """
+    # Layers without a style function are styled from the "style" property of
+    # their features once the data is added, which now happens later.
+    return re.sub(
+        r"\$\.ajax\((\"[^\"]*\"), \{dataType: 'json', async: false\}\)"
+        r"\s*\.done\((\w+)_add\);",
+        r"""leafmapLoadData(\1).then(function (data) {
+                \2_add(data);
+                if (!\2.options.style) {
+                    \2.setStyle(function (feature) {
+                        return feature.properties.style;
+                    });
+                }
+            });""",
+        html,
+    )
+
+
+def save_widget_html(
+    m: Any,
+    outfile: str,
+    data_format: str = "geojson.gz",
+    title: str = "My Map",
+    **kwargs,
+) -> None:
+    """Saves an ipyleaflet map as an HTML file with the layer data in side-car files.
+
+    Args:
+        m (ipyleaflet.Map): The map.
+        outfile (str): The path to the HTML file.
+        data_format (str, optional): The format of the side-car files, either
+            "geojson.gz" or "geojson". Defaults to "geojson.gz".
+        title (str, optional): The title of the HTML page. Defaults to "My Map".
+        **kwargs: Additional keyword arguments passed to
+            ``ipywidgets.embed.embed_minimal_html``.
+    """
+    import io
+
+    from ipywidgets import embed
+
+    writer = DataWriter(outfile, data_format)
+    state = embed.dependency_state([m], drop_defaults=kwargs.get("drop_defaults", True))
+    refs = _externalize_widget_state(state, writer)
+
+    embed_url = kwargs.pop("embed_url", None)
+    if embed_url is None:
+        if kwargs.get("requirejs", True):
+            embed_url = embed.DEFAULT_EMBED_REQUIREJS_URL
+        else:
+            embed_url = embed.DEFAULT_EMBED_SCRIPT_URL
+    kwargs["state"] = state
+    buffer = io.StringIO()
+    embed.embed_minimal_html(
+        buffer, views=[m], title=title, embed_url=embed_url, **kwargs
+    )
+
+    # Load the widget manager only after the data is back in the widget state.
+    html = re.sub(
+        r'<script src="' + re.escape(embed_url) + r'"[^>]*></script>',
+        "",
+        buffer.getvalue(),
+        count=1,
+    )
+    scripts = loader_script() + _widget_state_script(refs, embed_url)
+    html = html.replace("</body>", scripts + "</body>", 1)
+    with open(outfile, "w") as f:
+        f.write(html)
+    writer.close()
+
+
+def save_folium_html(
+    m: Any, outfile: str, data_format: str = "geojson.gz", **kwargs
+) -> None:
+    """Saves a folium map as an HTML file with the layer data in side-car files.
+
+    Args:
+        m (folium.Map): The map.
+        outfile (str): The path to the HTML file.
+        data_format (str, optional): The format of the side-car files, either
+            "geojson.gz" or "geojson". Defaults to "geojson.gz".
+        **kwargs: Additional keyword arguments passed to the ``render`` method
+            of the map figure.
+    """
+    writer = DataWriter(outfile, data_format)
+    layers = _externalize_folium(m, writer)
+    try:
+        html = m.get_root().render(**kwargs)
+    finally:
+        _restore_folium(layers)
+
+    html = _folium_load_data(html)
+    html = html.replace("</head>", loader_script() + "</head>", 1)
+    with open(outfile, "w", encoding="utf-8") as f:
+        f.write(html)
+    writer.close()
@@ -0,0 +1,396 @@
+"""A shared HTTP session with an opt-in, on-disk cache for remote inputs.
+
+All HTTP reads made by the leafmap helpers go through one pooled
+``requests.Session``. When the cache is enabled with ``enable_http_cache()``
+(or the ``LEAFMAP_HTTP_CACHE_DIR`` environment variable), response bodies are
+stored on disk by the SHA-256 of their content, so identical payloads served from
+different URLs are kept once. Cached responses are revalidated with conditional
+requests (``If-None-Match``/``If-Modified-Since``), and the least recently used
+entries are evicted when the cache grows beyond its size limit. Requests with
+credentials (``Authorization`` or ``Cookie`` headers, ``auth`` or ``cookies``)
+bypass the cache, and the ``Accept`` headers are part of the cache key.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Union
+
+import requests
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_CACHE_LOCK = threading.RLock()
+_CACHE = {"dir": None, "max_size": 1024**3, "max_age": 0}
+# Request headers that select a representation of the resource
+_KEY_HEADERS = ["accept", "accept-language"]
+# Request headers whose responses may be private to the caller
+_PRIVATE_HEADERS = ["authorization", "proxy-authorization", "cookie"]
+# Formats whose readers also need side-car files next to the requested file
+_SIDECAR_SUFFIXES = [".shp", ".tab", ".mif"]
+
+
+def get_session() -> requests.Session:
+    """Returns the pooled HTTP session shared by the leafmap helpers.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # Only retry the listed statuses, so an unreachable host fails
+                # right away instead of backing off.
+                retry = Retry(
+                    total=3,
+                    connect=0,
+                    read=0,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=["GET", "HEAD"],
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=32, max_retries=retry
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def enable_http_cache(
+    cache_dir: Optional[str] = None, max_size: int = 1024, max_age: int = 0
+) -> str:
+    """Enables the on-disk HTTP cache for remote inputs.
+
+    Args:
+        cache_dir (str, optional): The cache directory. Defaults to None, which uses
+            ``~/.cache/leafmap/http``.
+        max_size (int, optional): The maximum size of the cache in MB. The least
+            recently used entries are evicted beyond it. Defaults to 1024.
+        max_age (int, optional): Number of seconds a cached response is used without
+            revalidating it with the server. A ``Cache-Control: max-age`` sent by the
+            server takes precedence. Defaults to 0 (always revalidate).
+
+    Returns:
+        str: The cache directory.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "leafmap", "http")
+    cache_dir = os.path.abspath(cache_dir)
+    os.makedirs(os.path.join(cache_dir, "blobs"), exist_ok=True)
+    os.makedirs(os.path.join(cache_dir, "entries"), exist_ok=True)
+    with _CACHE_LOCK:
+        _CACHE["dir"] = cache_dir
+        _CACHE["max_size"] = int(max_size * 1024**2)
+        _CACHE["max_age"] = max_age
+    return cache_dir
+
+
+def disable_http_cache() -> None:
+    """Disables the on-disk HTTP cache. Cached files are kept on disk."""
+    with _CACHE_LOCK:
+        _CACHE["dir"] = None
+
+
+def http_cache_enabled() -> bool:
+    """Returns whether the on-disk HTTP cache is enabled."""
+    return _CACHE["dir"] is not None
+
+
+def clear_http_cache() -> None:
+    """Removes all the entries of the enabled HTTP cache."""
+    import shutil
+
+    cache_dir = _CACHE["dir"]
+    if cache_dir is None:
+        return
+    with _CACHE_LOCK:
+        for name in ["blobs", "entries"]:
+            shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+            os.makedirs(os.path.join(cache_dir, name), exist_ok=True)
+
+
+def _prepare_url(url: str, params: Optional[Dict] = None) -> str:
+    """Returns the full URL of a GET request, including the query parameters."""
+    return requests.Request("GET", url, params=params).prepare().url
+
+
+def _cacheable(kwargs: Dict) -> bool:
+    """Returns whether a request may be served from the shared cache."""
+    if kwargs.get("stream") or kwargs.get("auth") or kwargs.get("cookies"):
+        return False
+    headers = kwargs.get("headers") or {}
+    return not any(key.lower() in _PRIVATE_HEADERS for key in headers)
+
+
+def _cache_key(url: str, headers: Optional[Dict] = None) -> str:
+    """Returns the cache key of a request: its URL and its representation headers."""
+    selected = sorted(
+        (key.lower(), str(value))
+        for key, value in (headers or {}).items()
+        if key.lower() in _KEY_HEADERS
+    )
+    if not selected:
+        return url
+    return url + "\n" + json.dumps(selected)
+
+
+def _entry_path(key: str) -> str:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(_CACHE["dir"], "entries", digest + ".json")
+
+
+def _blob_path(name: str) -> str:
+    return os.path.join(_CACHE["dir"], "blobs", name)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _read_entry(key: str) -> Optional[Dict]:
+    path = _entry_path(key)
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(_blob_path(entry["blob"])):
+        return None
+    return entry
+
+
+def _write_entry(key: str, entry: Dict) -> None:
+    entry["accessed"] = time.time()
+    _write_atomic(_entry_path(key), json.dumps(entry).encode("utf-8"))
+
+
+def _response_max_age(headers: Dict) -> Optional[int]:
+    """Returns the freshness lifetime a server declared for a response, if any."""
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "max-age" and value.isdigit():
+            return int(value)
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return max(0, int(parsedate_to_datetime(expires).timestamp() - time.time()))
+        except (TypeError, ValueError):
+            return 0
+    return None
+
+
+def _entry_max_age(entry: Dict) -> int:
+    """Returns how long an entry is used without revalidation, in seconds."""
+    if entry.get("max_age") is None:
+        return _CACHE["max_age"]
+    return entry["max_age"]
+
+
+def _evict() -> None:
+    """Evicts the least recently used entries until the cache fits its size limit."""
+    entries_dir = os.path.join(_CACHE["dir"], "entries")
+    entries = []
+    for name in os.listdir(entries_dir):
+        path = os.path.join(entries_dir, name)
+        try:
+            with open(path) as f:
+                entries.append((json.load(f), path))
+        except (OSError, ValueError):
+            continue
+    blobs = {}
+    for entry, _ in entries:
+        blobs[entry["blob"]] = entry["size"]
+    total = sum(blobs.values())
+    if total <= _CACHE["max_size"]:
+        return
+
+    entries.sort(key=lambda item: item[0].get("accessed", 0))
+    referenced = {}
+    for entry, _ in entries:
+        referenced[entry["blob"]] = referenced.get(entry["blob"], 0) + 1
+    for entry, path in entries:
+        if total <= _CACHE["max_size"]:
+            break
+        os.remove(path)
+        referenced[entry["blob"]] -= 1
+        if referenced[entry["blob"]] == 0:
+            blob = _blob_path(entry["blob"])
+            if os.path.exists(blob):
+                os.remove(blob)
+            total -= entry["size"]
+
+
+def _cached_fetch(
+    url: str, timeout: Optional[float] = 30, **kwargs: Any
+) -> Union[Dict, requests.Response]:
+    """Fetches a URL through the cache and returns its cache entry.
+
+    Responses with an error status are not cached and are returned as they are.
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    key = _cache_key(url, headers)
+    with _CACHE_LOCK:
+        entry = _read_entry(key)
+    if entry is not None and time.time() - entry["stored"] < _entry_max_age(entry):
+        with _CACHE_LOCK:
+            _write_entry(key, entry)
+        return entry
+
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    except requests.exceptions.ConnectionError:
+        if entry is not None:
+            # Serve the stale copy when the server cannot be reached.
+            return entry
+        raise
+
+    max_age = _response_max_age(response.headers)
+    if response.status_code == 304 and entry is not None:
+        entry["stored"] = time.time()
+        entry["max_age"] = max_age
+        with _CACHE_LOCK:
+            _write_entry(key, entry)
+        return entry
+
+    if not 200 <= response.status_code < 300:
+        return response
+    content = response.content
+    # Blobs are named by the hash of their content, keeping the file extension
+    # so that readers relying on it (e.g., GDAL drivers) can open them.
+    path = urllib.parse.urlparse(response.url or url).path
+    suffix = os.path.splitext(path)[1].lower()
+    if not suffix[1:].isalnum() or len(suffix) > 10:
+        suffix = ""
+    blob = hashlib.sha256(content).hexdigest() + suffix
+    entry = {
+        "url": url,
+        "blob": blob,
+        "size": len(content),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "headers": {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower() in ["content-type", "content-encoding", "etag"]
+        },
+        "encoding": response.encoding,
+        "status": response.status_code,
+        "stored": time.time(),
+        "max_age": max_age,
+    }
+    if "no-store" in response.headers.get("Cache-Control", "").lower():
+        entry["content"] = content
+        return entry
+    with _CACHE_LOCK:
+        if not os.path.exists(_blob_path(blob)):
+            _write_atomic(_blob_path(blob), content)
+        _write_entry(key, entry)
+        _evict()
+    return entry
+
+
+def _entry_content(entry: Dict) -> bytes:
+    if "content" in entry:
+        return entry["content"]
+    with open(_blob_path(entry["blob"]), "rb") as f:
+        return f.read()
+
+
+def get(
+    url: str, params: Optional[Dict] = None, timeout: Optional[float] = 30, **kwargs
+) -> requests.Response:
+    """Sends a GET request through the shared session and the HTTP cache.
+
+    When the cache is disabled, or the request carries credentials, this is a
+    plain GET on the shared session.
+
+    Args:
+        url (str): The URL.
+        params (dict, optional): The query parameters. Defaults to None.
+        timeout (float, optional): The request timeout in seconds. Defaults to 30.
+        **kwargs: Additional keyword arguments passed to ``requests.Session.get``.
+
+    Returns:
+        requests.Response: The response.
+    """
+    if not http_cache_enabled() or not _cacheable(kwargs):
+        return get_session().get(url, params=params, timeout=timeout, **kwargs)
+
+    url = _prepare_url(url, params)
+    entry = _cached_fetch(url, timeout=timeout, **kwargs)
+    if isinstance(entry, requests.Response):
+        return entry
+    response = requests.Response()
+    response.status_code = entry.get("status", 200)
+    response.url = url
+    response._content = _entry_content(entry)
+    response.headers.update(entry["headers"])
+    response.headers.pop("Content-Encoding", None)
+    response.encoding = entry["encoding"]
+    return response
+
+
+def cached_path(url: str, params: Optional[Dict] = None, **kwargs: Any) -> str:
+    """Returns a local copy of a remote file when the HTTP cache is enabled.
+
+    Inputs that are not HTTP(S) URLs, formats that need side-car files (e.g.,
+    .shp), requests with credentials, failed requests, and all inputs when the
+    cache is disabled, are returned unchanged so that readers can open them
+    directly.
+
+    Args:
+        url (str): The URL or file path.
+        params (dict, optional): The query parameters. Defaults to None.
+        **kwargs: Additional keyword arguments passed to ``requests.Session.get``.
+
+    Returns:
+        str: The path to the cached file, or the input unchanged.
+    """
+    if (
+        not http_cache_enabled()
+        or not _cacheable(kwargs)
+        or not isinstance(url, str)
+        or not url.startswith(("http://", "https://"))
+    ):
+        return url
+    suffix = os.path.splitext(urllib.parse.urlparse(url).path)[1].lower()
+    if suffix in _SIDECAR_SUFFIXES:
+        return url
+    entry = _cached_fetch(_prepare_url(url, params), **kwargs)
+    if isinstance(entry, requests.Response) or "content" in entry:
+        return url
+    return _blob_path(entry["blob"])
+
+
+if os.environ.get("LEAFMAP_HTTP_CACHE_DIR"):
+    enable_http_cache(os.environ["LEAFMAP_HTTP_CACHE_DIR"])
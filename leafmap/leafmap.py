@@ -2676,6 +2676,8 @@ class Map(ipyleaflet.Map):
         width: Optional[str] = "100%",
         height: Optional[str] = "880px",
         add_layer_control: Optional[bool] = True,
+        external_data: Optional[bool] = False,
+        data_format: Optional[str] = "geojson.gz",
         **kwargs,
     ) -> None:
         """Saves the map as an HTML file.
@@ -2686,8 +2688,17 @@ class Map(ipyleaflet.Map):
             width (str, optional): The width of the map in pixels or percentage. Defaults to '100%'.
             height (str, optional): The height of the map in pixels. Defaults to '880px'.
             add_layer_control (bool, optional): Whether to add the LayersControl. Defaults to True.
+            external_data (bool, optional): Whether to write the data of GeoJSON layers to
+                side-car files in a <outfile>_data directory instead of inlining it.
+                The page must be served over HTTP to load them. See the htmlexport
+                module. Defaults to False.
+            data_format (str, optional): The format of the side-car files, either
+                "geojson.gz" or "geojson". Defaults to "geojson.gz".
 
         """
+        if external_data and outfile is None:
+            raise ValueError("An output file is required to use external_data.")
+
         try:
             save = True
             if outfile is not None:
@@ -2728,7 +2739,12 @@ class Map(ipyleaflet.Map):
             self.layout.width = width
             self.layout.height = height
 
-            self.save(outfile, title=title, **kwargs)
+            if external_data:
+                from .htmlexport import save_widget_html
+
+                save_widget_html(self, outfile, data_format, title=title, **kwargs)
+            else:
+                self.save(outfile, title=title, **kwargs)
 
             self.layout.width = before_width
             self.layout.height = before_height
@@ -3379,7 +3395,7 @@ class Map(ipyleaflet.Map):
             gdf.crs = "EPSG:4326"
         elif gdf.crs != "EPSG:4326":
             gdf = gdf.to_crs("EPSG:4326")
-        data = common.sanitize_geojson(gdf.__geo_interface__)
+        data = common.gdf_to_geojson(gdf)
 
         try:
             first_feature = data["features"][0]
@@ -3506,12 +3522,19 @@ class Map(ipyleaflet.Map):
 
         if style_callback is None:
             geojson = ipyleaflet.GeoJSON(
-                data=data,
                 style=style,
                 hover_style=hover_style,
                 name=layer_name,
                 **kwargs,
             )
+            # ipyleaflet deep-copies the data of a styled layer to merge the layer
+            # style into every feature. Merge it once per distinct feature style
+            # instead and hand over the styled data as is.
+            if style:
+                common._merge_feature_styles(data["features"], style)
+            geojson.updating = True
+            geojson.data = data
+            geojson.updating = False
         else:
             geojson = ipyleaflet.GeoJSON(
                 data=data,
@@ -5103,14 +5126,17 @@ class Map(ipyleaflet.Map):
             hover_style = {"weight": style["weight"] + 1, "fillOpacity": 0.5}
 
         if style_callback is None:
-            style_callback = lambda feat: {"fillColor": feat["properties"]["color"]}
+            # One style dict per class instead of a callback per feature. The
+            # class color takes precedence over a fillColor in the layer style.
+            codes, palette = common._class_palette(gdf)
+            gdf["style"] = common._class_styles(codes, palette)
+            style = {key: value for key, value in style.items() if key != "fillColor"}
 
         if gdf.geometry.geom_type.unique().tolist()[0] == "Point":
             columns = gdf.columns.tolist()
-            if "category" in columns:
-                columns.remove("category")
-            if "color" in columns:
-                columns.remove("color")
+            for name in ["category", "color", "style"]:
+                if name in columns:
+                    columns.remove(name)
             if marker_args is None:
                 marker_args = {}
             if "fill_color" not in marker_args:
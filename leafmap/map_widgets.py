@@ -485,7 +485,9 @@ class LayerEditor(widgets.VBox):
 
         self._layer_spinner.icon = "spinner spin lg"
         self._layer_spinner.unobserve(loading_change, "loading")
-        self._embedded_widget.on_apply_click()
+        if self._embedded_widget.on_apply_click() is False:
+            self._layer_spinner.icon = "check"
+            return
         self._host_map.cog_layer_dict[self._layer_dict["layer_name"]][
             "tile_layer"
         ].observe(loading_change, "loading")
@@ -534,6 +536,16 @@ class RasterLayerEditor(widgets.VBox):
                 self._max_value = 1
 
         self._sel_bands = self._layer_dict["vis_bands"]
+        indexes = self._band_indexes
+        if isinstance(indexes, int):
+            indexes = [indexes]
+        # The vis params the tile layer was created with.
+        self._applied_vis = {
+            "indexes": list(indexes) if indexes is not None else None,
+            "vmin": self._layer_dict.get("vmin"),
+            "vmax": self._layer_dict.get("vmax"),
+            "colormap": self._layer_dict.get("colormap"),
+        }
         self._layer_palette = []
         self._layer_gamma = 1
         self._left_value = min(self._min_value, 0)
@@ -877,6 +889,15 @@ class RasterLayerEditor(widgets.VBox):
         old_layer = self._host_map.find_layer(self._layer_name)
         layer_index = self._host_map.find_layer_index(self._layer_name)
 
+        # A change of opacity alone is applied to the current tile layer, which
+        # keeps its loaded tiles instead of requesting them all again.
+        tile_vis = {key: value for key, value in vis.items() if key != "opacity"}
+        if old_layer is not None and tile_vis == self._applied_vis:
+            old_layer.opacity = vis["opacity"]
+            self._layer_dict["opacity"] = vis["opacity"]
+            return False
+        self._applied_vis = tile_vis
+
         self._host_map.remove(old_layer)
 
         # Add support for hyperspectral data via HyperCoast
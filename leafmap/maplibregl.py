@@ -1,5 +1,6 @@
 """The maplibregl module provides the Map class for creating interactive maps using the maplibre.ipywidget module."""
 
+import copy
 import json
 import logging
 import os
@@ -87,6 +88,16 @@ SIDEBAR_PANEL_BACKGROUND = "#ffffff"
 SIDEBAR_PANEL_TEXT_COLOR = "#212121"
 SIDEBAR_SCROLLBAR_STYLE = "scrollbar-color: #bdbdbd #f5f5f5; scrollbar-width: thin;"
 
+# Calls that set a piece of layer or source state, with the number of leading
+# arguments that identify it. A later call for the same target supersedes an
+# earlier one.
+_STATE_CALLS = {
+    "setPaintProperty": 2,
+    "setLayoutProperty": 2,
+    "setFilter": 1,
+    "setSourceData": 1,
+}
+
 
 class Map(MapWidget):
     """The Map class inherits from the MapWidget class of the maplibre.ipywidget module."""
@@ -177,7 +188,7 @@ class Map(MapWidget):
         ]
         if isinstance(style, str):
             if style.startswith("http"):
-                response = requests.get(style)
+                response = common.httpcache.get(style)
                 if response.status_code != 200:
                     print(
                         "The provided style URL is invalid. Falling back to 'dark-matter'."
@@ -227,6 +238,9 @@ class Map(MapWidget):
             center=center, zoom=zoom, pitch=pitch, bearing=bearing, **kwargs
         )
 
+        # The paint, layout and filter values of the layers on the map, keyed by
+        # layer id, so that unchanged values are not sent again.
+        self._layer_state = {}
         super().__init__(map_options, height=height)
         if use_message_queue is None:
             use_message_queue = os.environ.get("USE_MESSAGE_QUEUE", False)
@@ -704,6 +718,67 @@ class Map(MapWidget):
                     widget, widget_icon="mdi-satellite-variant", label="NASA OPERA"
                 )
 
+    def add_call(self, method_name: str, *args: Any) -> None:
+        """
+        Sends a call to the map, skipping it if it would not change anything.
+
+        Paint, layout and filter changes are compared with the values recorded
+        for the layer and only sent when they differ, so restyling and
+        filtering a layer send a few bytes and never its data. Before the map
+        is displayed, the calls are kept in a list that is synced as a whole
+        with every call; a call that sets the same property, filter, or source
+        data as an earlier one replaces it instead of being appended.
+
+        Args:
+            method_name (str): The name of the MapLibre map method.
+            *args: The arguments of the method.
+
+        Returns:
+            None
+        """
+        if method_name == "addLayer":
+            layer = args[0] if isinstance(args[0], dict) else args[0].to_dict()
+            state = {("filter", None): copy.deepcopy(layer.get("filter"))}
+            for kind in ["paint", "layout"]:
+                for prop, value in (layer.get(kind) or {}).items():
+                    state[(kind, prop)] = copy.deepcopy(value)
+            self._layer_state[layer["id"]] = state
+        elif method_name == "removeLayer":
+            self._layer_state.pop(args[0], None)
+        elif method_name in ["setPaintProperty", "setLayoutProperty", "setFilter"]:
+            if method_name == "setFilter":
+                key = ("filter", None)
+                value = args[1]
+            else:
+                key = (
+                    "paint" if method_name == "setPaintProperty" else "layout",
+                    args[1],
+                )
+                value = args[2]
+            state = self._layer_state.setdefault(args[0], {})
+            if key in state and state[key] == value:
+                return
+            state[key] = copy.deepcopy(value)
+
+        size = _STATE_CALLS.get(method_name)
+        if size is not None and not self._rendered:
+            target = tuple(args[:size])
+
+            def superseded(call):
+                return call[0] == method_name and tuple(call[1][:size]) == target
+
+            if self._use_message_queue:
+                self._message_queue[:] = [
+                    call for call in self._message_queue if not superseded(call)
+                ]
+            else:
+                self.calls = [call for call in self.calls if not superseded(call)] + [
+                    [method_name, args]
+                ]
+                return
+
+        super().add_call(method_name, *args)
+
     def add_layer(
         self,
         layer: "Layer",
@@ -767,9 +842,11 @@ class Map(MapWidget):
             "type": layer.type,
             "color": color,
         }
-        super().add_layer(layer, before_id=before_id)
-        self.set_visibility(name, visible)
-        self.set_opacity(name, opacity)
+        # Sync the calls once for the layer and its initial state.
+        with self.hold_sync():
+            super().add_layer(layer, before_id=before_id)
+            self.set_visibility(name, visible)
+            self.set_opacity(name, opacity)
 
         if self.layer_manager is not None:
             self.layer_manager.refresh()
@@ -1555,7 +1632,7 @@ class Map(MapWidget):
 
         if isinstance(data, str):
             if os.path.isfile(data) or data.startswith("http"):
-                data = geojson_to_gdf(data).__geo_interface__
+                data = common.gdf_to_geojson(geojson_to_gdf(data))
                 if fit_bounds:
                     bounds = get_bounds(data)
                 source = GeoJSONSource(data=data, **source_args)
@@ -1678,9 +1755,9 @@ class Map(MapWidget):
         """
 
         if not isinstance(data, gpd.GeoDataFrame):
-            data = geojson_to_gdf(data).__geo_interface__
+            data = common.gdf_to_geojson(geojson_to_gdf(data))
         else:
-            data = data.__geo_interface__
+            data = common.gdf_to_geojson(data)
 
         self.add_geojson(
             data,
@@ -1745,7 +1822,7 @@ class Map(MapWidget):
         """
         if not isinstance(gdf, gpd.GeoDataFrame):
             raise ValueError("The data must be a GeoDataFrame.")
-        geojson = gdf.__geo_interface__
+        geojson = common.gdf_to_geojson(gdf)
         self.add_geojson(
             geojson,
             layer_type=layer_type,
@@ -2921,6 +2998,8 @@ class Map(MapWidget):
         remove_port: bool = True,
         preview: bool = False,
         overwrite: bool = False,
+        external_data: bool = False,
+        data_format: str = "geojson.gz",
         **kwargs: Any,
     ) -> str:
         """Render the map to an HTML page.
@@ -2940,12 +3019,30 @@ class Map(MapWidget):
             preview (bool, optional): Whether to preview the HTML file in a web browser.
                 Defaults to False.
             overwrite (bool, optional): Whether to overwrite the output file if it already exists.
+            external_data (bool, optional): Whether to write the data of GeoJSON sources to
+                side-car files in a <output>_data directory instead of inlining it.
+                The page must be served over HTTP to load them. See the htmlexport
+                module. Defaults to False.
+            data_format (str, optional): The format of the side-car files, either
+                "geojson.gz" or "geojson". Defaults to "geojson.gz".
             **kwargs: Additional keyword arguments that are passed to the
                 `maplibre.ipywidget.MapWidget.to_html()` method.
 
         Returns:
             str: The HTML content of the map.
         """
+        if output is None:
+            output = os.getenv("MAPLIBRE_OUTPUT", None)
+
+        if output and not overwrite and os.path.exists(output):
+            import glob
+
+            num = len(glob.glob(output.replace(".html", "*.html")))
+            output = output.replace(".html", f"_{num}.html")
+
+        if external_data and not output:
+            raise ValueError("An output file is required to use external_data.")
+
         if isinstance(height, int):
             height = f"{height}px"
         if isinstance(width, int):
@@ -2955,7 +3052,21 @@ class Map(MapWidget):
             kwargs["style"] = f"width: {width}; height: {height};"
         else:
             kwargs["style"] += f"width: {width}; height: {height};"
-        html = super().to_html(title=title, **kwargs)
+
+        # The calls are kept in the message queue or, when it is not used, synced
+        # to the widget.
+        queue = self._message_queue
+        calls = queue or list(self.calls)
+        if external_data:
+            from . import htmlexport
+
+            writer = htmlexport.DataWriter(output, data_format)
+            calls = htmlexport.externalize_maplibre_calls(calls, writer)
+        self._message_queue = calls
+        try:
+            html = super().to_html(title=title, **kwargs)
+        finally:
+            self._message_queue = queue
 
         if isinstance(height, str) and ("%" in height):
             style_before = """</style>\n"""
@@ -2982,18 +3093,20 @@ class Map(MapWidget):
         if remove_port:
             html = common.remove_port_from_string(html)
 
-        if output is None:
-            output = os.getenv("MAPLIBRE_OUTPUT", None)
+        if external_data:
+            html = html.replace(
+                "pymaplibregl(data);", "leafmapLoadSources(data).then(pymaplibregl);", 1
+            )
+            scripts = htmlexport.loader_script() + htmlexport.maplibre_sources_script(
+                writer
+            )
+            html = html.replace("<body>", scripts + "<body>", 1)
 
         if output:
-            if not overwrite and os.path.exists(output):
-                import glob
-
-                num = len(glob.glob(output.replace(".html", "*.html")))
-                output = output.replace(".html", f"_{num}.html")
-
             with open(output, "w") as f:
                 f.write(html)
+            if external_data:
+                writer.close()
             if preview:
                 import webbrowser
 
@@ -4657,7 +4770,7 @@ class Map(MapWidget):
         """
         if self._style is not None:
             if isinstance(self._style, str):
-                response = requests.get(self._style)
+                response = common.httpcache.get(self._style)
                 style = response.json()
             elif isinstance(self._style, dict):
                 style = self._style
@@ -6622,13 +6735,18 @@ class Map(MapWidget):
         if legend_title is None:
             legend_title = column
 
+        # Look the colors up from the class codes in the style, so that the
+        # palette can be changed without sending the features again.
+        _, palette = common._class_palette(gdf)
+        color = common._class_match_expression(palette)
+
         geom_type = gdf.geometry.iloc[0].geom_type
 
         if geom_type == "Point" or geom_type == "MultiPoint":
             layer_type = "circle"
             if paint is None:
                 paint = {
-                    "circle-color": ["get", "color"],
+                    "circle-color": color,
                     "circle-radius": 5,
                     "circle-stroke-color": outline_color,
                     "circle-stroke-width": 1,
@@ -6638,7 +6756,7 @@ class Map(MapWidget):
             layer_type = "line"
             if paint is None:
                 paint = {
-                    "line-color": ["get", "color"],
+                    "line-color": color,
                     "line-width": 2,
                     "line-opacity": opacity,
                 }
@@ -6681,7 +6799,7 @@ class Map(MapWidget):
                 layer_type = "fill"
                 if paint is None:
                     paint = {
-                        "fill-color": ["get", "color"],
+                        "fill-color": color,
                         "fill-opacity": opacity,
                         "fill-outline-color": outline_color,
                     }
@@ -11047,6 +11165,23 @@ class LayerStyleWidget(widgets.VBox):
         self.map.remove_from_sidebar(name=f"Style {self.layer_id}")
 
 
+def _epoch_ms(values: pd.Series) -> "np.ndarray":
+    """Convert datetimes to milliseconds since the epoch for filter expressions.
+
+    Args:
+        values (pd.Series): The datetime values.
+
+    Returns:
+        np.ndarray: The milliseconds since the epoch, with NaN for missing values.
+    """
+    values = pd.to_datetime(values)
+    if getattr(values.dt, "tz", None) is not None:
+        values = values.dt.tz_convert(None)
+    ms = values.to_numpy(dtype="datetime64[ms]").astype("int64").astype(float)
+    ms[values.isna().to_numpy()] = float("nan")
+    return ms
+
+
 class DateFilterWidget(widgets.VBox):
     """
     A widget for filtering data based on time range.
@@ -11099,33 +11234,41 @@ class DateFilterWidget(widgets.VBox):
 
         gdfs = []
         if map_widget is not None:
-            for index, source in enumerate(sources):
-                if index == file_index:
-                    fit_bounds = True
-                else:
-                    fit_bounds = False
-                if source is None:
-                    gdfs.append(None)
-                    continue
-                gdf = geojson_to_gdf(source)
-                gdfs.append(gdf)
-
-                style = styles[names[index]]
-                layer_type = style["layer_type"]
-                paint = style["paint"]
-                map_widget.add_gdf(
-                    gdf,
-                    name=names[index],
-                    layer_type=layer_type,
-                    paint=paint,
-                    fit_bounds=fit_bounds,
-                    fit_bounds_options={"animate": False},
-                )
+            # Sync the calls once for all the layers, since every sync sends
+            # the data of all the sources added so far.
+            with map_widget.hold_sync():
+                for index, source in enumerate(sources):
+                    if index == file_index:
+                        fit_bounds = True
+                    else:
+                        fit_bounds = False
+                    if source is None:
+                        gdfs.append(None)
+                        continue
+                    gdf = geojson_to_gdf(source)
+                    gdfs.append(gdf)
+                    # The features stay on the map and are filtered with expressions
+                    # on these columns, so the data is only sent once.
+                    for col in ["startDatetime", "endDatetime", date_col]:
+                        if col is not None and col in gdf.columns:
+                            gdf[f"_{col}_ms"] = _epoch_ms(gdf[col])
+
+                    style = styles[names[index]]
+                    layer_type = style["layer_type"]
+                    paint = style["paint"]
+                    map_widget.add_gdf(
+                        gdf,
+                        name=names[index],
+                        layer_type=layer_type,
+                        paint=paint,
+                        fit_bounds=fit_bounds,
+                        fit_bounds_options={"animate": False},
+                    )
 
-            map_widget.add_arrow(
-                names[file_index],
-                name="arrow",
-            )
+                map_widget.add_arrow(
+                    names[file_index],
+                    name="arrow",
+                )
 
         gdf = gdfs[file_index]
 
@@ -11261,49 +11404,50 @@ class DateFilterWidget(widgets.VBox):
             if prev_start >= min_date:
                 slider.value = (prev_start, clamp_end(prev_start))
 
+        def between(col, start, end):
+            return [
+                [">=", ["get", f"_{col}_ms"], pd.Timestamp(start).value // 10**6],
+                ["<=", ["get", f"_{col}_ms"], pd.Timestamp(end).value // 10**6],
+            ]
+
+        def group_filter(exact):
+            value = group_dropdown.value
+            if hasattr(value, "item"):
+                value = value.item()
+            if exact:
+                return ["==", ["get", group_col], value]
+            return ["in", value, ["to-string", ["get", group_col]]]
+
         def on_slider_change(change):
             if slider.value:
                 start, end = slider.value
                 range_label.value = f"Selected range: {start.strftime(date_format)} to {end.strftime(date_format)}"
-                filtered_gdf = gdf[
-                    (gdf["startDatetime"] >= start) & (gdf["endDatetime"] <= end)
+                expression = [
+                    "all",
+                    between("startDatetime", start, end)[0],
+                    between("endDatetime", start, end)[1],
                 ]
                 if group_dropdown.value is not None:
-                    filtered_gdf = filtered_gdf[
-                        filtered_gdf[group_col] == group_dropdown.value
-                    ]
-                map_widget.set_data(names[file_index], filtered_gdf.__geo_interface__)
+                    expression.append(group_filter(exact=True))
+                map_widget.set_filter(names[file_index], expression)
                 if "arrow" in map_widget.get_layer_names():
-                    map_widget.set_data("arrow", filtered_gdf.__geo_interface__)
+                    map_widget.set_filter("arrow", expression)
 
                 for index, point_gdf in enumerate(gdfs[file_index + 1 :]):
                     if point_gdf is None:
                         continue
+                    expression = ["all"]
                     if date_col in point_gdf.columns:
-                        filtered = point_gdf[
-                            (point_gdf[date_col] >= start)
-                            & (point_gdf[date_col] <= end)
-                        ]
-                    else:
-                        filtered = point_gdf
+                        expression.extend(between(date_col, start, end))
                     if (
                         group_dropdown.value is not None
                         and group_col in point_gdf.columns
                     ):
-                        if match == "exact":
-                            filtered = filtered[
-                                filtered[group_col] == group_dropdown.value
-                            ]
-                        elif match == "partial":
-                            filtered = filtered[
-                                filtered[group_col].str.contains(group_dropdown.value)
-                            ]
-                        else:
+                        if match not in ["exact", "partial"]:
                             raise ValueError(f"Invalid match type: {match}")
+                        expression.append(group_filter(exact=match == "exact"))
 
-                    map_widget.set_data(
-                        names[index + file_index + 1], filtered.__geo_interface__
-                    )
+                    map_widget.set_filter(names[index + file_index + 1], expression)
                 update_date_picker()
 
         def on_group_dropdown_change(change):
@@ -11320,7 +11464,8 @@ class DateFilterWidget(widgets.VBox):
         backward_btn.on_click(on_backward_btn_click)
 
         # Initial trigger
-        on_slider_change(None)
+        with map_widget.hold_sync():
+            on_slider_change(None)
 
         self.children = [dropdown_box, slider, range_label, nav_box, output]
 
@@ -11353,6 +11498,7 @@ class SelectDataWidget(widgets.VBox):
                 to be called when the selection is reset. Defaults to None.
             map_widget (Optional[Map], optional): The map widget to which the data will be added. Defaults to None.
         """
+        import hashlib
         import tempfile
 
         import ipyfilechooser
@@ -11362,6 +11508,9 @@ class SelectDataWidget(widgets.VBox):
         temp_dirs = []
         layer_names = []
         source_names = []
+        # The SHA-256 of the file loaded into each layer, so that applying the
+        # same selection again does not send the data to the map again.
+        loaded_files = {}
 
         if map_widget is not None:
             layer_names = map_widget.layer_names
@@ -11446,6 +11595,13 @@ class SelectDataWidget(widgets.VBox):
                             fit_bounds = False
                         basename = os.path.basename(file)
                         source_name = os.path.splitext(basename)[0]
+                        with open(file, "rb") as f:
+                            digest = hashlib.sha256(f.read()).hexdigest()
+                        if (
+                            loaded_files.get(source_name) == digest
+                            and source_name in map_widget.layer_names
+                        ):
+                            continue
                         map_widget.add_geojson(
                             file,
                             name=source_name,
@@ -11453,6 +11609,7 @@ class SelectDataWidget(widgets.VBox):
                             fit_bounds_options={"animate": False},
                             overwrite=True,
                         )
+                        loaded_files[source_name] = digest
                     output.clear_output()
                     output.outputs = ()
 
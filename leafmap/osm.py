@@ -4,6 +4,7 @@ Most functions for downloading OpenStreetMap data require tags of map features.
 https://wiki.openstreetmap.org/wiki/Map_features
 """
 
+import os
 import warnings
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -13,6 +14,16 @@ from .common import check_package
 
 warnings.filterwarnings("ignore")
 
+# Directory of the local cache of QuackOSM extracts
+OSM_CACHE_DIR = os.getenv(
+    "LEAFMAP_OSM_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "leafmap", "quackosm"),
+)
+# Seconds a cached extract is reused before OSM data is downloaded again
+OSM_CACHE_TTL = int(os.getenv("LEAFMAP_OSM_CACHE_TTL", str(7 * 24 * 3600)))
+# Total size in bytes of the cached extracts; the oldest ones are removed beyond it
+OSM_CACHE_MAX_SIZE = int(os.getenv("LEAFMAP_OSM_CACHE_MAX_SIZE", str(5 * 1024**3)))
+
 
 def osm_gdf_from_address(
     address: str, tags: Dict, dist: Optional[int] = 1000
@@ -460,11 +471,206 @@ def osm_tags_list() -> dict:
 # =============================================================================
 
 
+def _osm_cache_key(tags_filter: Optional[Dict], kwargs: Dict) -> str:
+    """Return the part of a QuackOSM query that determines its output columns."""
+    import json
+
+    options = {k: v for k, v in kwargs.items() if k != "verbosity_mode"}
+    return json.dumps([tags_filter, options], sort_keys=True, default=str)
+
+
+def _load_osm_cache_index(include_expired: bool = False) -> List[Dict]:
+    """Load the index of the cached extracts, dropping entries whose file is gone
+    and, unless include_expired is True, entries older than OSM_CACHE_TTL."""
+    import json
+    import time
+
+    path = os.path.join(OSM_CACHE_DIR, "index.json")
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return []
+    now = time.time()
+    return [
+        e
+        for e in entries
+        if (include_expired or now - e.get("created", 0) <= OSM_CACHE_TTL)
+        and os.path.exists(os.path.join(OSM_CACHE_DIR, e["file"]))
+    ]
+
+
+def _add_osm_cache_entry(entry: Dict) -> None:
+    """Add an extract to the cache index, removing expired extracts and the
+    oldest ones beyond OSM_CACHE_MAX_SIZE."""
+    import json
+
+    cached = _load_osm_cache_index(include_expired=True)
+    entries = _load_osm_cache_index() + [entry]
+    entries.sort(key=lambda e: e.get("created", 0))
+    sizes = [os.path.getsize(os.path.join(OSM_CACHE_DIR, e["file"])) for e in entries]
+    # Always keep the new extract, even if it is larger than the limit on its own.
+    while len(entries) > 1 and sum(sizes) > OSM_CACHE_MAX_SIZE:
+        sizes.pop(0)
+        entries.pop(0)
+    path = os.path.join(OSM_CACHE_DIR, "index.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+    keep = {e["file"] for e in entries}
+    for e in cached:
+        if e["file"] not in keep:
+            try:
+                os.remove(os.path.join(OSM_CACHE_DIR, e["file"]))
+            except OSError:
+                pass
+
+
+def _sort_parquet_spatially(path: str, row_group_size: int = 50000) -> None:
+    """Rewrite a GeoParquet file in Hilbert order with a covering bbox column.
+
+    Nearby features end up in the same row groups, so the min/max statistics of
+    the bbox column let readers skip row groups outside a query window.
+    """
+    import numpy as np
+
+    gdf = gpd.read_parquet(path)
+    if len(gdf) > 1:
+        gdf = gdf.iloc[np.argsort(gdf.hilbert_distance().values, kind="stable")]
+    tmp_path = path + ".tmp"
+    gdf.to_parquet(
+        tmp_path, index=False, write_covering_bbox=True, row_group_size=row_group_size
+    )
+    os.replace(tmp_path, path)
+
+
+def _read_cached_extract(path: str, geometry=None) -> gpd.GeoDataFrame:
+    """Read the features of a cached extract that intersect a geometry.
+
+    DuckDB prunes the row groups with the bbox column, then the exact
+    intersection test runs on the remaining candidates.
+    """
+    import duckdb
+    import shapely
+
+    con = duckdb.connect()
+    try:
+        # Keep the geometry as WKB even when the spatial extension is loaded.
+        con.execute("SET enable_geoparquet_conversion = false")
+    except duckdb.Error:
+        pass
+    query = "SELECT * EXCLUDE (bbox) FROM read_parquet(?)"
+    params = [path]
+    if geometry is not None:
+        minx, miny, maxx, maxy = geometry.bounds
+        query += (
+            " WHERE bbox.xmax >= ? AND bbox.xmin <= ?"
+            " AND bbox.ymax >= ? AND bbox.ymin <= ?"
+        )
+        params += [minx, maxx, miny, maxy]
+    df = con.execute(query, params).df()
+    con.close()
+
+    geoms = shapely.from_wkb([bytes(b) for b in df.pop("geometry")])
+    gdf = gpd.GeoDataFrame(df, geometry=geoms, crs="EPSG:4326")
+    if geometry is not None:
+        gdf = gdf[gdf.intersects(geometry)]
+    if "feature_id" in gdf.columns:
+        gdf = gdf.set_index("feature_id")
+    return gdf
+
+
+def _quackosm_cached_extract(
+    geometry=None,
+    place: Optional[str] = None,
+    tags_filter: Optional[Dict] = None,
+    **kwargs,
+) -> Tuple[str, object]:
+    """Return a cached, spatially sorted extract that answers a QuackOSM query.
+
+    A geometry query is answered by any cached extract with the same tag filter
+    whose area of interest covers the geometry. A place query is answered by a
+    previous extract of the same place. Otherwise QuackOSM converts the data once
+    and the result is added to the cache, with the boundary of the OSM extract or
+    of the geocoded place as its area of interest, so later geometry queries
+    inside a place can reuse it. Extracts older than OSM_CACHE_TTL are not reused.
+
+    Returns:
+        tuple: The path to the cached GeoParquet file, and the geometry to filter it
+            by (None when the file matches the query exactly).
+    """
+    import hashlib
+    import time
+
+    import quackosm as qosm
+    import shapely
+
+    key = _osm_cache_key(tags_filter, kwargs)
+    for entry in _load_osm_cache_index():
+        if entry["key"] != key:
+            continue
+        path = os.path.join(OSM_CACHE_DIR, entry["file"])
+        if place is not None and entry.get("place") == place:
+            return path, None
+        if geometry is not None and entry.get("geometry"):
+            aoi = shapely.from_wkt(entry["geometry"])
+            if aoi.equals(geometry):
+                return path, None
+            if aoi.covers(geometry):
+                return path, geometry
+
+    os.makedirs(OSM_CACHE_DIR, exist_ok=True)
+    name = hashlib.sha256(
+        f"{key}|{place}|{getattr(geometry, 'wkt', None)}|{time.time()}".encode()
+    ).hexdigest()[:24]
+    path = os.path.join(OSM_CACHE_DIR, f"{name}.parquet")
+    if place is not None:
+        try:
+            qosm.convert_osm_extract_to_parquet(
+                place, result_file_path=path, tags_filter=tags_filter, **kwargs
+            )
+        except Exception:
+            # Fall back to geocoding + geometry-based download
+            geometry = qosm.geocode_to_geometry(place)
+        else:
+            try:
+                from quackosm.osm_extracts import get_extract_by_query
+
+                geometry = get_extract_by_query(place).geometry
+            except Exception:
+                # Without the extract boundary, only the same place reuses it.
+                geometry = None
+    if not os.path.exists(path):
+        qosm.convert_geometry_to_parquet(
+            geometry, result_file_path=path, tags_filter=tags_filter, **kwargs
+        )
+    _sort_parquet_spatially(path)
+    _add_osm_cache_entry(
+        {
+            "file": os.path.basename(path),
+            "key": key,
+            "place": place,
+            "geometry": None if geometry is None else geometry.wkt,
+            "created": time.time(),
+        }
+    )
+    return path, None
+
+
+def clear_osm_cache() -> None:
+    """Remove all the QuackOSM extracts cached by leafmap."""
+    import shutil
+
+    shutil.rmtree(OSM_CACHE_DIR, ignore_errors=True)
+
+
 def quackosm_gdf_from_place(
     query: str,
     tags: Optional[Dict] = None,
     osm_extract_source: Optional[str] = None,
     verbosity_mode: Optional[str] = "transient",
+    cache: bool = True,
     **kwargs,
 ) -> gpd.GeoDataFrame:
     """Download OSM data for a place name using QuackOSM.
@@ -486,6 +692,10 @@ def quackosm_gdf_from_place(
             Defaults to None.
         verbosity_mode (str, optional): Verbosity mode for progress output. Options are
             "verbose", "transient", or "silent". Defaults to "transient".
+        cache (bool, optional): Whether to use the local extract cache in
+            OSM_CACHE_DIR. A request inside a previously extracted area with the
+            same tags is answered from the cached GeoParquet for up to
+            OSM_CACHE_TTL seconds (7 days). Defaults to True.
         **kwargs: Additional keyword arguments passed to QuackOSM's convert_osm_extract_to_geodataframe
             or convert_geometry_to_geodataframe functions.
 
@@ -518,6 +728,12 @@ def quackosm_gdf_from_place(
     # Set verbosity mode
     kwargs["verbosity_mode"] = verbosity_mode
 
+    if cache and not osm_extract_source:
+        path, geometry = _quackosm_cached_extract(
+            place=query, tags_filter=tags_filter, **kwargs
+        )
+        return _read_cached_extract(path, geometry)
+
     # Try using osm_extract_source first if specified
     if osm_extract_source:
         source = getattr(
@@ -546,6 +762,7 @@ def quackosm_gdf_from_bbox(
     bbox: Union[Tuple[float, float, float, float], List[float]],
     tags: Optional[Dict] = None,
     verbosity_mode: Optional[str] = "transient",
+    cache: bool = True,
     **kwargs,
 ) -> gpd.GeoDataFrame:
     """Download OSM data for a bounding box using QuackOSM.
@@ -563,6 +780,10 @@ def quackosm_gdf_from_bbox(
             for the given tag. Defaults to None (all features).
         verbosity_mode (str, optional): Verbosity mode for progress output. Options are
             "verbose", "transient", or "silent". Defaults to "transient".
+        cache (bool, optional): Whether to use the local extract cache in
+            OSM_CACHE_DIR. A request inside a previously extracted area with the
+            same tags is answered from the cached GeoParquet for up to
+            OSM_CACHE_TTL seconds (7 days). Defaults to True.
         **kwargs: Additional keyword arguments passed to QuackOSM's convert_geometry_to_geodataframe.
 
     Returns:
@@ -597,6 +818,12 @@ def quackosm_gdf_from_bbox(
     # Set verbosity mode
     kwargs["verbosity_mode"] = verbosity_mode
 
+    if cache:
+        path, geometry = _quackosm_cached_extract(
+            geometry, tags_filter=tags_filter, **kwargs
+        )
+        return _read_cached_extract(path, geometry)
+
     gdf = qosm.convert_geometry_to_geodataframe(
         geometry, tags_filter=tags_filter, **kwargs
     )
@@ -608,6 +835,7 @@ def quackosm_gdf_from_geometry(
     geometry,
     tags: Optional[Dict] = None,
     verbosity_mode: Optional[str] = "transient",
+    cache: bool = True,
     **kwargs,
 ) -> gpd.GeoDataFrame:
     """Download OSM data for a geometry using QuackOSM.
@@ -625,6 +853,10 @@ def quackosm_gdf_from_geometry(
             for the given tag. Defaults to None (all features).
         verbosity_mode (str, optional): Verbosity mode for progress output. Options are
             "verbose", "transient", or "silent". Defaults to "transient".
+        cache (bool, optional): Whether to use the local extract cache in
+            OSM_CACHE_DIR. A request inside a previously extracted area with the
+            same tags is answered from the cached GeoParquet for up to
+            OSM_CACHE_TTL seconds (7 days). Defaults to True.
         **kwargs: Additional keyword arguments passed to QuackOSM's convert_geometry_to_geodataframe.
 
     Returns:
@@ -668,6 +900,12 @@ def quackosm_gdf_from_geometry(
     # Set verbosity mode
     kwargs["verbosity_mode"] = verbosity_mode
 
+    if cache:
+        path, geometry = _quackosm_cached_extract(
+            geometry, tags_filter=tags_filter, **kwargs
+        )
+        return _read_cached_extract(path, geometry)
+
     gdf = qosm.convert_geometry_to_geodataframe(
         geometry, tags_filter=tags_filter, **kwargs
     )
@@ -776,6 +1014,7 @@ def quackosm_to_parquet(
     output_path: str,
     tags: Optional[Dict] = None,
     verbosity_mode: Optional[str] = "transient",
+    cache: bool = True,
     **kwargs,
 ) -> str:
     """Download OSM data and save to GeoParquet format using QuackOSM.
@@ -792,6 +1031,10 @@ def quackosm_to_parquet(
         output_path (str): Path to save the output GeoParquet file.
         tags (dict, optional): Dict of tags used for filtering OSM features. Defaults to None.
         verbosity_mode (str, optional): Verbosity mode for progress output. Defaults to "transient".
+        cache (bool, optional): Whether to use the local extract cache in
+            OSM_CACHE_DIR. A request inside a previously extracted area with the
+            same tags is answered from the cached GeoParquet for up to
+            OSM_CACHE_TTL seconds (7 days). Defaults to True.
         **kwargs: Additional keyword arguments passed to QuackOSM functions.
 
     Returns:
@@ -819,6 +1062,26 @@ def quackosm_to_parquet(
     # Set verbosity mode
     kwargs["verbosity_mode"] = verbosity_mode
 
+    if cache:
+        place = source if isinstance(source, str) else None
+        if isinstance(source, (tuple, list)) and len(source) == 4:
+            geometry = box(*source)
+        elif isinstance(source, gpd.GeoDataFrame):
+            geometry = source.geometry.unary_union
+        else:
+            geometry = None if place is not None else source
+        path, geometry = _quackosm_cached_extract(
+            geometry, place=place, tags_filter=tags_filter, **kwargs
+        )
+        if geometry is None:
+            import shutil
+
+            shutil.copyfile(path, output_path)
+        else:
+            gdf = _read_cached_extract(path, geometry)
+            gdf.reset_index().to_parquet(output_path, write_covering_bbox=True)
+        return str(output_path)
+
     # Determine source type and convert
     if isinstance(source, str):
         # Place name - try extract first, then geometry
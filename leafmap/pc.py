@@ -68,48 +68,161 @@ def get_bands(collection: str, item: Optional[str] = None) -> List[str]:
     return stac_bands(collection=collection, items=item)
 
 
+def _collection_signature(collection: dict) -> str:
+    """Return a value that changes whenever a collection is updated.
+
+    The ``updated`` timestamp is used when the collection provides one, otherwise
+    a hash of the collection document.
+    """
+    import hashlib
+
+    updated = collection.get("updated") or collection.get("properties", {}).get(
+        "updated"
+    )
+    if updated:
+        return str(updated)
+    text = json.dumps(collection, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _inventory_entry(collection: dict) -> Optional[dict]:
+    """Look up the first item and the assets of a collection for the inventory."""
+    from .httpcache import get_session
+
+    url = f"{PC_ENDPOINT}/collections/{collection['id']}/items"
+    response = get_session().get(url, params={"limit": 1}, timeout=60)
+    response.raise_for_status()
+    features = response.json().get("features", [])
+    if not features:
+        return None
+    first_item = features[0]["id"]
+    bands = stac_assets(collection=collection["id"], item=first_item)
+    if not isinstance(bands, list):
+        return None
+    return {
+        "title": collection.get("title"),
+        "first_item": first_item,
+        "bands": bands,
+        "updated": _collection_signature(collection),
+    }
+
+
 def get_pc_inventory(
-    refresh: Optional[bool] = False, verbose: Optional[bool] = False
+    refresh: Optional[bool] = False,
+    verbose: Optional[bool] = False,
+    max_workers: Optional[int] = 8,
+    cache_path: Optional[str] = None,
 ) -> dict[str, dict[str, Union[str, list, str]]]:
     """Get the inventory of the Microsoft Planetary Computer catalog.
 
+    The inventory is read from a user-level cache if one exists, otherwise from
+    the copy shipped with leafmap. A refresh only looks up collections that are
+    new or whose ``updated`` timestamp changed, using a pool of concurrent
+    requests, and saves the result to the user-level cache.
+
     Args:
         refresh (bool, optional): If True, refresh the inventory.
         verbose (bool, optional): If True, print the collections to the console.
+        max_workers (int, optional): The maximum number of collections looked up
+            concurrently during a refresh. Defaults to 8.
+        cache_path (str, optional): The user-level inventory cache. Defaults to
+            None, which uses ~/.cache/leafmap/pc_inventory.json.
 
     Returns:
         dict: A dictionary of collections and their bands.
     """
     import importlib.resources
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from datetime import datetime, timezone
+
+    from .httpcache import get_session
 
     pkg_dir = os.path.dirname(importlib.resources.files("leafmap") / "leafmap.py")
     filepath = os.path.join(pkg_dir, "data/pc_inventory.json")
+    if cache_path is None:
+        cache_path = os.path.join(
+            os.path.expanduser("~"), ".cache", "leafmap", "pc_inventory.json"
+        )
+
+    data = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as f:
+                data = json.load(f)["collections"]
+        except (OSError, ValueError, KeyError):
+            data = None
+    if data is None:
+        with open(filepath, "r") as f:
+            data = json.load(f)
 
-    if refresh:
-        catalog = Client.open(PC_ENDPOINT)
-        collections = catalog.get_children()
-        data = {}
-        for collection in collections:
+    if not refresh:
+        return data
+
+    collections = []
+    url = f"{PC_ENDPOINT}/collections"
+    while url:
+        response = get_session().get(url, timeout=60)
+        response.raise_for_status()
+        page = response.json()
+        collections.extend(page.get("collections", []))
+        url = next(
+            (link["href"] for link in page.get("links", []) if link["rel"] == "next"),
+            None,
+        )
+
+    stale = [
+        collection
+        for collection in collections
+        if data.get(collection["id"], {}).get("updated")
+        != _collection_signature(collection)
+    ]
+    inventory = {
+        collection["id"]: data[collection["id"]]
+        for collection in collections
+        if collection["id"] in data
+    }
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(_inventory_entry, collection): collection
+            for collection in stale
+        }
+        for future in as_completed(futures):
+            collection = futures[future]
             try:
-                if verbose:
-                    print(f"{collection.id} - {collection.title}")
-                first_item = get_first_item(collection.id, return_id=True)
-                bands = stac_assets(collection=collection.id, item=first_item)
-                if isinstance(bands, list):
-                    data[collection.id] = {}
-                    data[collection.id]["title"] = collection.title
-                    data[collection.id]["first_item"] = first_item
-                    data[collection.id]["bands"] = bands
+                entry = future.result()
             except Exception as e:
+                # Keep the previous entry, if any, when the lookup fails.
                 if verbose:
-                    print(f"{collection.id} has no bands.")
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=4)
-
-    else:
-        with open(filepath, "r") as f:
-            data = json.load(f)
+                    print(f"{collection['id']} could not be refreshed: {e}")
+                continue
+            if entry is None:
+                inventory.pop(collection["id"], None)
+                if verbose:
+                    print(f"{collection['id']} has no bands.")
+            else:
+                inventory[collection["id"]] = entry
+                if verbose:
+                    print(f"{collection['id']} - {collection.get('title')}")
+
+    data = {
+        collection["id"]: inventory[collection["id"]]
+        for collection in collections
+        if collection["id"] in inventory
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {
+                "updated": datetime.now(timezone.utc).isoformat(),
+                "collections": data,
+            },
+            f,
+            indent=4,
+        )
+    os.replace(tmp_path, cache_path)
 
     return data
 
@@ -582,12 +582,10 @@ class Map(go.FigureWidget):
             colorscale (str, optional): Color scale of the data. Defaults to "Viridis".
         """
         common.check_package("geopandas")
-        import json
-
         import geopandas as gpd
 
         gdf = gpd.read_file(data).to_crs(epsg=4326)
-        geojson = json.loads(gdf.to_json())
+        geojson = common.gdf_to_geojson(gdf)
 
         self.add_choroplethmapbox(
             geojson=geojson,
@@ -2644,113 +2644,394 @@ def maxar_child_collections(
         return collections
 
 
-def maxar_items(
+def _maxar_catalog_url() -> str:
+    """Return the URL of the Maxar Open Data root STAC catalog."""
+    return os.environ.get(
+        "MAXAR_STAC_API", "https://maxar-opendata.s3.amazonaws.com/events/catalog.json"
+    )
+
+
+def _maxar_cache_dir(cache_dir: Optional[str] = None) -> str:
+    """Return (and create) the directory holding the Maxar GeoParquet indexes.
+
+    Args:
+        cache_dir (str, optional): The cache directory. Defaults to None,
+            which uses ~/.cache/leafmap/maxar.
+
+    Returns:
+        str: The path to the cache directory.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "leafmap", "maxar")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _maxar_timestamp(value: Any) -> str:
+    """Normalize a date-like value to the ISO string format stored in the index."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _write_maxar_index(gdf: "gpd.GeoDataFrame", file_path: str) -> None:
+    """Write a GeoDataFrame to GeoParquet atomically, with a bbox covering column."""
+    temp_path = f"{file_path}.tmp"
+    try:
+        gdf.to_parquet(temp_path, index=False, write_covering_bbox=True)
+    except TypeError:
+        # geopandas < 1.0 does not support the covering bbox column.
+        gdf.to_parquet(temp_path, index=False)
+    os.replace(temp_path, file_path)
+
+
+def _read_maxar_index(
+    file_path: str,
+    bbox: Optional[List[float]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    filters: Optional[List[Tuple]] = None,
+) -> "gpd.GeoDataFrame":
+    """Read a Maxar GeoParquet index, pushing the bbox and date filters into the reader.
+
+    Args:
+        file_path (str): The path to the GeoParquet index.
+        bbox (list, optional): The bounding box [minx, miny, maxx, maxy]. Defaults to None.
+        start_date (str, optional): The start date, e.g., 2023-01-01. Defaults to None.
+        end_date (str, optional): The end date, e.g., 2023-12-31. Defaults to None.
+        filters (list, optional): Additional pyarrow filters. Defaults to None.
+
+    Returns:
+        gpd.GeoDataFrame: The matching rows of the index.
+    """
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    import pyarrow.parquet as pq
+
+    # Dates are filtered on the normalized "_datetime" string column when the
+    # index has one, so the original "datetime" column keeps its type.
+    date_column = "datetime"
+    if "_datetime" in pq.read_schema(file_path).names:
+        date_column = "_datetime"
+
+    filters = list(filters or [])
+    if start_date is not None:
+        filters.append((date_column, ">=", _maxar_timestamp(start_date)))
+    if end_date is not None:
+        filters.append((date_column, "<=", _maxar_timestamp(end_date)))
+
+    read_kwargs = {"filters": filters or None}
+    if bbox is not None:
+        try:
+            gdf = gpd.read_parquet(file_path, bbox=tuple(bbox), **read_kwargs)
+        except (TypeError, ValueError):
+            # Older geopandas or an index written without the bbox covering column.
+            gdf = gpd.read_parquet(file_path, **read_kwargs)
+            gdf = gdf.iloc[gdf.sindex.query(box(*bbox))].sort_index()
+    else:
+        gdf = gpd.read_parquet(file_path, **read_kwargs)
+
+    gdf = gdf.drop(columns=[c for c in ["bbox", "_datetime"] if c in gdf.columns])
+    return gdf.reset_index(drop=True)
+
+
+def _maxar_child_fingerprint(child: pystac.Catalog) -> str:
+    """Compute a fingerprint of a child catalog from the hrefs of its item links."""
+    import hashlib
+
+    hrefs = sorted(link.get_absolute_href() or "" for link in child.get_item_links())
+    return hashlib.sha1("\n".join(hrefs).encode("utf-8")).hexdigest()
+
+
+def _maxar_child_to_gdf(
+    collection_id: str, child: pystac.Catalog
+) -> "gpd.GeoDataFrame":
+    """Crawl the items of a Maxar child catalog into index rows.
+
+    Args:
+        collection_id (str): The collection ID the child belongs to.
+        child (pystac.Catalog): The child catalog.
+
+    Returns:
+        gpd.GeoDataFrame: One row per item, with one "asset:<name>" href column per
+            asset and the full STAC item serialized in the "stac_item" column.
+    """
+    import json
+
+    import geopandas as gpd
+
+    items = list(child.get_all_items())
+    for item in items:
+        item.make_asset_hrefs_absolute()
+
+    features = [item.to_dict() for item in items]
+    gdf = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+    gdf["collection_id"] = collection_id
+    gdf["child_id"] = child.id
+    gdf["item_id"] = [item.id for item in items]
+
+    asset_names = sorted({name for item in items for name in item.assets})
+    for name in asset_names:
+        gdf[f"asset:{name}"] = [
+            item.assets[name].href if name in item.assets else "" for item in items
+        ]
+
+    if "proj:bbox" in gdf.columns:
+        # convert bbox column type from list to string
+        gdf["proj:bbox"] = [",".join(map(str, l)) for l in gdf["proj:bbox"]]
+
+    # Parquet columns must be homogeneous, so nested properties are stored as JSON.
+    for column in gdf.columns:
+        if column != "geometry" and gdf[column].dtype == object:
+            if gdf[column].map(lambda x: isinstance(x, (list, dict))).any():
+                gdf[column] = gdf[column].map(
+                    lambda x: json.dumps(x) if isinstance(x, (list, dict)) else x
+                )
+
+    if "datetime" in gdf.columns:
+        gdf["datetime"] = pd.to_datetime(gdf["datetime"], utc=True).dt.strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+
+    gdf["stac_item"] = [json.dumps(feature) for feature in features]
+    return gdf
+
+
+def maxar_index(
     collection_id: str,
-    child_id: str,
-    return_gdf: Optional[bool] = True,
-    assets: Optional[List] = ["visual"],
+    child_ids: Optional[List[str]] = None,
+    bbox: Optional[List[float]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    refresh: Optional[bool] = False,
+    max_workers: Optional[int] = 8,
+    cache_dir: Optional[str] = None,
+    verbose: Optional[bool] = False,
     **kwargs: Any,
-) -> Union["gpd.GeoDataFrame", List[Dict[str, Any]]]:
-    """Retrieve STAC items from Maxar's public STAC API.
+) -> "gpd.GeoDataFrame":
+    """Build, update, and query the local GeoParquet index of a Maxar collection.
+
+    The index is stored at <cache_dir>/<collection_id>.parquet together with a JSON
+    manifest recording a fingerprint of the item links of every child catalog.
+    Child catalogs missing from the index are crawled on first use. When refresh is
+    True, the child catalogs are re-read and only those whose item links changed are
+    crawled again. Crawling runs in parallel across child catalogs, and only the
+    requested child catalogs are read when child_ids is given.
 
     Args:
         collection_id (str): The collection ID, e.g., Kahramanmaras-turkey-earthquake-23
             Use maxar_collections() to retrieve all available collection IDs.
-        child_id (str): The child collection ID, e.g., 1050050044DE7E00
-            Use maxar_child_collections() to retrieve all available child collection IDs.
-        return_gdf (bool, optional): If True, return a GeoDataFrame. Defaults to True.
-        assets (list, optional): A list of asset names to include in the GeoDataFrame.
-            It can be "visual", "ms_analytic", "pan_analytic", "data-mask". Defaults to ['visual'].
+        child_ids (list, optional): The child collection IDs to index and return.
+            Defaults to None, which uses all child collections.
+        bbox (list, optional): The bounding box [minx, miny, maxx, maxy] to filter by.
+            Defaults to None.
+        start_date (str, optional): The start date, e.g., 2023-01-01. Defaults to None.
+        end_date (str, optional): The end date, e.g., 2023-12-31. Defaults to None.
+        refresh (bool, optional): If True, check the catalog for changed child
+            catalogs and update the index. Defaults to False.
+        max_workers (int, optional): The number of threads used to crawl child
+            catalogs. Defaults to 8.
+        cache_dir (str, optional): The directory of the index. Defaults to None,
+            which uses ~/.cache/leafmap/maxar.
+        verbose (bool, optional): If True, print progress. Defaults to False.
         **kwargs (Any): Additional keyword arguments to pass to the pystac Catalog.from_file() method.
 
     Returns:
-        If return_gdf is True, return a GeoDataFrame.
+        gpd.GeoDataFrame: The index rows matching the query.
     """
+    import json
+    from concurrent.futures import ThreadPoolExecutor
 
-    import pickle
-    import tempfile
+    import geopandas as gpd
+    from pystac import Catalog
 
-    from pystac import Catalog, ItemCollection
+    if isinstance(child_ids, str):
+        child_ids = [child_ids]
 
-    file_path = os.path.join(
-        tempfile.gettempdir(), f"maxar-{collection_id}-{child_id}.pkl"
-    )
+    cache_dir = _maxar_cache_dir(cache_dir)
+    index_path = os.path.join(cache_dir, f"{collection_id}.parquet")
+    manifest_path = os.path.join(cache_dir, f"{collection_id}.json")
 
-    if os.path.exists(file_path):
-        with open(file_path, "rb") as f:
-            items = pickle.load(f)
-        if return_gdf:
-            import geopandas as gpd
+    manifest = {}
+    if os.path.exists(manifest_path) and os.path.exists(index_path):
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
 
-            gdf = gpd.GeoDataFrame.from_features(
-                pystac.ItemCollection(items).to_dict(), crs="EPSG:4326"
+    if child_ids is None:
+        up_to_date = bool(manifest) and manifest.get("complete", False)
+    else:
+        up_to_date = set(child_ids) <= set(manifest.get("children", {}))
+
+    if refresh or not up_to_date:
+        root_catalog = Catalog.from_file(_maxar_catalog_url(), **kwargs)
+        collection = root_catalog.get_child(collection_id)
+        if collection is None:
+            raise ValueError(
+                f"Invalid collection name. Use maxar_collections() to retrieve all available collection IDs."
+            )
+        child_hrefs = [
+            link.get_absolute_href() for link in collection.get_child_links()
+        ]
+        if child_ids is not None:
+            # Child catalog files are named after the child ID, so only the
+            # requested children need to be read.
+            requested = [
+                href
+                for href in child_hrefs
+                if any(child_id in os.path.basename(href) for child_id in child_ids)
+            ]
+            if len(requested) >= len(child_ids):
+                child_hrefs = requested
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            children = list(
+                executor.map(
+                    lambda href: Catalog.from_file(href, **kwargs), child_hrefs
+                )
             )
-            # convert bbox column type from list to string
-            gdf["proj:bbox"] = [",".join(map(str, l)) for l in gdf["proj:bbox"]]
-            if assets is not None:
-                if isinstance(assets, str):
-                    assets = [assets]
-                elif not isinstance(assets, list):
-                    raise ValueError("assets must be a list or a string.")
-
-                for asset in assets:
-                    links = []
-                    for item in items:
-                        if asset in item.get_assets():
-                            link = item.get_assets()[asset].get_absolute_href()
-                            links.append(link)
-                        else:
-                            links.append("")
-
-                    gdf[asset] = links
 
-            return gdf
-        else:
-            return items
+        known = manifest.get("children", {})
+        if child_ids is not None:
+            children = [child for child in children if child.id in child_ids]
 
-    if "MAXAR_STAC_API" in os.environ:
-        url = os.environ["MAXAR_STAC_API"]
-    else:
-        url = "https://maxar-opendata.s3.amazonaws.com/events/catalog.json"
+        fingerprints = {}
+        stale = []
+        for child in children:
+            fingerprint = _maxar_child_fingerprint(child)
+            fingerprints[child.id] = fingerprint
+            if known.get(child.id) != fingerprint:
+                stale.append(child)
 
-    root_catalog = Catalog.from_file(url, **kwargs)
+        if verbose:
+            print(
+                f"{len(stale)} out of {len(children)} child collections need to be crawled."
+            )
 
-    collection = root_catalog.get_child(collection_id)
-    child = collection.get_child(child_id)
+        if stale:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                new_rows = list(
+                    executor.map(
+                        lambda child: _maxar_child_to_gdf(collection_id, child), stale
+                    )
+                )
 
-    items = ItemCollection(child.get_all_items())
+            stale_ids = {child.id for child in stale}
+            frames = []
+            if os.path.exists(index_path):
+                existing = gpd.read_parquet(index_path)
+                if "bbox" in existing.columns:
+                    existing = existing.drop(columns=["bbox"])
+                frames.append(existing[~existing["child_id"].isin(stale_ids)])
+            frames.extend(new_rows)
+            gdf = gpd.GeoDataFrame(
+                pd.concat(frames, ignore_index=True), crs="EPSG:4326"
+            )
+            sort_columns = [c for c in ["child_id", "datetime"] if c in gdf.columns]
+            gdf = gdf.sort_values(sort_columns, ignore_index=True)
+            _write_maxar_index(gdf, index_path)
+
+        if child_ids is None:
+            # Drop child collections that no longer exist in the catalog.
+            removed = set(known) - set(fingerprints)
+            if removed and os.path.exists(index_path):
+                gdf = gpd.read_parquet(index_path)
+                if "bbox" in gdf.columns:
+                    gdf = gdf.drop(columns=["bbox"])
+                _write_maxar_index(gdf[~gdf["child_id"].isin(removed)], index_path)
+            known = {k: v for k, v in known.items() if k not in removed}
+        known.update(fingerprints)
+        manifest = {
+            "children": known,
+            "complete": child_ids is None or manifest.get("complete", False),
+        }
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    filters = None
+    if child_ids is not None:
+        filters = [("child_id", "in", list(child_ids))]
+
+    return _read_maxar_index(index_path, bbox, start_date, end_date, filters)
+
+
+def _maxar_index_to_items(
+    gdf: "gpd.GeoDataFrame",
+    return_gdf: Optional[bool] = True,
+    assets: Optional[List] = ["visual"],
+) -> Union["gpd.GeoDataFrame", pystac.ItemCollection]:
+    """Convert Maxar index rows to the output format of maxar_items().
+
+    Args:
+        gdf (gpd.GeoDataFrame): The index rows.
+        return_gdf (bool, optional): If True, return a GeoDataFrame. Defaults to True.
+        assets (list, optional): A list of asset names to include in the GeoDataFrame.
+            Defaults to ['visual'].
 
-    with open(file_path, "wb") as f:
-        pickle.dump(items, f)
+    Returns:
+        A GeoDataFrame if return_gdf is True, otherwise a pystac ItemCollection.
+    """
+    import json
 
-    if return_gdf:
-        import geopandas as gpd
+    import geopandas as gpd
 
-        gdf = gpd.GeoDataFrame.from_features(
-            pystac.ItemCollection(items).to_dict(), crs="EPSG:4326"
+    features = [json.loads(item) for item in gdf["stac_item"]]
+    if not return_gdf:
+        return pystac.ItemCollection(
+            [pystac.Item.from_dict(feature) for feature in features]
         )
+
+    # The index columns are flattened for filtering, so the result is built from
+    # the STAC items to keep the property values and types of the items.
+    result = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
+    if "proj:bbox" in result.columns:
         # convert bbox column type from list to string
-        gdf["proj:bbox"] = [",".join(map(str, l)) for l in gdf["proj:bbox"]]
-        if assets is not None:
-            if isinstance(assets, str):
-                assets = [assets]
-            elif not isinstance(assets, list):
-                raise ValueError("assets must be a list or a string.")
-
-            for asset in assets:
-                links = []
-                for item in items:
-                    if asset in item.get_assets():
-                        link = item.get_assets()[asset].get_absolute_href()
-                        links.append(link)
-                    else:
-                        links.append("")
+        result["proj:bbox"] = [",".join(map(str, l)) for l in result["proj:bbox"]]
+    if assets is not None:
+        if isinstance(assets, str):
+            assets = [assets]
+        elif not isinstance(assets, list):
+            raise ValueError("assets must be a list or a string.")
 
-                gdf[asset] = links
+        for asset in assets:
+            result[asset] = [
+                feature.get("assets", {}).get(asset, {}).get("href", "")
+                for feature in features
+            ]
 
-        return gdf
-    else:
-        return items
+    return result
+
+
+def maxar_items(
+    collection_id: str,
+    child_id: str,
+    return_gdf: Optional[bool] = True,
+    assets: Optional[List] = ["visual"],
+    **kwargs: Any,
+) -> Union["gpd.GeoDataFrame", List[Dict[str, Any]]]:
+    """Retrieve STAC items from Maxar's public STAC API.
+
+    The items are read from the local GeoParquet index (see maxar_index()), which is
+    populated the first time a child collection is requested.
+
+    Args:
+        collection_id (str): The collection ID, e.g., Kahramanmaras-turkey-earthquake-23
+            Use maxar_collections() to retrieve all available collection IDs.
+        child_id (str): The child collection ID, e.g., 1050050044DE7E00
+            Use maxar_child_collections() to retrieve all available child collection IDs.
+        return_gdf (bool, optional): If True, return a GeoDataFrame. Defaults to True.
+        assets (list, optional): A list of asset names to include in the GeoDataFrame.
+            It can be "visual", "ms_analytic", "pan_analytic", "data-mask". Defaults to ['visual'].
+        **kwargs (Any): Additional keyword arguments to pass to maxar_index(),
+            e.g., refresh, cache_dir, or the pystac Catalog.from_file() method.
+
+    Returns:
+        If return_gdf is True, return a GeoDataFrame.
+    """
+
+    gdf = maxar_index(collection_id, child_ids=[child_id], **kwargs)
+    return _maxar_index_to_items(gdf, return_gdf, assets)
 
 
 def maxar_all_items(
@@ -2762,6 +3043,9 @@ def maxar_all_items(
 ) -> Union["gpd.GeoDataFrame", List[Dict[str, Any]]]:
     """Retrieve STAC items from Maxar's public STAC API.
 
+    The items are read from the local GeoParquet index (see maxar_index()). Child
+    collections that are not indexed yet are crawled in parallel.
+
     Args:
         collection_id (str): The collection ID, e.g., Kahramanmaras-turkey-earthquake-23
             Use maxar_collections() to retrieve all available collection IDs.
@@ -2769,38 +3053,24 @@ def maxar_all_items(
         assets (list, optional): A list of asset names to include in the GeoDataFrame.
             It can be "visual", "ms_analytic", "pan_analytic", "data-mask". Defaults to ['visual'].
         verbose (bool, optional): If True, print progress. Defaults to True.
-        **kwargs (Any): Additional keyword arguments to pass to the pystac Catalog.from_file() method.
+        **kwargs (Any): Additional keyword arguments to pass to maxar_index(),
+            e.g., refresh, max_workers, cache_dir, or the pystac Catalog.from_file() method.
 
     Returns:
         If return_gdf is True, return a GeoDataFrame.
     """
 
-    child_ids = maxar_child_collections(collection_id, **kwargs)
-    for index, child_id in enumerate(child_ids):
-        if verbose:
-            print(
-                f"Processing ({str(index + 1).zfill(len(str(len(child_ids))))} out of {len(child_ids)}): {child_id} ..."
-            )
-        items = maxar_items(collection_id, child_id, return_gdf, assets, **kwargs)
-        if return_gdf:
-            if child_id == child_ids[0]:
-                gdf = items
-            else:
-                gdf = pd.concat([gdf, items], ignore_index=True)
-        else:
-            if child_id == child_ids[0]:
-                items_all = items
-            else:
-                items_all.extend(items)
+    gdf = maxar_index(collection_id, verbose=verbose, **kwargs)
+    return _maxar_index_to_items(gdf, return_gdf, assets)
 
-    if return_gdf:
-        return gdf
-    else:
-        return items_all
 
+def maxar_refresh(cache_dir: Optional[str] = None):
+    """Refresh the cached Maxar STAC items.
 
-def maxar_refresh():
-    """Refresh the cached Maxar STAC items."""
+    Args:
+        cache_dir (str, optional): The directory of the Maxar indexes. Defaults to None,
+            which uses ~/.cache/leafmap/maxar.
+    """
     import tempfile
 
     temp_dir = tempfile.gettempdir()
@@ -2808,14 +3078,29 @@ def maxar_refresh():
         if f.startswith("maxar-"):
             os.remove(os.path.join(temp_dir, f))
 
+    cache_dir = _maxar_cache_dir(cache_dir)
+    for f in os.listdir(cache_dir):
+        if f.endswith((".parquet", ".json", ".tmp")):
+            os.remove(os.path.join(cache_dir, f))
+
     print("Maxar STAC items cache has been refreshed.")
 
 
 def maxar_search(
-    collection, start_date=None, end_date=None, bbox=None, within=False, align=True
+    collection,
+    start_date=None,
+    end_date=None,
+    bbox=None,
+    within=False,
+    align=True,
+    refresh=False,
+    cache_dir=None,
 ) -> "gpd.GeoDataFrame":
     """Search Maxar Open Data by collection ID, date range, and/or bounding box.
 
+    The collection is downloaded once and stored as a local GeoParquet file, so that
+    subsequent searches only read the row groups matching the bounding box and dates.
+
     Args:
         collection (str): The collection ID, e.g., Kahramanmaras-turkey-earthquake-23.
             Use maxar_collections() to retrieve all available collection IDs.
@@ -2824,24 +3109,41 @@ def maxar_search(
         bbox (list | GeoDataFrame): The bounding box to filter by. Can be a list of 4 coordinates or a file path or a GeoDataFrame.
         within (bool, optional): Whether to filter by the bounding box or the bounding box's interior. Defaults to False.
         align (bool, optional): If True, automatically aligns GeoSeries based on their indices. If False, the order of elements is preserved.
+        refresh (bool, optional): If True, download the collection again. Defaults to False.
+        cache_dir (str, optional): The directory of the local GeoParquet files.
+            Defaults to None, which uses ~/.cache/leafmap/maxar.
 
     Returns:
         A GeoDataFrame containing the search results.
     """
-    import datetime
-
     import geopandas as gpd
-    import pandas as pd
     from shapely.geometry import Polygon
 
-    collections = maxar_collections()
-    if collection not in collections:
-        raise ValueError(
-            f"Invalid collection name. Use maxar_collections() to retrieve all available collection IDs."
+    file_path = os.path.join(
+        _maxar_cache_dir(cache_dir), f"{collection}-search.parquet"
+    )
+
+    if refresh or not os.path.exists(file_path):
+        collections = maxar_collections()
+        if collection not in collections:
+            raise ValueError(
+                f"Invalid collection name. Use maxar_collections() to retrieve all available collection IDs."
+            )
+
+        url = f"https://raw.githubusercontent.com/giswqs/maxar-open-data/master/datasets/{collection}.geojson"
+        data = gpd.read_file(url)
+        data["_datetime"] = pd.to_datetime(data["datetime"], utc=True).dt.strftime(
+            "%Y-%m-%dT%H:%M:%S"
         )
+        data = data.sort_values("_datetime", ignore_index=True)
+        _write_maxar_index(data, file_path)
+
+    if isinstance(bbox, str):
+        bbox = gpd.read_file(bbox)
+    if isinstance(bbox, gpd.GeoDataFrame):
+        bbox = bbox.to_crs("epsg:4326").total_bounds.tolist()
 
-    url = f"https://raw.githubusercontent.com/giswqs/maxar-open-data/master/datasets/{collection}.geojson"
-    data = gpd.read_file(url)
+    data = _read_maxar_index(file_path, bbox, start_date, end_date)
 
     if bbox is not None:
         bbox = gpd.GeoDataFrame(
@@ -2853,19 +3155,7 @@ def maxar_search(
         else:
             data = data[data.intersects(bbox.union_all(), align=align)]
 
-    date_field = "datetime"
-    new_field = f"{date_field}_temp"
-    data[new_field] = pd.to_datetime(data[date_field])
-
-    if end_date is None:
-        end_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
-    if start_date is None:
-        start_date = data[new_field].min()
-
-    mask = (data[new_field] >= start_date) & (data[new_field] <= end_date)
-    result = data.loc[mask]
-    return result.drop(columns=[new_field], axis=1)
+    return data
 
 
 def maxar_collection_url(collection, dtype="geojson", raw=True) -> str:
@@ -23,7 +23,6 @@ from __future__ import annotations
 
 import logging
 import os
-import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
@@ -127,25 +126,258 @@ def logout() -> None:
     print("Logged out from Terrascope")
 
 
+class _TileServer:
+    """A single local tile server that renders many raster sources.
+
+    Sources are registered cheaply (no I/O) and get a short id that is part of
+    the tile URL: ``/tiles/{source_id}/{z}/{x}/{y}.png``. A source's dataset is
+    opened the first time one of its tiles is requested, and closed again after
+    ``idle_timeout`` seconds without requests or when more than ``max_open``
+    datasets are open, least recently used first.
+    """
+
+    def __init__(self, max_open: int = 32, idle_timeout: float = 300) -> None:
+        import threading
+
+        self.max_open = max_open
+        self.idle_timeout = idle_timeout
+        self._sources: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def start(self) -> None:
+        """Start serving on a free local port in a daemon thread."""
+        import http.server
+        import threading
+
+        if self._httpd is not None:
+            return
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = self.path.split("?")[0].strip("/").split("/")
+                try:
+                    if len(parts) != 5 or parts[0] != "tiles":
+                        raise KeyError(self.path)
+                    z, x, y = int(parts[2]), int(parts[3]), int(parts[4][:-4])
+                    body = server.render(parts[1], z, x, y)
+                except (KeyError, ValueError):
+                    self.send_error(404)
+                    return
+                except Exception as e:
+                    _logger.warning("Failed to render tile %s: %s", self.path, e)
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/png")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and close all the open datasets."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        with self._lock:
+            for source in self._sources.values():
+                self._close(source)
+            self._sources.clear()
+
+    def register(
+        self,
+        href: str,
+        indexes: int | list[int] | None = None,
+        colormap: str | None = None,
+        vmin: float | None = None,
+        vmax: float | None = None,
+        nodata: float | None = None,
+    ) -> str:
+        """Register a raster source and return its id. Nothing is read yet."""
+        import hashlib
+        import json
+        import threading
+
+        options = {
+            "href": href,
+            "indexes": indexes,
+            "colormap": colormap,
+            "vmin": vmin,
+            "vmax": vmax,
+            "nodata": nodata,
+        }
+        key = json.dumps(options, sort_keys=True, default=str)
+        source_id = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            if source_id not in self._sources:
+                self._sources[source_id] = dict(
+                    options, dataset=None, vrt=None, used=0.0, lock=threading.Lock()
+                )
+        return source_id
+
+    def tile_url(self, source_id: str) -> str:
+        """Return the XYZ tile URL template of a registered source."""
+        prefix = os.environ.get("LOCALTILESERVER_CLIENT_PREFIX")
+        if prefix:
+            base = "/" + prefix.format(port=self.port).strip("/")
+        else:
+            base = f"http://127.0.0.1:{self.port}"
+        return f"{base}/tiles/{source_id}/{{z}}/{{x}}/{{y}}.png"
+
+    @staticmethod
+    def _close(source: dict) -> None:
+        for key in ["vrt", "dataset"]:
+            if source[key] is not None:
+                source[key].close()
+                source[key] = None
+
+    def _evict(self) -> None:
+        import time
+
+        now = time.time()
+        open_sources = sorted(
+            (s for s in self._sources.values() if s["dataset"] is not None),
+            key=lambda s: s["used"],
+        )
+        excess = len(open_sources) - self.max_open
+        for i, source in enumerate(open_sources):
+            if i < excess or now - source["used"] > self.idle_timeout:
+                if source["lock"].acquire(blocking=False):
+                    try:
+                        self._close(source)
+                    finally:
+                        source["lock"].release()
+
+    def render(self, source_id: str, z: int, x: int, y: int, size: int = 256) -> bytes:
+        """Render one tile of a source as PNG bytes."""
+        import io
+        import time
+
+        import matplotlib
+        import numpy as np
+        import rasterio
+        from PIL import Image
+        from rasterio.enums import Resampling
+        from rasterio.errors import WindowError
+        from rasterio.vrt import WarpedVRT
+        from rasterio.windows import Window, from_bounds
+
+        from .tilegrid import tile_xy_bounds
+
+        source = self._sources[source_id]
+        indexes = source["indexes"] or 1
+        count = len(indexes) if isinstance(indexes, (list, tuple)) else 1
+        data = np.ma.masked_all((count, size, size), dtype="float64")
+
+        with source["lock"]:
+            if source["dataset"] is None:
+                source["dataset"] = rasterio.open(source["href"])
+                source["vrt"] = WarpedVRT(
+                    source["dataset"],
+                    crs="EPSG:3857",
+                    nodata=source["nodata"],
+                    resampling=Resampling.nearest,
+                )
+            source["used"] = time.time()
+            vrt = source["vrt"]
+            bounds = tile_xy_bounds(x, y, z)
+            tile_window = from_bounds(*bounds, transform=vrt.transform)
+            try:
+                window = tile_window.intersection(Window(0, 0, vrt.width, vrt.height))
+            except WindowError:
+                window = None
+            if window is not None and window.width > 0 and window.height > 0:
+                scale_x = size / tile_window.width
+                scale_y = size / tile_window.height
+                col = int(round((window.col_off - tile_window.col_off) * scale_x))
+                row = int(round((window.row_off - tile_window.row_off) * scale_y))
+                width = min(size - col, max(1, int(round(window.width * scale_x))))
+                height = min(size - row, max(1, int(round(window.height * scale_y))))
+                values = vrt.read(
+                    indexes if count > 1 else [indexes],
+                    window=window,
+                    out_shape=(count, height, width),
+                    masked=True,
+                    resampling=Resampling.nearest,
+                )
+                data[:, row : row + height, col : col + width] = values
+
+        with self._lock:
+            self._evict()
+
+        vmin = data.min() if source["vmin"] is None else source["vmin"]
+        vmax = data.max() if source["vmax"] is None else source["vmax"]
+        if np.ma.is_masked(vmin) or np.ma.is_masked(vmax):
+            vmin, vmax = 0, 1
+        scaled = (data - vmin) / ((vmax - vmin) or 1)
+        if count == 1:
+            cmap = matplotlib.colormaps[source["colormap"] or "gray"]
+            rgba = cmap(np.ma.clip(scaled[0], 0, 1).filled(0), bytes=True)
+        else:
+            rgba = np.empty((size, size, 4), dtype="uint8")
+            rgba[..., :3] = (np.clip(scaled[:3].filled(0), 0, 1) * 255).transpose(
+                1, 2, 0
+            )
+            rgba[..., 3] = 255
+        rgba[..., 3][np.ma.getmaskarray(data).any(axis=0)] = 0
+
+        buffer = io.BytesIO()
+        Image.fromarray(rgba).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+_tile_server: _TileServer | None = None
+
+
+def get_tile_server(max_open: int = 32, idle_timeout: float = 300) -> _TileServer:
+    """
+    Get the shared local tile server, starting it if needed.
+
+    Args:
+        max_open: Maximum number of raster datasets kept open at once.
+        idle_timeout: Seconds after which an unused dataset is closed.
+
+    Returns:
+        The shared tile server.
+    """
+    global _tile_server
+    if _tile_server is None:
+        _tile_server = _TileServer(max_open=max_open, idle_timeout=idle_timeout)
+    else:
+        _tile_server.max_open = max_open
+        _tile_server.idle_timeout = idle_timeout
+    _tile_server.start()
+    return _tile_server
+
+
 def cleanup_tile_servers() -> None:
     """
-    Kill stale localtileserver processes.
+    Stop the shared tile server and close its open datasets.
 
     This is useful when switching between visualizations to avoid
-    authentication errors from old tile server processes that have
-    cached expired tokens.
-
-    Note:
-        This uses pkill which is Unix-specific and will terminate all
-        localtileserver processes for the current user, not just those
-        started by this session.
+    authentication errors from datasets opened with old credentials.
+    Only the server started by this session is affected.
     """
-    try:
-        subprocess.run(["pkill", "-f", "localtileserver"], capture_output=True)
-    except Exception:
-        # Ignore errors: pkill may not exist on all platforms (e.g., Windows),
-        # or no matching processes may be found. This cleanup is best-effort.
-        pass
+    global _tile_server
+    if _tile_server is not None:
+        _tile_server.stop()
+        _tile_server = None
 
 
 def get_stac_client() -> Any:
@@ -341,6 +573,10 @@ def create_time_layers(
     """
     Create tile layers for time slider visualization.
 
+    All the layers are served by one shared local tile server. A date's raster
+    is only opened when its layer is first displayed, and is closed again when
+    it has not been displayed for a while.
+
     Args:
         items: List of pystac Item objects.
         asset_key: Asset key to use (default "NDVI").
@@ -357,23 +593,25 @@ def create_time_layers(
         >>> m = leafmap.Map()
         >>> m.add_time_slider(layers)
     """
-    try:
-        import leafmap
-    except ImportError:
-        raise ImportError("leafmap is required: pip install leafmap")
+    import ipyleaflet
 
+    server = get_tile_server()
     layers = {}
     for item in items:
         if asset_key not in item.assets:
             continue
         date_str = item.datetime.strftime("%Y-%m-%d")
-        tile_layer = leafmap.get_local_tile_layer(
+        source_id = server.register(
             item.assets[asset_key].href,
-            layer_name=date_str,
             colormap=colormap,
             vmin=vmin,
             vmax=vmax,
         )
-        layers[date_str] = tile_layer
+        layers[date_str] = ipyleaflet.TileLayer(
+            url=server.tile_url(source_id),
+            name=date_str,
+            max_zoom=30,
+            max_native_zoom=30,
+        )
 
     return layers
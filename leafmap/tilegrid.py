@@ -0,0 +1,359 @@
+"""Vectorized tile math for the Web Mercator (XYZ) tile grid.
+
+All functions accept scalars or NumPy arrays and operate on whole arrays at once,
+so converting millions of coordinates or tiles does not involve Python loops.
+Tiles follow the XYZ (Google/OSM) convention with the origin at the top left.
+"""
+
+from typing import Any, List, Tuple
+
+import numpy as np
+
+EARTH_EQUATORIAL_RADIUS = 6378137.0
+ORIGIN_SHIFT = np.pi * EARTH_EQUATORIAL_RADIUS
+MAX_LATITUDE = 85.0511287798066
+# Web Mercator resolution in meters per pixel of a 256 x 256 tile at zoom level 0
+ZOOM_0_RESOLUTION = 2 * ORIGIN_SHIFT / 256
+
+
+def lnglat_to_meters(longitude: Any, latitude: Any) -> Tuple[Any, Any]:
+    """Convert longitude/latitude in decimal degrees to Web Mercator meters.
+
+    Latitudes beyond the poles of the projection are clamped to the edge of the map.
+
+    Args:
+        longitude (float | array): The longitudes.
+        latitude (float | array): The latitudes.
+
+    Returns:
+        tuple: The (x, y) coordinates in meters.
+    """
+    longitude = np.asarray(longitude, dtype="float64")
+    latitude = np.asarray(latitude, dtype="float64")
+    x = longitude * ORIGIN_SHIFT / 180.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = np.log(np.tan((90 + latitude) * np.pi / 360.0)) * ORIGIN_SHIFT / np.pi
+    x = np.where(np.isnan(x), np.where(longitude > 0, 20026376, -20026376), x)
+    y = np.where(np.isfinite(y), y, np.where(latitude > 0, 20048966, -20048966))
+    return x[()], y[()]
+
+
+def meters_to_lnglat(x: Any, y: Any) -> Tuple[Any, Any]:
+    """Convert Web Mercator meters to longitude/latitude in decimal degrees.
+
+    Args:
+        x (float | array): The x coordinates in meters.
+        y (float | array): The y coordinates in meters.
+
+    Returns:
+        tuple: The (longitude, latitude) in decimal degrees.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    longitude = x / ORIGIN_SHIFT * 180.0
+    latitude = np.degrees(
+        2 * np.arctan(np.exp(y / EARTH_EQUATORIAL_RADIUS)) - np.pi / 2
+    )
+    return longitude[()], latitude[()]
+
+
+def zoom_to_resolution(zoom: Any, tile_size: int = 256) -> Any:
+    """Get the Web Mercator resolution of a zoom level at the equator.
+
+    Args:
+        zoom (int | array): The zoom levels.
+        tile_size (int, optional): The tile size in pixels. Defaults to 256.
+
+    Returns:
+        float | array: The resolution in meters per pixel.
+    """
+    return (ZOOM_0_RESOLUTION * 256 / tile_size) / np.power(
+        2.0, np.asarray(zoom, dtype="float64")
+    )[()]
+
+
+def resolution_to_zoom(resolution: Any, tile_size: int = 256) -> Any:
+    """Get the zoom level whose resolution is closest to, but not finer than, a resolution.
+
+    Args:
+        resolution (float | array): The resolution in meters per pixel.
+        tile_size (int, optional): The tile size in pixels. Defaults to 256.
+
+    Returns:
+        int | array: The zoom levels.
+    """
+    resolution = np.asarray(resolution, dtype="float64")
+    zoom = np.log2((ZOOM_0_RESOLUTION * 256 / tile_size) / resolution)
+    return zoom.astype("int64")[()]
+
+
+def lnglat_to_tile(
+    longitude: Any, latitude: Any, zoom: int, fractional: bool = False
+) -> Tuple[Any, Any]:
+    """Get the tiles containing longitude/latitude coordinates.
+
+    Args:
+        longitude (float | array): The longitudes.
+        latitude (float | array): The latitudes. Clamped to the Web Mercator limits.
+        zoom (int): The zoom level.
+        fractional (bool, optional): If True, return the fractional tile coordinates
+            instead of the tile indices. Defaults to False.
+
+    Returns:
+        tuple: The (x, y) tile coordinates.
+    """
+    longitude = np.asarray(longitude, dtype="float64")
+    latitude = np.clip(
+        np.asarray(latitude, dtype="float64"), -MAX_LATITUDE, MAX_LATITUDE
+    )
+    n = 2.0**zoom
+    lat_r = np.radians(latitude)
+    x = (longitude + 180.0) / 360.0 * n
+    y = (1.0 - np.log(np.tan(lat_r) + 1.0 / np.cos(lat_r)) / np.pi) / 2.0 * n
+    if fractional:
+        return x[()], y[()]
+
+    # Points on the right or bottom edge of the map belong to the last tile.
+    x = np.clip(np.floor(x), 0, n - 1).astype("int64")
+    y = np.clip(np.floor(y), 0, n - 1).astype("int64")
+    return x[()], y[()]
+
+
+def tile_to_lnglat(x: Any, y: Any, zoom: Any) -> Tuple[Any, Any]:
+    """Get the longitude/latitude of the top left corner of tiles.
+
+    Fractional tile coordinates are supported.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int | array): The zoom levels.
+
+    Returns:
+        tuple: The (longitude, latitude) in decimal degrees.
+    """
+    n = np.power(2.0, np.asarray(zoom, dtype="float64"))
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    longitude = x / n * 360.0 - 180.0
+    latitude = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y / n))))
+    return longitude[()], latitude[()]
+
+
+def tile_bounds(x: Any, y: Any, zoom: Any) -> np.ndarray:
+    """Get the longitude/latitude bounds of tiles.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int | array): The zoom levels.
+
+    Returns:
+        np.ndarray: An array of [west, south, east, north] with a shape of (..., 4).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    west, north = tile_to_lnglat(x, y, zoom)
+    east, south = tile_to_lnglat(x + 1, y + 1, zoom)
+    return np.stack([west, south, east, north], axis=-1)
+
+
+def tile_xy_bounds(x: Any, y: Any, zoom: Any) -> np.ndarray:
+    """Get the Web Mercator bounds of tiles.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int | array): The zoom levels.
+
+    Returns:
+        np.ndarray: An array of [xmin, ymin, xmax, ymax] in meters with a shape of (..., 4).
+    """
+    size = 2 * ORIGIN_SHIFT / np.power(2.0, np.asarray(zoom, dtype="float64"))
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    xmin = x * size - ORIGIN_SHIFT
+    ymax = ORIGIN_SHIFT - y * size
+    return np.stack([xmin, ymax - size, xmin + size, ymax], axis=-1)
+
+
+def _bbox_tile_ranges(bbox: Any, zoom: int) -> List[Tuple[int, int, int, int]]:
+    """Get the inclusive (x0, x1, y0, y1) tile ranges of a bounding box.
+
+    A bounding box crossing the antimeridian has two ranges.
+    """
+    west, south, east, north = bbox
+    if west > east:
+        return _bbox_tile_ranges([west, south, 180.0, north], zoom) + _bbox_tile_ranges(
+            [-180.0, south, east, north], zoom
+        )
+
+    (x0, x1), (y1, y0) = lnglat_to_tile([west, east], [south, north], zoom)
+    # A bounding box ending exactly on a tile edge does not include the next tile.
+    fx, fy = lnglat_to_tile([east], [south], zoom, fractional=True)
+    if x1 > x0 and fx[0] == x1:
+        x1 -= 1
+    if y1 > y0 and fy[0] == y1:
+        y1 -= 1
+    return [(int(x0), int(x1), int(y0), int(y1))]
+
+
+def _range_tiles(x0: int, x1: int, y0: int, y1: int, zoom: int) -> np.ndarray:
+    """Get the tiles of inclusive column and row ranges, ordered by column, then row."""
+    xs, ys = np.meshgrid(
+        np.arange(x0, x1 + 1, dtype="int64"),
+        np.arange(y0, y1 + 1, dtype="int64"),
+        indexing="ij",
+    )
+    return np.column_stack([xs.ravel(), ys.ravel(), np.full(xs.size, zoom)])
+
+
+def bbox_to_tiles(bbox: Any, zoom: int) -> np.ndarray:
+    """Get all the tiles intersecting a bounding box.
+
+    Bounding boxes crossing the antimeridian (west > east) are supported.
+
+    Args:
+        bbox (list): The bounding box [west, south, east, north] in decimal degrees.
+        zoom (int): The zoom level.
+
+    Returns:
+        np.ndarray: An (N, 3) array of [x, y, z] ordered by column, then row.
+    """
+    return np.concatenate(
+        [_range_tiles(*bounds, zoom) for bounds in _bbox_tile_ranges(bbox, zoom)]
+    )
+
+
+def tile_cover(geometry: Any, zoom: int, chunk_size: int = 1_000_000) -> np.ndarray:
+    """Get the tiles intersecting a geometry.
+
+    The candidate tiles of the bounding box are generated and tested against the
+    geometry with vectorized shapely predicates in blocks of columns of about
+    chunk_size tiles, so the full candidate grid is never built.
+
+    Args:
+        geometry (shapely.Geometry | dict): The geometry in EPSG:4326, or a GeoJSON geometry.
+        zoom (int): The zoom level.
+        chunk_size (int, optional): The number of candidate tiles tested at once.
+            Defaults to 1,000,000.
+
+    Returns:
+        np.ndarray: An (N, 3) array of [x, y, z] ordered by column, then row.
+    """
+    import shapely
+
+    if isinstance(geometry, dict):
+        geometry = shapely.geometry.shape(geometry)
+
+    shapely.prepare(geometry)
+    covered = []
+    for x0, x1, y0, y1 in _bbox_tile_ranges(shapely.bounds(geometry), zoom):
+        columns = max(1, chunk_size // (y1 - y0 + 1))
+        for start in range(x0, x1 + 1, columns):
+            chunk = _range_tiles(start, min(start + columns - 1, x1), y0, y1, zoom)
+            bounds = tile_bounds(chunk[:, 0], chunk[:, 1], zoom)
+            boxes = shapely.box(bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3])
+            covered.append(chunk[shapely.intersects(geometry, boxes)])
+    if not covered:
+        return np.empty((0, 3), dtype="int64")
+    return np.concatenate(covered)
+
+
+def tile_to_quadkey(x: Any, y: Any, zoom: int) -> Any:
+    """Get the Bing Maps quadkeys of tiles.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int): The zoom level.
+
+    Returns:
+        str | np.ndarray: The quadkeys.
+    """
+    x = np.asarray(x, dtype="int64")
+    y = np.asarray(y, dtype="int64")
+    if zoom == 0:
+        return np.full(x.shape, "", dtype="<U1")[()]
+
+    # One base-4 digit per zoom level, from the most significant bit down.
+    shifts = np.arange(zoom - 1, -1, -1)
+    digits = ((x[..., None] >> shifts) & 1) + 2 * ((y[..., None] >> shifts) & 1)
+    chars = (digits + ord("0")).astype("uint8")
+    keys = chars.reshape(-1).view(f"S{zoom}").astype(f"<U{zoom}")
+    return keys.reshape(x.shape)[()]
+
+
+def quadkey_to_tile(quadkey: Any) -> Tuple[Any, Any, Any]:
+    """Get the tiles of Bing Maps quadkeys.
+
+    Args:
+        quadkey (str | array): The quadkeys. All the quadkeys of an array must have
+            the same length.
+
+    Returns:
+        tuple: The (x, y, z) tile coordinates.
+    """
+    keys = np.asarray(quadkey, dtype="S")
+    zoom = keys.dtype.itemsize if keys.size and keys.reshape(-1)[0] else 0
+    if zoom == 0:
+        zeros = np.zeros(keys.shape, dtype="int64")
+        return zeros[()], zeros[()], zeros[()]
+
+    digits = keys.reshape(-1).view("uint8").reshape(-1, zoom).astype("int64") - ord("0")
+    if digits.min() < 0 or digits.max() > 3:
+        raise ValueError("Quadkeys must only contain the digits 0 to 3.")
+    weights = 1 << np.arange(zoom - 1, -1, -1)
+    x = ((digits & 1) * weights).sum(axis=1).reshape(keys.shape)
+    y = ((digits >> 1) * weights).sum(axis=1).reshape(keys.shape)
+    return x[()], y[()], np.full(keys.shape, zoom, dtype="int64")[()]
+
+
+def tile_parent(x: Any, y: Any, zoom: int, parent_zoom: int = None) -> Tuple:
+    """Get the parent tiles at a lower zoom level.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int): The zoom level of the tiles.
+        parent_zoom (int, optional): The zoom level of the parents. Defaults to zoom - 1.
+
+    Returns:
+        tuple: The (x, y, z) coordinates of the parents.
+    """
+    if parent_zoom is None:
+        parent_zoom = zoom - 1
+    if not 0 <= parent_zoom <= zoom:
+        raise ValueError("parent_zoom must be between 0 and zoom.")
+
+    shift = zoom - parent_zoom
+    x = np.asarray(x, dtype="int64") >> shift
+    y = np.asarray(y, dtype="int64") >> shift
+    return x[()], y[()], parent_zoom
+
+
+def tile_children(x: Any, y: Any, zoom: int, child_zoom: int = None) -> np.ndarray:
+    """Get all the child tiles at a higher zoom level.
+
+    Args:
+        x (int | array): The tile columns.
+        y (int | array): The tile rows.
+        zoom (int): The zoom level of the tiles.
+        child_zoom (int, optional): The zoom level of the children. Defaults to zoom + 1.
+
+    Returns:
+        np.ndarray: An (N, 3) array of [x, y, z], grouped by parent tile.
+    """
+    if child_zoom is None:
+        child_zoom = zoom + 1
+    if child_zoom < zoom:
+        raise ValueError("child_zoom must not be lower than zoom.")
+
+    shift = child_zoom - zoom
+    size = 1 << shift
+    x = np.atleast_1d(np.asarray(x, dtype="int64"))
+    y = np.atleast_1d(np.asarray(y, dtype="int64"))
+    dx, dy = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+    xs = ((x << shift)[:, None] + dx.ravel()).ravel()
+    ys = ((y << shift)[:, None] + dy.ravel()).ravel()
+    return np.column_stack([xs, ys, np.full(xs.size, child_zoom)])
@@ -2,12 +2,16 @@
 
 """Tests for `leafmap` package."""
 
+import contextlib
 import os
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
 import geopandas
+import numpy as np
 import pandas
+import rasterio
 import requests
 from pmtiles.tile import MagicNumberNotFound
 
@@ -76,6 +80,23 @@ class TestCommon(unittest.TestCase):
         self.assertEqual(os.environ["HTTPS_PROXY"], "http://192.168.0.1:8080")
         mock_get.assert_called_once_with("https://google.com")
 
+    @contextlib.contextmanager
+    def _stub_module(self, name, module):
+        """Replace one entry of sys.modules.
+
+        patch.dict("sys.modules") would also drop every module imported while it
+        is active, which breaks later tests that use those modules.
+        """
+        saved = sys.modules.get(name)
+        sys.modules[name] = module
+        try:
+            yield module
+        finally:
+            if saved is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved
+
     def _mock_localtileserver(self):
         """Return a fake ``localtileserver`` module with a mocked TileClient."""
         fake_client = MagicMock()
@@ -90,7 +111,7 @@ class TestCommon(unittest.TestCase):
     def test_get_local_tile_url_enables_jupyter_loopback(self):
         """enable_jupyter_loopback is invoked when the client supports it."""
         fake_module, fake_client = self._mock_localtileserver()
-        with patch.dict("sys.modules", {"localtileserver": fake_module}):
+        with self._stub_module("localtileserver", fake_module):
             url = get_local_tile_url("test.tif")
         fake_client.enable_jupyter_loopback.assert_called_once()
         self.assertEqual(url, "http://127.0.0.1:0/api/tiles/{z}/{x}/{y}.png")
@@ -102,7 +123,7 @@ class TestCommon(unittest.TestCase):
         fake_client.get_tile_url.return_value = "http://tile"
         fake_module = MagicMock()
         fake_module.TileClient.return_value = fake_client
-        with patch.dict("sys.modules", {"localtileserver": fake_module}):
+        with self._stub_module("localtileserver", fake_module):
             url = get_local_tile_url("test.tif")
         self.assertFalse(hasattr(fake_client, "enable_jupyter_loopback"))
         self.assertEqual(url, "http://tile")
@@ -111,7 +132,7 @@ class TestCommon(unittest.TestCase):
     def test_get_local_tile_url_prefix_precedence(self):
         """The prefix kwarg takes final precedence over the env var."""
         fake_module, _ = self._mock_localtileserver()
-        with patch.dict("sys.modules", {"localtileserver": fake_module}):
+        with self._stub_module("localtileserver", fake_module):
             get_local_tile_url("test.tif", prefix="proxy/{port}")
         self.assertEqual(os.environ["LOCALTILESERVER_CLIENT_PREFIX"], "proxy/{port}")
 
@@ -121,10 +142,199 @@ class TestCommon(unittest.TestCase):
     def test_get_local_tile_url_prefix_none_ignored(self):
         """prefix=None is ignored and does not overwrite an existing env var."""
         fake_module, _ = self._mock_localtileserver()
-        with patch.dict("sys.modules", {"localtileserver": fake_module}):
+        with self._stub_module("localtileserver", fake_module):
             get_local_tile_url("test.tif", prefix=None)
         self.assertEqual(os.environ["LOCALTILESERVER_CLIENT_PREFIX"], "keep/{port}")
 
+    def test_color_code_dataframe(self):
+        legend = {
+            "[0, 100]": "#111111",
+            "(100, 200]": "#222222",
+            "Nodata": "#000000",
+        }
+        df = pandas.DataFrame({"value": [0, 100, 150, None, 500]})
+        result = color_code_dataframe(df, legend)
+        self.assertEqual(
+            result["value"].tolist()[:4],
+            ["#111111", "#111111", "#222222", "#000000"],
+        )
+        self.assertTrue(pandas.isna(result["value"].iloc[4]))
+
+    def test_class_palette(self):
+        from leafmap.common import (
+            _class_match_expression,
+            _class_palette,
+            _class_rgba,
+            _class_styles,
+        )
+
+        df = pandas.DataFrame(
+            {
+                "category": [2, None, 1, 2],
+                "color": ["#0000ff", None, "#ff0000", "#0000ff"],
+            }
+        )
+        codes, palette = _class_palette(df)
+        self.assertEqual(codes.tolist(), [1, -1, 0, 1])
+        self.assertEqual(palette, ["#ff0000", "#0000ff"])
+
+        styles = _class_styles(codes, palette, {"weight": 1})
+        self.assertIs(styles[0], styles[3])
+        self.assertEqual(styles[2], {"weight": 1, "fillColor": "#ff0000"})
+        self.assertEqual(styles[1], {"weight": 1})
+        self.assertEqual(
+            _class_match_expression(palette),
+            ["match", ["get", "category"], 1, "#ff0000", 2, "#0000ff", "#000000"],
+        )
+        rgba = _class_rgba(codes, palette, alpha=0.5)
+        self.assertEqual(
+            rgba.tolist()[:3], [[0, 0, 255, 128], [0, 0, 0, 0], [255, 0, 0, 128]]
+        )
+
+    def test_raster_to_vector_block_size(self):
+        import tempfile
+
+        from rasterio.transform import from_origin
+
+        data = np.zeros((50, 60), dtype="uint8")
+        data[5:45, 10:50] = 1
+        data[20:30, 20:30] = 2
+        with tempfile.TemporaryDirectory() as tmp:
+            image = os.path.join(tmp, "classes.tif")
+            with rasterio.open(
+                image,
+                "w",
+                driver="GTiff",
+                width=60,
+                height=50,
+                count=1,
+                dtype="uint8",
+                crs="EPSG:32617",
+                transform=from_origin(500000, 4000000, 10, 10),
+            ) as dst:
+                dst.write(data, 1)
+
+            whole = os.path.join(tmp, "whole.gpkg")
+            tiled = os.path.join(tmp, "tiled.parquet")
+            raster_to_vector(image, whole)
+            raster_to_vector(image, tiled, block_size=16, num_workers=2)
+            expected = geopandas.read_file(whole)
+            result = geopandas.read_parquet(tiled)
+
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(
+            sorted(result.area.round(3).tolist()),
+            sorted(expected.area.round(3).tolist()),
+        )
+
+    def test_gdf_to_geojson(self):
+        import io
+
+        from shapely.geometry import Point
+
+        gdf = geopandas.GeoDataFrame(
+            {"name": ["a", "b"], "value": [1.5, None]},
+            geometry=[Point(1.123456, 2.987654), None],
+            crs="EPSG:4326",
+        )
+        geojson = gdf_to_geojson(gdf, precision=2, columns=["name"])
+        feature = geojson["features"][0]
+        self.assertEqual(feature["geometry"]["coordinates"], [1.12, 2.99])
+        self.assertEqual(feature["properties"], {"name": "a"})
+        self.assertIsNone(geojson["features"][1]["geometry"])
+
+        buffer = io.StringIO()
+        gdf_to_geojson(gdf, buffer)
+        self.assertEqual(buffer.getvalue(), gdf_to_geojson_str(gdf))
+        self.assertIsNone(gdf_to_geojson(gdf)["features"][1]["properties"]["value"])
+
+    def test_transform_coords_proj_string(self):
+        x, y = transform_coords(10, 50, "EPSG:4326", "+proj=utm +zone=32 +datum=WGS84")
+        self.assertAlmostEqual(x, 571666.4475, places=3)
+        self.assertAlmostEqual(y, 5539109.8153, places=3)
+        self.assertIs(
+            get_transformer("epsg:4326", 3857), get_transformer(4326, "EPSG:3857")
+        )
+
+    def test_get_geometry_coords(self):
+        from shapely.geometry import MultiLineString, Point
+
+        row = {"geometry": MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3)]])}
+        xs = get_geometry_coords(row, "geometry", "x", "MultiLineString")
+        self.assertEqual(xs[:2] + xs[3:], [0.0, 1.0, 2.0, 3.0])
+        self.assertTrue(np.isnan(xs[2]))
+
+        row = {"geometry": Point(180, 0)}
+        x = get_geometry_coords(row, "geometry", "x", "Point", mercator=True)
+        self.assertAlmostEqual(x, 20037508.342789244)
+
+    def test_sample_raster(self):
+        import tempfile
+
+        from rasterio.transform import from_origin
+
+        data = np.arange(3 * 40 * 30, dtype="uint16").reshape(3, 40, 30)
+        with tempfile.TemporaryDirectory() as tmp:
+            image = os.path.join(tmp, "bands.tif")
+            with rasterio.open(
+                image,
+                "w",
+                driver="GTiff",
+                width=30,
+                height=40,
+                count=3,
+                dtype="uint16",
+                crs="EPSG:32617",
+                transform=from_origin(500000, 4000000, 10, 10),
+                tiled=True,
+                blockxsize=16,
+                blockysize=16,
+                nodata=1,
+            ) as dst:
+                dst.write(data)
+
+            points = [
+                [500005, 3999995],
+                [500295, 3999605],
+                [499000, 3999000],
+                [500015, 3999995],
+            ]
+            result = sample_raster(
+                image, points, bands=[1, 3], points_crs="EPSG:32617", num_workers=2
+            )
+
+        self.assertEqual(
+            result["band_1"].tolist()[:2], [data[0, 0, 0], data[0, 39, 29]]
+        )
+        self.assertEqual(
+            result["band_3"].tolist()[:2], [data[2, 0, 0], data[2, 39, 29]]
+        )
+        self.assertTrue(np.isnan(result["band_1"].iloc[2]))
+        self.assertTrue(np.isnan(result["band_1"].iloc[3]))
+        self.assertEqual(result["band_3"].iloc[3], data[2, 0, 1])
+
+    def test_read_lidar_max_points_bbox(self):
+        import tempfile
+
+        import laspy
+
+        rng = np.random.default_rng(1)
+        header = laspy.LasHeader(point_format=3, version="1.2")
+        header.scales = [0.01, 0.01, 0.01]
+        las = laspy.LasData(header)
+        las.x = rng.uniform(0, 100, 200_000)
+        las.y = rng.uniform(0, 100, 200_000)
+        las.z = rng.uniform(0, 10, 200_000)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "points.las")
+            las.write(filename)
+            result = read_lidar(
+                filename, chunk_size=10_000, bbox=[0, 0, 10, 20], max_points=1000
+            )
+
+        self.assertTrue(900 <= len(result.points) <= 1100)
+        self.assertTrue((np.asarray(result.x) <= 10).all())
+
     # def test_pmtile_metadata_validates_pmtiles_suffix(self):
     #     with self.assertRaises(ValueError) as cm:
     #         pmtiles_metadata("/some/path/to/pmtiles.pmtiles")
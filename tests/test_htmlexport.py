@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `htmlexport` module."""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from leafmap import htmlexport
+
+GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"name": "a"},
+            "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+        }
+    ],
+}
+
+
+class TestHtmlexport(unittest.TestCase):
+    """Tests for `htmlexport` module."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outfile = os.path.join(self.tmpdir.name, "map.html")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_data_writer_dedup(self):
+        writer = htmlexport.DataWriter(self.outfile)
+        url = writer.add(GEOJSON)
+        self.assertTrue(url.startswith("map_data/"))
+        self.assertEqual(writer.add(json.loads(json.dumps(GEOJSON))), url)
+        self.assertEqual(len(writer.files), 1)
+        with gzip.open(os.path.join(self.tmpdir.name, url)) as f:
+            self.assertEqual(json.load(f), GEOJSON)
+
+        stale = os.path.join(writer.data_dir, "0123456789abcdef.geojson.gz")
+        open(stale, "wb").close()
+        writer.close()
+        self.assertFalse(os.path.exists(stale))
+
+    def test_externalize_maplibre_calls(self):
+        writer = htmlexport.DataWriter(self.outfile, data_format="geojson")
+        calls = [
+            ["addSource", ("a", {"type": "geojson", "data": GEOJSON})],
+            ["addSource", ("b", {"type": "geojson", "data": "https://x/y.geojson"})],
+            ["addLayer", ({"id": "a", "source": "a"}, None)],
+        ]
+        result = htmlexport.externalize_maplibre_calls(calls, writer)
+        self.assertEqual(result[0][1][1]["data"], writer.urls[0])
+        self.assertEqual(result[1:], calls[1:])
+        self.assertIs(calls[0][1][1]["data"], GEOJSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
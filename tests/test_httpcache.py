@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+"""Tests for `httpcache` module."""
+
+import http.server
+import os
+import tempfile
+import threading
+import unittest
+
+from leafmap import httpcache
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    counts = {"full": 0, "not_modified": 0, "missing": 0}
+
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self.counts["missing"] += 1
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.counts["not_modified"] += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.counts["full"] += 1
+        body = b'{"type": "FeatureCollection", "features": []}'
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpcache(unittest.TestCase):
+    """Tests for `httpcache` module."""
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp = tempfile.TemporaryDirectory()
+        _Handler.counts.update(full=0, not_modified=0, missing=0)
+
+    def tearDown(self):
+        httpcache.disable_http_cache()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_conditional_requests(self):
+        httpcache.enable_http_cache(self.tmp.name)
+        for _ in range(3):
+            data = httpcache.get(self.url + "/a.geojson").json()
+        self.assertEqual(data["type"], "FeatureCollection")
+        self.assertEqual(_Handler.counts, {"full": 1, "not_modified": 2, "missing": 0})
+
+        path = httpcache.cached_path(self.url + "/b.geojson")
+        self.assertTrue(path.endswith(".geojson") and os.path.exists(path))
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp.name, "blobs"))), 1)
+
+    def test_request_headers(self):
+        httpcache.enable_http_cache(self.tmp.name)
+        url = self.url + "/a.geojson"
+        httpcache.get(url, headers={"Accept": "application/json"})
+        httpcache.get(url, headers={"Accept": "application/geo+json"})
+        self.assertEqual(_Handler.counts["full"], 2)
+
+        headers = {"Authorization": "Bearer token"}
+        self.assertEqual(httpcache.cached_path(url, headers=headers), url)
+        httpcache.get(url, headers=headers)
+        self.assertEqual(_Handler.counts, {"full": 3, "not_modified": 0, "missing": 0})
+
+    def test_error_status(self):
+        httpcache.enable_http_cache(self.tmp.name)
+        url = self.url + "/missing.geojson"
+        for _ in range(2):
+            self.assertEqual(httpcache.get(url).status_code, 404)
+        self.assertEqual(httpcache.cached_path(url), url)
+        self.assertEqual(_Handler.counts["missing"], 3)
+        self.assertEqual(httpcache.get(self.url + "/a.geojson").status_code, 200)
+
+        shp = self.url + "/countries.shp"
+        self.assertEqual(httpcache.cached_path(shp), shp)
+
+    def test_disabled(self):
+        url = self.url + "/a.geojson"
+        self.assertEqual(httpcache.cached_path(url), url)
+        httpcache.get(url)
+        httpcache.get(url)
+        self.assertEqual(_Handler.counts["full"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
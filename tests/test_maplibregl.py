@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""Tests for `maplibregl` module."""
+
+import unittest
+
+from leafmap import maplibregl
+
+GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"value": 1},
+            "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+        }
+    ],
+}
+
+
+class TestMaplibregl(unittest.TestCase):
+    """Tests for `maplibregl` module."""
+
+    def setUp(self):
+        self.m = maplibregl.Map(style={"version": 8, "sources": {}, "layers": []})
+        self.m.add_geojson(
+            GEOJSON,
+            layer_type="circle",
+            name="points",
+            paint={"circle-color": "#ff0000"},
+        )
+
+    def calls(self, name):
+        return [call for call in self.m.calls if call[0] == name]
+
+    def test_unchanged_paint_is_not_sent(self):
+        count = len(self.m.calls)
+        self.m.set_paint_property("points", "circle-color", "#ff0000")
+        self.assertEqual(len(self.m.calls), count)
+        self.m.set_paint_property("points", "circle-color", "#0000ff")
+        self.assertEqual(self.m.calls[-1][1][2], "#0000ff")
+
+    def test_state_calls_are_coalesced(self):
+        for value in range(5):
+            self.m.set_filter("points", [">=", ["get", "value"], value])
+            self.m.set_paint_property("points", "circle-radius", value + 1)
+        self.assertEqual(len(self.calls("setFilter")), 1)
+        self.assertEqual(self.calls("setFilter")[0][1][1][2], 4)
+        radius = [
+            call
+            for call in self.calls("setPaintProperty")
+            if call[1][1] == "circle-radius"
+        ]
+        self.assertEqual(len(radius), 1)
+        self.assertEqual(len(self.calls("addSource")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
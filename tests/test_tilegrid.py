@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""Tests for `tilegrid` module."""
+
+import unittest
+
+import numpy as np
+from shapely.geometry import Point
+
+from leafmap import tilegrid
+
+
+class TestTilegrid(unittest.TestCase):
+    """Tests for `tilegrid` module."""
+
+    def test_quadkey_round_trip(self):
+        self.assertEqual(tilegrid.tile_to_quadkey(3, 5, 3), "213")
+        x = np.array([0, 1023, 517])
+        y = np.array([1023, 0, 300])
+        qx, qy, qz = tilegrid.quadkey_to_tile(tilegrid.tile_to_quadkey(x, y, 10))
+        np.testing.assert_array_equal(qx, x)
+        np.testing.assert_array_equal(qy, y)
+        self.assertTrue((qz == 10).all())
+
+    def test_bbox_to_tiles(self):
+        tiles = tilegrid.bbox_to_tiles([-180, 0, 0, 85], 1)
+        self.assertEqual(tiles.tolist(), [[0, 0, 1]])
+        tiles = tilegrid.bbox_to_tiles([170, -10, -170, 10], 2)
+        self.assertEqual(sorted(set(tiles[:, 0].tolist())), [0, 3])
+
+    def test_tile_cover(self):
+        polygon = Point(10, 45).buffer(2)
+        cover = tilegrid.tile_cover(polygon, 8)
+        candidates = tilegrid.bbox_to_tiles(polygon.bounds, 8)
+        self.assertLess(len(cover), len(candidates))
+        x, y = tilegrid.lnglat_to_tile(10, 45, 8)
+        self.assertIn([x, y, 8], cover.tolist())
+
+    def test_parent_children(self):
+        children = tilegrid.tile_children(1, 1, 1)
+        self.assertEqual(len(children), 4)
+        px, py, pz = tilegrid.tile_parent(children[:, 0], children[:, 1], 2)
+        self.assertTrue((px == 1).all() and (py == 1).all() and pz == 1)
+
+
+if __name__ == "__main__":
+    unittest.main()